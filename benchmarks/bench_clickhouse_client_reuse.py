@@ -0,0 +1,120 @@
+"""
+Benchmark: per-request ClickHouseClient vs one client shared for the app lifetime.
+
+Replays the Task 3 save path (three small inserts per request) against a local
+stub of the ClickHouse HTTP interface, so the numbers isolate client-side cost:
+building the connector and session, and opening TCP connections instead of
+reusing keep-alive ones. Over a real network the per-request variant also pays
+a TCP handshake (and TLS, if used) per connection, so the gap only grows.
+
+Usage:
+    uv run python -m benchmarks.bench_clickhouse_client_reuse [requests]
+"""
+
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+from aiohttp import web
+from loguru import logger
+
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from shared.infrastructure.database.clickhouse_client import ClickHouseClient
+
+DEFAULT_REQUESTS = 500
+ROWS_PER_INSERT = 10
+TABLES = ("repositories", "repositories_positions", "repositories_authors_commits")
+
+
+async def handle_query(request: web.Request) -> web.Response:
+    """Accept any query like ClickHouse does for a successful INSERT."""
+    await request.read()
+    return web.Response(text="")
+
+
+async def start_stub_server() -> tuple[web.AppRunner, int]:
+    """Start the stub server on a free local port."""
+    app = web.Application()
+    app.router.add_route("*", "/", handle_query)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, port
+
+
+def serve_in_thread() -> tuple[int, Callable[[], None]]:
+    """Run the stub server on its own event loop so it does not share the client's loop."""
+    loop = asyncio.new_event_loop()
+    runner, port = loop.run_until_complete(start_stub_server())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    def stop() -> None:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    return port, stop
+
+
+async def save(client: ClickHouseClient) -> None:
+    """Insert a handful of rows into each task 3 table."""
+    rows = [{"id": i, "name": f"row-{i}"} for i in range(ROWS_PER_INSERT)]
+    for table in TABLES:
+        await client.insert_batch(table, rows)
+
+
+async def measure(request: Callable[[], Awaitable[None]], count: int) -> list[float]:
+    """Run requests sequentially and return latencies in milliseconds."""
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await request()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def summarize(name: str, latencies: list[float]) -> None:
+    """Print latency percentiles."""
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{name:<22} {statistics.mean(ordered):>9.3f} {statistics.median(ordered):>9.3f} {p95:>9.3f}")
+
+
+async def run(count: int, port: int) -> None:
+    """Run both variants against the stub server."""
+    config = ClickHouseConfig(host="127.0.0.1", port=port, max_retries=0, _env_file=None)
+
+    async def per_request() -> None:
+        async with ClickHouseClient(config) as client:
+            await save(client)
+
+    per_request_latencies = await measure(per_request, count)
+    async with ClickHouseClient(config.model_copy(update={"warmup_connections": 1})) as shared_client:
+        shared_latencies = await measure(lambda: save(shared_client), count)
+
+    print(f"requests: {count}, {len(TABLES)} inserts of {ROWS_PER_INSERT} rows each")
+    print(f"{'client':<22} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    summarize("per-request (before)", per_request_latencies)
+    summarize("shared (after)", shared_latencies)
+
+
+def main() -> None:
+    """Run benchmark and print a summary table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS
+    # Per-request client logging would dominate the timings
+    logger.remove()
+    port, stop_server = serve_in_thread()
+    try:
+        asyncio.run(run(count, port))
+    finally:
+        stop_server()
+
+
+if __name__ == "__main__":
+    main()
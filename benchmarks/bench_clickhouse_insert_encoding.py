@@ -0,0 +1,103 @@
+"""
+Benchmark: VALUES vs RowBinary insert payload encoding for Task 3 tables.
+
+Measures the client-side CPU cost of turning row mappings into an INSERT body,
+which is what ``ClickHouseClient._insert_single_batch`` does per batch.
+
+Usage:
+    uv run python -m benchmarks.bench_clickhouse_insert_encoding [rows]
+"""
+
+import sys
+import time
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+from aiochclient.types import rows2ch
+
+from shared.infrastructure.database.rowbinary import RowBinaryEncoder
+from tasks.task_3.infrastructure.clickhouse.schemas import (
+    REPOSITORIES_AUTHORS_COMMITS_SCHEMA,
+    REPOSITORIES_POSITIONS_SCHEMA,
+    REPOSITORIES_SCHEMA,
+)
+
+try:
+    from aiochclient._types import rows2ch as rows2ch_cython
+except ImportError:
+    rows2ch_cython = rows2ch
+
+DEFAULT_ROWS = 100_000
+REPEATS = 5
+
+
+def make_rows(table: str, count: int) -> list[dict[str, Any]]:
+    """Generate synthetic rows shaped like the given table."""
+    now = datetime.now(tz=UTC).replace(microsecond=0)
+    today = now.date()
+    factories: dict[str, Callable[[int], dict[str, Any]]] = {
+        "repositories": lambda i: {
+            "name": f"repo-{i}",
+            "owner": f"owner-{i % 1000}",
+            "stars": i * 7,
+            "watchers": i * 3,
+            "forks": i,
+            "language": "Python",
+            "updated": now,
+        },
+        "repositories_positions": lambda i: {"date": today, "repo": f"owner-{i % 1000}/repo-{i}", "position": i},
+        "repositories_authors_commits": lambda i: {
+            "date": today,
+            "repo": f"owner-{i % 1000}/repo-{i // 10}",
+            "author": f"Author Name {i}",
+            "commits_num": i % 50,
+        },
+    }
+    return [factories[table](i) for i in range(count)]
+
+
+def encode_values(rows: list[dict[str, Any]], columns: list[str]) -> bytes:
+    """Current path: build tuples and let aiochclient render VALUES text."""
+    tuples = [tuple(row[column] for column in columns) for row in rows]
+    return rows2ch_cython(*tuples)
+
+
+def best_of(func: Callable[[], bytes]) -> tuple[float, int]:
+    """Return best wall time in seconds and payload size."""
+    timings = []
+    payload = b""
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        payload = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), len(payload)
+
+
+def main() -> None:
+    """Run benchmark and print a summary table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    schemas: Mapping[str, Mapping[str, str]] = {
+        "repositories": REPOSITORIES_SCHEMA,
+        "repositories_positions": REPOSITORIES_POSITIONS_SCHEMA,
+        "repositories_authors_commits": REPOSITORIES_AUTHORS_COMMITS_SCHEMA,
+    }
+
+    print(f"rows per table: {count}, best of {REPEATS}")
+    print(f"{'table':<30} {'VALUES ms':>10} {'RowBinary ms':>13} {'speedup':>8} {'VALUES MB':>10} {'RowBinary MB':>13}")
+    for table, schema in schemas.items():
+        rows = make_rows(table, count)
+        columns = list(schema)
+        encoder = RowBinaryEncoder(schema)
+
+        values_time, values_size = best_of(lambda rows=rows, columns=columns: encode_values(rows, columns))
+        binary_time, binary_size = best_of(lambda rows=rows, encoder=encoder: encoder.encode(rows))
+
+        print(
+            f"{table:<30} {values_time * 1000:>10.1f} {binary_time * 1000:>13.1f} "
+            f"{values_time / binary_time:>7.2f}x {values_size / 1e6:>10.2f} {binary_size / 1e6:>13.2f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
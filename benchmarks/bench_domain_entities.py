@@ -0,0 +1,86 @@
+"""
+Benchmark: pydantic DomainEntity vs compact_entity for Task 4 PhraseViews rows.
+
+Builds the entities a large campaign query returns and measures construction
+time and the memory the instances hold. Strict validation rebuilds every list
+of hourly tuples, while compact entities keep the decoded lists as they are.
+
+Usage:
+    uv run python -m benchmarks.bench_domain_entities [rows]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from shared.domain.entities.base import DomainEntity
+from tasks.task_4.domain.entities import PhraseViews
+
+DEFAULT_ROWS = 100_000
+HOURS = 12
+REPEATS = 5
+
+
+class ValidatedPhraseViews(DomainEntity):
+    """PhraseViews as a frozen, strict pydantic model."""
+
+    phrase: str
+    views_by_hour: list[tuple[int, int]]
+
+
+def make_rows(count: int) -> list[tuple[str, list[tuple[int, int]]]]:
+    """Generate decoded rows shaped like the phrase views query result."""
+    return [(f"phrase {index}", [(hour, index % 7 + 1) for hour in range(HOURS)]) for index in range(count)]
+
+
+def build(factory: Callable[..., Any], rows: list[tuple[str, list[tuple[int, int]]]]) -> list[Any]:
+    """Build one entity per row."""
+    return [factory(phrase=phrase, views_by_hour=views) for phrase, views in rows]
+
+
+def best_time(factory: Callable[..., Any], rows: list[tuple[str, list[tuple[int, int]]]]) -> float:
+    """Return best construction time in seconds."""
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        build(factory, rows)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def retained_bytes(factory: Callable[..., Any], rows: list[tuple[str, list[tuple[int, int]]]]) -> int:
+    """Return bytes still allocated while the built entities are alive."""
+    gc.collect()
+    tracemalloc.start()
+    entities = build(factory, rows)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return retained
+
+
+def main() -> None:
+    """Run benchmark and print a summary table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    rows = make_rows(count)
+    variants = {
+        "DomainEntity (pydantic)": ValidatedPhraseViews,
+        "compact_entity": PhraseViews,
+    }
+
+    print(f"rows: {count}, {HOURS} hours each, best of {REPEATS}")
+    print(f"{'variant':<26} {'build ms':>9} {'ns/row':>8} {'MB held':>8} {'bytes/row':>10}")
+    for name, factory in variants.items():
+        elapsed = best_time(factory, rows)
+        retained = retained_bytes(factory, rows)
+        print(
+            f"{name:<26} {elapsed * 1000:>9.1f} {elapsed / count * 1e9:>8.0f} "
+            f"{retained / 1e6:>8.2f} {retained / count:>10.0f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: serializing a 100-repository Task 2 response.
+
+Compares what FastAPI does with a returned ``RepositoriesResponse`` against
+returning ``FastJSONResponse`` directly:
+
+- ``dict revalidation``: the model is dumped to a dict, validated against the
+  response model again, converted to JSON-compatible data and rendered with
+  ``json.dumps`` (older FastAPI releases, or any route with a custom
+  response class)
+- ``response_model``: the installed FastAPI's path for the route, validating
+  the returned instance and dumping it to JSON bytes
+- ``FastJSONResponse``: pydantic-core writes the model straight to bytes
+
+Usage:
+    uv run python -m benchmarks.bench_json_responses [iterations]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from shared.presentation.fastapi.responses import FastJSONResponse, dumps_json
+from tasks.task_2.presentation.endpoints import router
+from tasks.task_2.presentation.models import (
+    RepositoriesResponse,
+    RepositoryAuthorCommitsNumResponse,
+    RepositoryResponse,
+)
+
+DEFAULT_ITERATIONS = 2000
+REPOSITORIES = 100
+AUTHORS_PER_REPOSITORY = 10
+REPEATS = 5
+
+
+def make_response() -> RepositoriesResponse:
+    """Build a response shaped like a full /api/repositories answer."""
+    return RepositoriesResponse(
+        total=REPOSITORIES,
+        repositories=[
+            RepositoryResponse(
+                name=f"repo-{index}",
+                owner=f"owner-{index}",
+                position=index + 1,
+                stars=100_000 - index,
+                watchers=5000 + index,
+                forks=2000 + index,
+                language="Python" if index % 3 else None,
+                authors_commits_num_today=[
+                    RepositoryAuthorCommitsNumResponse(author=f"Author Name {author}", commits_num=author + 1)
+                    for author in range(AUTHORS_PER_REPOSITORY)
+                ],
+            )
+            for index in range(REPOSITORIES)
+        ],
+    )
+
+
+def best_of(func: Callable[[], bytes | memoryview], iterations: int) -> tuple[float, int]:
+    """Return best mean time per call in microseconds and the body size."""
+    timings = []
+    body: bytes | memoryview = b""
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            body = func()
+        timings.append((time.perf_counter() - started) / iterations)
+    return min(timings) * 1e6, len(body)
+
+
+def main() -> None:
+    """Run benchmark and print a summary table."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS
+    response = make_response()
+    route = next(route for route in router.routes if isinstance(route, APIRoute) and route.path == "/api/repositories")
+    field = route.response_field
+    loop = asyncio.new_event_loop()
+
+    def dict_revalidation() -> bytes | memoryview:
+        content = loop.run_until_complete(serialize_response(field=field, response_content=response.model_dump()))
+        return JSONResponse(content).body
+
+    def response_model() -> bytes:
+        return loop.run_until_complete(serialize_response(field=field, response_content=response, dump_json=True))
+
+    def fast_response() -> bytes | memoryview:
+        return FastJSONResponse(response).body
+
+    data = response.model_dump()
+    variants = {
+        "dict revalidation": dict_revalidation,
+        "response_model": response_model,
+        "FastJSONResponse": fast_response,
+        "json.dumps(dict)": lambda: json.dumps(data).encode(),
+        f"dumps_json(dict) [{dumps_json.__module__.split('.')[0]}]": lambda: dumps_json(data),
+    }
+
+    print(f"{REPOSITORIES} repositories x {AUTHORS_PER_REPOSITORY} authors, {iterations} iterations, best of {REPEATS}")
+    print(f"{'variant':<36} {'us/response':>12} {'bytes':>8} {'vs revalidation':>16}")
+    baseline = 0.0
+    for name, func in variants.items():
+        elapsed, size = best_of(func, iterations)
+        baseline = baseline or elapsed
+        print(f"{name:<36} {elapsed:>12.1f} {size:>8} {baseline / elapsed:>15.2f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
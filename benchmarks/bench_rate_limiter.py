@@ -0,0 +1,111 @@
+"""
+Benchmark: GCRA TokenBucketRateLimiter vs the previous lock-holding bucket.
+
+Starts N acquirers at once and records when each one is let through:
+
+- achieved RPS over the backlog (after the initial burst) vs the configured rate
+- lateness of each backlog grant behind its ideal slot, counted from the
+  first backlog grant (mean, p99, max)
+- CPU time per acquire, i.e. scheduler overhead
+- failures (the previous bucket could raise RateLimitError after waiting)
+
+Usage:
+    uv run python -m benchmarks.bench_rate_limiter [acquirers]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from typing import Protocol
+
+from loguru import logger
+
+from shared.domain.entities.exceptions import RateLimitError
+from shared.infrastructure.rate_limiting.token_bucket import TokenBucketRateLimiter
+
+DEFAULT_ACQUIRERS = 10_000
+RATE = 2000
+BURST = 10
+
+
+class Limiter(Protocol):
+    """Anything with an awaitable acquire."""
+
+    async def acquire(self) -> None:
+        """Acquire one token."""
+
+
+class LockingTokenBucket:
+    """The previous implementation: sleeps while holding its lock."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Start with a full bucket."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take a token, sleeping under the lock until one is refilled."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            if self._tokens < 1:
+                msg = "Rate limit exceeded after waiting"
+                raise RateLimitError(msg)
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._last_update) * self._rate, self._burst)
+        self._last_update = now
+
+
+async def run(limiter: Limiter, acquirers: int, rate: float) -> None:
+    """Run all acquirers concurrently and print one result row."""
+    grants: list[float] = []
+    failures = 0
+
+    async def acquire() -> None:
+        nonlocal failures
+        try:
+            await limiter.acquire()
+        except RateLimitError:
+            failures += 1
+        else:
+            grants.append(time.monotonic())
+
+    cpu_started = time.process_time()
+    await asyncio.gather(*(acquire() for _ in range(acquirers)))
+    cpu_time = time.process_time() - cpu_started
+
+    backlog = grants[BURST - 1 :]
+    achieved = (len(backlog) - 1) / (backlog[-1] - backlog[0])
+    lateness = sorted((grant - backlog[0] - index / rate) * 1000 for index, grant in enumerate(backlog))
+    print(
+        f"{type(limiter).__name__:<24} {achieved:>9.1f} {achieved / rate * 100:>8.2f}% "
+        f"{statistics.fmean(lateness):>8.2f} {lateness[int(len(lateness) * 0.99)]:>8.2f} {lateness[-1]:>8.2f} "
+        f"{cpu_time / acquirers * 1e6:>8.1f} {failures:>8}",
+    )
+
+
+async def main() -> None:
+    """Run benchmark and print a summary table."""
+    acquirers = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACQUIRERS
+    logger.remove()
+
+    print(f"{acquirers} concurrent acquirers, rate {RATE}/s, burst {BURST}")
+    print(
+        f"{'limiter':<24} {'RPS':>9} {'accuracy':>9} {'late ms':>8} {'p99 ms':>8} {'max ms':>8} "
+        f"{'cpu us':>8} {'failures':>8}",
+    )
+    await run(LockingTokenBucket(RATE, BURST), acquirers, RATE)
+    await run(TokenBucketRateLimiter(RATE, BURST), acquirers, RATE)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,8 @@
 """Base domain entity."""
 
+from dataclasses import dataclass
+from typing import dataclass_transform
+
 from pydantic import BaseModel, ConfigDict
 
 
@@ -7,3 +10,22 @@ class DomainEntity(BaseModel):
     """Base class for all domain entities."""
 
     model_config = ConfigDict(frozen=True, strict=True)
+
+
+@dataclass_transform(frozen_default=True)
+def compact_entity[EntityT](cls: type[EntityT]) -> type[EntityT]:
+    """
+    Turn a class into a frozen, slotted dataclass entity.
+
+    Unlike DomainEntity, construction runs no validation and instances have no
+    ``__dict__``, so building many of them is cheap. Use it for entities built
+    from data that was already validated at a trust boundary, such as typed
+    database rows or a checked API payload.
+
+    Args:
+        cls: Class with annotated fields
+
+    Returns:
+        Dataclass with ``__slots__``
+    """
+    return dataclass(frozen=True, slots=True)(cls)
@@ -1,14 +1,31 @@
 """Rate limiter protocols."""
 
+from collections.abc import Mapping
 from typing import Protocol, runtime_checkable
 
 
 @runtime_checkable
 class RateLimiter(Protocol):
-    """Protocol for rate limiting."""
+    """
+    Protocol for rate limiting.
 
-    async def acquire(self) -> None:
-        """Acquire permission to proceed (blocking if rate limit exceeded)."""
+    Every operation takes a weight ``n`` so a costly call can consume
+    proportional budget in one step instead of n round trips.
+    """
 
-    async def release(self) -> None:
-        """Release the acquired permission."""
+    async def acquire(self, n: int = 1) -> None:
+        """Acquire n permits to proceed (blocking if rate limit exceeded)."""
+
+    async def try_acquire(self, n: int = 1) -> bool:  # pyright: ignore[reportReturnType]
+        """Acquire n permits only if available right now; return whether they were acquired."""
+
+    async def release(self, n: int = 1) -> None:
+        """Release n acquired permits."""
+
+
+@runtime_checkable
+class RateLimitFeedback(Protocol):
+    """Protocol for rate limiters that adapt to the responses of the limited API."""
+
+    async def observe(self, status: int, headers: Mapping[str, str], latency: float | None = None) -> None:
+        """Update the limiter from a response status, headers and seconds until it arrived, if timed."""
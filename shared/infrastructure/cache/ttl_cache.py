@@ -0,0 +1,125 @@
+"""LRU cache with expiry and single-flight loading for async results."""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+from loguru import logger
+
+type Loader[ValueT] = Callable[[], Awaitable[ValueT]]
+
+
+@dataclass
+class CacheStats:
+    """Lookup counters accumulated over the lifetime of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+
+class TTLCache[KeyT: Hashable, ValueT]:
+    """
+    Bounded in-process cache for results of async loaders.
+
+    Entries expire ``ttl`` seconds after they are stored or, with ``aligned``,
+    at the next wall-clock multiple of ``ttl`` so that every entry refreshes
+    right after a new batch of data is ingested. Concurrent misses for the
+    same key share one loader call. Failed loads are not cached. Cached values
+    are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int,
+        aligned: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            max_size: Max entries; the least recently used one is evicted beyond it
+            aligned: Expire entries on multiples of ttl instead of ttl after storing
+            clock: Time source in seconds
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._aligned = aligned
+        self._clock = clock
+        self._entries: OrderedDict[KeyT, tuple[float, ValueT]] = OrderedDict()
+        self._loading: dict[KeyT, asyncio.Task[ValueT]] = {}
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Accumulated lookup counters."""
+        return self._stats
+
+    async def get_or_load(self, key: KeyT, loader: Loader[ValueT]) -> ValueT:
+        """
+        Get a cached value or load and cache it.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value on a miss
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[1]
+
+        task = self._loading.get(key)
+        if task is None:
+            self._stats.misses += 1
+            task = asyncio.create_task(self._load(key, loader))
+            self._loading[key] = task
+        else:
+            self._stats.coalesced += 1
+        # Shielded so one cancelled caller does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: KeyT) -> None:
+        """Drop a cached entry."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    async def _load(self, key: KeyT, loader: Loader[ValueT]) -> ValueT:
+        """Run the loader and store its value."""
+        try:
+            value = await loader()
+        except Exception as exc:
+            logger.debug(f"Cache load for {key!r} failed: {exc}")
+            raise
+        else:
+            self._store(key, value)
+            return value
+        finally:
+            self._loading.pop(key, None)
+
+    def _store(self, key: KeyT, value: ValueT) -> None:
+        """Store a value and evict least recently used entries beyond max_size."""
+        now = self._clock()
+        expires_at = (math.floor(now / self._ttl) + 1) * self._ttl if self._aligned else now + self._ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
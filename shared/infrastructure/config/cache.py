@@ -0,0 +1,23 @@
+"""Query result cache configuration."""
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from shared.infrastructure.config.base import BaseConfig
+
+
+class CacheConfig(BaseConfig):
+    """In-process query result cache configuration."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="CACHE_",
+    )
+
+    enabled: bool = Field(default=True, description="Cache query results in process")
+    ttl: float = Field(default=600.0, gt=0, description="Seconds a result stays cached")
+    aligned: bool = Field(
+        default=True,
+        description="Expire entries on wall-clock multiples of ttl, matching the data ingestion cadence",
+    )
+    max_size: int = Field(default=10_000, ge=1, description="Max cached results before LRU eviction")
@@ -1,5 +1,7 @@
 """ClickHouse configuration."""
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
 
@@ -20,6 +22,79 @@ class ClickHouseConfig(BaseConfig):
     user: str = Field(default="default", description="Username")
     password: str = Field(default="", description="Password")
 
+    # Connection pool settings
+    pool_limit: int = Field(default=100, ge=0, description="Max open connections in total (0 = unlimited)")
+    pool_limit_per_host: int = Field(default=0, ge=0, description="Max open connections per host (0 = unlimited)")
+    keepalive_timeout: float = Field(default=15.0, gt=0, description="Seconds an idle connection stays pooled")
+    dns_cache_ttl: int = Field(default=10, ge=0, description="Seconds to cache DNS lookups (0 = no cache)")
+    connect_timeout: float = Field(default=10.0, gt=0, description="Seconds to acquire and open a connection")
+    read_timeout: float = Field(default=300.0, gt=0, description="Max seconds between reads of a response")
+    warmup_connections: int = Field(
+        default=0,
+        ge=0,
+        description="Keep-alive connections opened with a probe query when the client starts",
+    )
+
+    # Replica settings (used by ClickHouseClusterClient)
+    replicas: list[str] = Field(
+        default_factory=list,
+        description='Replica addresses as "host:port", JSON list in env (empty = host and port only)',
+    )
+    load_balancing: Literal["round_robin", "least_in_flight", "latency"] = Field(
+        default="round_robin",
+        description="How reads are spread over replicas",
+    )
+    replica_failure_threshold: int = Field(default=3, ge=1, description="Consecutive failures that eject a replica")
+    replica_probe_interval: float = Field(default=5.0, gt=0, description="Seconds between probes of ejected replicas")
+
     # Batch settings
     batch_size: int = Field(default=1000, ge=1, description="Batch size for bulk inserts")
     max_retries: int = Field(default=3, ge=0, description="Max retries for failed operations")
+    retry_backoff_base: float = Field(default=0.1, gt=0, description="First retry delay ceiling in seconds")
+    retry_backoff_max: float = Field(default=5.0, gt=0, description="Max delay between retries in seconds")
+    insert_deduplication: bool = Field(
+        default=True,
+        description="Tag retried batches with insert_deduplication_token (needs a Replicated table "
+        "or non_replicated_deduplication_window)",
+    )
+    insert_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Max batch INSERTs in flight at once (1 = sequential)",
+    )
+    insert_format: Literal["values", "rowbinary"] = Field(
+        default="values",
+        description="Wire format for inserts that provide a column schema",
+    )
+
+    # Server-side async inserts and client-side coalescing of small inserts
+    async_insert: bool = Field(default=False, description="Send inserts with async_insert=1")
+    wait_for_async_insert: bool = Field(
+        default=True,
+        description="Wait until async inserts are flushed to a part before acknowledging",
+    )
+    coalesce_window: float = Field(
+        default=0,
+        ge=0,
+        description="Seconds to merge concurrent insert_batch calls per table (0 = off)",
+    )
+    coalesce_max_rows: int = Field(default=100_000, ge=1, description="Coalesced rows that trigger an early flush")
+
+    # Write-behind buffer settings
+    buffer_max_rows: int = Field(default=10_000, ge=1, description="Buffered rows per table that trigger a flush")
+    buffer_max_age: float = Field(default=1.0, gt=0, description="Max seconds a row waits in the write buffer")
+    buffer_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1,
+        description="Approximate memory budget of the write buffer; writers wait when it is exceeded",
+    )
+
+    # HTTP compression settings
+    http_compression: Literal["none", "gzip", "zstd", "lz4"] = Field(
+        default="none",
+        description="Request body compression for inserts (zstd/lz4 need ecomet[compression])",
+    )
+    compress_response: bool = Field(
+        default=False,
+        description="Ask ClickHouse to compress SELECT responses (enable_http_compression)",
+    )
@@ -27,12 +27,30 @@ class GitHubConfig(BaseConfig):
         le=100,
         description="Maximum concurrent requests",
     )
+    adaptive_concurrency: bool = Field(
+        default=False,
+        description="Adjust concurrency (AIMD) from request latency, starting at max_concurrent_requests",
+    )
     requests_per_second: int = Field(
         default=5,
         ge=1,
         le=100,
         description="Requests per second limit",
     )
+    adaptive_rate_limit: bool = Field(
+        default=False,
+        description="Retune the request rate from GitHub rate limit headers",
+    )
+    max_requests_per_second: int = Field(
+        default=15,
+        ge=1,
+        le=100,
+        description="Upper bound for the adaptive request rate",
+    )
+    shared_rate_limit: bool = Field(
+        default=False,
+        description="Share requests_per_second across replicas through PostgreSQL (needs POSTGRES_DATABASE_URL)",
+    )
 
     # Repository settings
     top_repositories_limit: int = Field(
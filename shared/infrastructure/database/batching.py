@@ -0,0 +1,247 @@
+"""Batching helpers for streaming inserts."""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Coroutine, Iterable
+from types import TracebackType
+from typing import Any
+
+from shared.infrastructure.database.clickhouse_validation import ColumnSchema, Row
+
+type GroupKey = tuple[str, tuple[str, ...], tuple[tuple[str, str], ...] | None]
+
+
+async def _iterate_sync[RowT](rows: Iterable[RowT]) -> AsyncIterator[RowT]:
+    """Adapt a synchronous iterable to an async iterator."""
+    for row in rows:
+        yield row
+
+
+async def iterate_batches[RowT](
+    rows: AsyncIterable[RowT] | Iterable[RowT],
+    batch_size: int,
+) -> AsyncIterator[list[RowT]]:
+    """
+    Group rows into batches, pulling rows lazily from the source.
+
+    Only the batch currently being built is held in memory, so the source
+    may be arbitrarily large (a generator, a cursor, an async stream).
+
+    Args:
+        rows: Sync or async iterable of rows
+        batch_size: Maximum number of rows per batch
+
+    Yields:
+        Lists of at most batch_size rows
+
+    Raises:
+        ValueError: If batch_size is not positive
+    """
+    if batch_size < 1:
+        msg = f"batch_size must be positive, got {batch_size}"
+        raise ValueError(msg)
+
+    source = rows if isinstance(rows, AsyncIterable) else _iterate_sync(rows)
+    batch: list[RowT] = []
+    async for row in source:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+class InsertPipeline:
+    """
+    Bounded window of concurrently running batch inserts.
+
+    At most ``concurrency`` operations run at once; submitting into a full window
+    waits for the oldest one. Results are awaited in submission order, so the
+    error reported is the one of the earliest failed batch that was awaited.
+    On exit with an error all operations still in flight are cancelled.
+    """
+
+    def __init__(self, concurrency: int) -> None:
+        """
+        Initialize insert pipeline.
+
+        Args:
+            concurrency: Maximum number of operations in flight
+
+        Raises:
+            ValueError: If concurrency is not positive
+        """
+        if concurrency < 1:
+            msg = f"concurrency must be positive, got {concurrency}"
+            raise ValueError(msg)
+        self._concurrency = concurrency
+        self._in_flight: deque[asyncio.Task[None]] = deque()
+
+    async def __aenter__(self) -> "InsertPipeline":
+        """Enter pipeline context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Wait for in-flight operations, or cancel them if the block failed."""
+        if exc_val is None:
+            await self.drain()
+        else:
+            await self.cancel()
+
+    async def submit(self, operation: Coroutine[Any, Any, None]) -> None:
+        """
+        Schedule an operation, waiting for the oldest one if the window is full.
+
+        Args:
+            operation: Coroutine to run
+        """
+        if len(self._in_flight) >= self._concurrency:
+            try:
+                await self._in_flight.popleft()
+            except BaseException:
+                operation.close()
+                raise
+        self._in_flight.append(asyncio.create_task(operation))
+
+    async def drain(self) -> None:
+        """Wait for all in-flight operations in submission order, cancelling the rest on error."""
+        try:
+            while self._in_flight:
+                await self._in_flight.popleft()
+        except BaseException:
+            await self.cancel()
+            raise
+
+    async def cancel(self) -> None:
+        """Cancel all in-flight operations and wait until they finish."""
+        for task in self._in_flight:
+            task.cancel()
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+        self._in_flight.clear()
+
+
+def get_group_key(table: str, row: Row, schema: ColumnSchema | None) -> GroupKey:
+    """
+    Get the key under which rows can be merged into one insert.
+
+    Args:
+        table: Table name
+        row: Any row of the group
+        schema: Optional column-type schema
+
+    Returns:
+        Hashable key of table, column names and schema
+    """
+    return table, tuple(row), tuple(schema.items()) if schema else None
+
+
+class PendingRows:
+    """Rows waiting to be inserted into one table with one column set."""
+
+    def __init__(self, key: GroupKey, schema: ColumnSchema | None) -> None:
+        """
+        Initialize pending rows.
+
+        Args:
+            key: Group key from get_group_key
+            schema: Optional column-type schema
+        """
+        self.key = key
+        self.schema = schema
+        self.rows: list[Row] = []
+        self.timer: asyncio.Task[None] | None = None
+
+    @property
+    def table(self) -> str:
+        """Target table name."""
+        return self.key[0]
+
+
+class GroupFlusher[GroupT: PendingRows]:
+    """
+    Pending row groups, each flushed exactly once in a background task.
+
+    A group is flushed ``max_age`` seconds after it is added, or earlier when
+    start_flush is called for it; flushing detaches it, so rows for the same
+    key arriving later start a new group.
+    """
+
+    def __init__(self, run: Callable[[GroupT], Awaitable[None]], max_age: float) -> None:
+        """
+        Initialize group flusher.
+
+        Args:
+            run: Coroutine function inserting a detached group
+            max_age: Seconds a group may stay pending
+        """
+        self._run = run
+        self._max_age = max_age
+        self._groups: dict[GroupKey, GroupT] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> list[GroupT]:
+        """Groups not yet being flushed."""
+        return list(self._groups.values())
+
+    def get(self, key: GroupKey) -> GroupT | None:
+        """
+        Get the pending group for a key.
+
+        Args:
+            key: Group key
+
+        Returns:
+            Pending group, or None
+        """
+        return self._groups.get(key)
+
+    def add(self, group: GroupT) -> None:
+        """
+        Register a new pending group and start its age timer.
+
+        Args:
+            group: Empty group for a key without a pending group
+        """
+        self._groups[group.key] = group
+        group.timer = self._spawn(self._flush_later(group))
+
+    def start_flush(self, group: GroupT) -> None:
+        """
+        Detach a pending group and flush it in the background.
+
+        Args:
+            group: Group to flush; ignored if it is no longer pending
+        """
+        if self._groups.get(group.key) is not group:
+            return
+        self._groups.pop(group.key)
+        if group.timer:
+            group.timer.cancel()
+        self._spawn(self._run(group))
+
+    async def flush(self) -> None:
+        """Flush all pending groups now and wait for every running flush."""
+        for group in self.pending:
+            self.start_flush(group)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _spawn(self, coroutine: Awaitable[None]) -> asyncio.Task[None]:
+        """Run a coroutine as a tracked task."""
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _flush_later(self, group: GroupT) -> None:
+        """Flush a group once it reaches max_age."""
+        await asyncio.sleep(self._max_age)
+        group.timer = None
+        self.start_flush(group)
@@ -1,35 +1,64 @@
 """ClickHouse client implementation."""
 
-import re
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Mapping
+from dataclasses import dataclass, replace
+from functools import partial
 from types import TracebackType
 from typing import Any
 
 from aiochclient import ChClient
-from aiohttp import ClientSession, TCPConnector
+from aiohttp import ClientSession
 from loguru import logger
 
 from shared.domain.entities.exceptions import DatabaseError
 from shared.infrastructure.config.clickhouse import ClickHouseConfig
-
-VALID_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
-VALID_QUALIFIED_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)?$")
-
-
-def validate_sql_identifier(identifier: str, allow_qualified: bool = False) -> None:
+from shared.infrastructure.database.batching import iterate_batches
+from shared.infrastructure.database.clickhouse_inserter import ClickHouseBatchInserter
+from shared.infrastructure.database.clickhouse_pool import PoolStats, create_connector, create_timeout, get_pool_stats
+from shared.infrastructure.database.clickhouse_query import fetch_with_params, iterate_with_params
+from shared.infrastructure.database.clickhouse_transport import ClickHouseHTTPTransport
+from shared.infrastructure.database.clickhouse_validation import (
+    ColumnSchema,
+    Row,
+    require_initialized,
+    validate_sql_identifier,
+)
+from shared.infrastructure.database.insert_coalescer import InsertCoalescer
+from shared.infrastructure.database.retry import RetryPolicy, RetryStats
+
+
+@dataclass(frozen=True)
+class ClickHouseClientStats:
+    """Snapshot of client counters."""
+
+    retry: RetryStats
+    pool: PoolStats | None
+
+
+async def warm_up_connections(client: ChClient, connections: int) -> int:
     """
-    Validate SQL identifier (table or column name).
+    Open keep-alive connections ahead of the first real request.
+
+    Runs concurrent probe queries, so the connector opens one connection per
+    probe and keeps them pooled afterwards. Failures are logged, not raised.
 
     Args:
-        identifier: SQL identifier to validate
-        allow_qualified: Allow qualified names like 'database.table'
+        client: aiochclient client
+        connections: Number of connections to open
 
-    Raises:
-        DatabaseError: If identifier is invalid
+    Returns:
+        Number of successful probes
     """
-    pattern = VALID_QUALIFIED_NAME_PATTERN if allow_qualified else VALID_IDENTIFIER_PATTERN
-    if not pattern.match(identifier):
-        msg = f"Invalid SQL identifier: {identifier}"
-        raise DatabaseError(msg)
+    if not connections:
+        return 0
+    results = await asyncio.gather(*(client.is_alive() for _ in range(connections)), return_exceptions=True)
+    alive = sum(result is True for result in results)
+    if alive < connections:
+        logger.warning(f"ClickHouse warm-up: {alive}/{connections} probes succeeded")
+    else:
+        logger.info(f"Warmed up {connections} ClickHouse connections")
+    return alive
 
 
 class ClickHouseClient:
@@ -45,6 +74,26 @@ class ClickHouseClient:
         self._config = config
         self._session: ClientSession | None = None
         self._client: ChClient | None = None
+        self._transport: ClickHouseHTTPTransport | None = None
+        self._coalescer: InsertCoalescer | None = None
+        self._retry_policy = RetryPolicy(
+            max_retries=config.max_retries,
+            backoff_base=config.retry_backoff_base,
+            backoff_max=config.retry_backoff_max,
+        )
+
+    def get_stats(self) -> ClickHouseClientStats:
+        """
+        Get retry counters and current connection pool usage.
+
+        Returns:
+            Stats snapshot; pool is None while the client is not open
+        """
+        connector = self._session.connector if self._session and not self._session.closed else None
+        return ClickHouseClientStats(
+            retry=replace(self._retry_policy.stats),
+            pool=get_pool_stats(connector) if connector else None,
+        )
 
     async def __aenter__(self) -> "ClickHouseClient":
         """
@@ -55,8 +104,10 @@ class ClickHouseClient:
         """
         logger.info("Initializing ClickHouse client")
         try:
-            connector = TCPConnector(limit=100)
-            self._session = ClientSession(connector=connector)
+            self._session = ClientSession(
+                connector=create_connector(self._config),
+                timeout=create_timeout(self._config),
+            )
 
             url = f"http://{self._config.host}:{self._config.port}"
             self._client = ChClient(
@@ -65,10 +116,21 @@ class ClickHouseClient:
                 user=self._config.user,
                 password=self._config.password,
                 database=self._config.database,
+                compress_response=self._config.compress_response,
             )
+            self._transport = ClickHouseHTTPTransport(self._session, self._config)
+            if self._config.coalesce_window > 0:
+                self._coalescer = InsertCoalescer(
+                    self.insert_stream,
+                    window=self._config.coalesce_window,
+                    max_rows=self._config.coalesce_max_rows,
+                )
+            await warm_up_connections(self._client, self._config.warmup_connections)
 
             logger.info("ClickHouse client initialized successfully")
         except Exception as exc:
+            # __aexit__ is not called after a failed __aenter__, so release what was opened so far
+            await self.__aexit__(type(exc), exc, exc.__traceback__)
             error_msg = f"Failed to initialize ClickHouse client: {exc}"
             logger.error(error_msg)
             raise DatabaseError(error_msg) from exc
@@ -82,31 +144,34 @@ class ClickHouseClient:
         exc_tb: TracebackType | None,
     ) -> None:
         """
-        Exit context manager - close client connection.
+        Exit context manager - flush coalesced inserts and close client connection.
 
         Args:
             exc_type: Exception type
             exc_val: Exception value
             exc_tb: Exception traceback
         """
-        await self._cleanup()
-        if exc_val:
-            logger.error(f"ClickHouse client error: {exc_val}")
-
-    async def _cleanup(self) -> None:
-        """Clean up resources."""
         logger.info("Closing ClickHouse client")
+        if self._coalescer:
+            await self._coalescer.close()
         if self._session and not self._session.closed:
             await self._session.close()
         logger.info("ClickHouse client closed")
+        if exc_val:
+            logger.error(f"ClickHouse client error: {exc_val}")
 
-    async def execute(self, query: str, *args: Any) -> str:  # noqa: ANN401
+    async def execute(self, query: str, *args: Any, retry: bool = False) -> str:  # noqa: ANN401
         """
         Execute a query without returning results.
 
+        Statements such as INSERT ... SELECT or ALTER may have taken effect
+        before a failure is reported, so they are not repeated unless the
+        caller marks the query as idempotent with ``retry``.
+
         Args:
             query: SQL query
             *args: Query parameters
+            retry: Retry transient failures up to ``max_retries`` times
 
         Returns:
             Query result status
@@ -114,13 +179,12 @@ class ClickHouseClient:
         Raises:
             DatabaseError: If client is not initialized or query fails
         """
-        if not self._client:
-            msg = "ClickHouse client is not initialized"
-            raise DatabaseError(msg)
+        client = require_initialized(self._client, "client")
 
         try:
             logger.debug(f"Executing query: {query[:100]}...")
-            result = await self._client.execute(query, *args)
+            operation = partial(client.execute, query, *args)
+            result = await (self._retry_policy.call(operation, "Query") if retry else operation())
         except Exception as exc:
             error_msg = f"Failed to execute query: {exc}"
             logger.error(error_msg)
@@ -130,13 +194,22 @@ class ClickHouseClient:
             # aiochclient returns empty string or None for successful INSERT/DDL queries
             return "" if result is None else result
 
-    async def fetch(self, query: str, *args: Any) -> list[Any]:  # noqa: ANN401
+    async def fetch(
+        self,
+        query: str,
+        *args: Any,  # noqa: ANN401
+        params: Mapping[str, Any] | None = None,
+    ) -> list[Any]:
         """
-        Fetch query results.
+        Fetch query results, retrying transient failures.
+
+        With ``params`` the query is sent as is and ClickHouse substitutes its
+        ``{name:Type}`` placeholders, so the query text can stay constant.
 
         Args:
             query: SQL query
             *args: Query parameters
+            params: Server-side query parameters by placeholder name
 
         Returns:
             Query results
@@ -144,13 +217,16 @@ class ClickHouseClient:
         Raises:
             DatabaseError: If client is not initialized or query fails
         """
-        if not self._client:
-            msg = "ClickHouse client is not initialized"
-            raise DatabaseError(msg)
+        client = require_initialized(self._client, "client")
+        if params is None:
+            operation = partial(client.fetch, query, *args)
+        else:
+            transport = require_initialized(self._transport, "transport")
+            operation = partial(fetch_with_params, transport, query, params)
 
         try:
             logger.debug(f"Fetching query: {query[:100]}...")
-            result = await self._client.fetch(query, *args)
+            result = await self._retry_policy.call(operation, "Fetch")
             logger.debug(f"Fetched {len(result)} rows")
         except Exception as exc:
             error_msg = f"Failed to fetch query results: {exc}"
@@ -162,54 +238,80 @@ class ClickHouseClient:
                 raise DatabaseError(msg)
             return result
 
-    async def _insert_single_batch(
+    async def iterate(
         self,
-        table: str,
-        batch: list[dict[str, Any]],
-        columns: list[str],
-    ) -> None:
-        """Insert a single batch of rows."""
-        if not self._client:
-            msg = "ClickHouse client is not initialized"
-            raise DatabaseError(msg)
+        query: str,
+        *args: Any,  # noqa: ANN401
+        params: Mapping[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream query results row by row.
 
-        rows = [tuple(row_dict[col] for col in columns) for row_dict in batch]
-        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES"
-        await self._client.execute(query, *rows)
+        Rows are decoded as the HTTP response arrives, so memory stays bounded
+        regardless of the result size.
 
-    async def _process_batches(
-        self,
-        table: str,
-        data: list[dict[str, Any]],
-        columns: list[str],
-        batch_size: int,
-    ) -> None:
-        """Process and insert data in batches."""
-        total_rows = len(data)
-        for batch_start in range(0, total_rows, batch_size):
-            batch_end = min(batch_start + batch_size, total_rows)
-            batch = data[batch_start:batch_end]
-
-            if batch:
-                await self._insert_single_batch(table, batch, columns)
-                batch_number = batch_start // batch_size + 1
-                logger.debug(
-                    f"Inserted batch {batch_number}: {len(batch)} rows ({batch_start + 1}-{batch_end})",
-                )
+        Args:
+            query: SQL query
+            *args: Query parameters
+            params: Server-side query parameters by placeholder name
+
+        Yields:
+            Result records
+
+        Raises:
+            DatabaseError: If client is not initialized or query fails
+        """
+        client = require_initialized(self._client, "client")
+        if params is None:
+            rows = client.iterate(query, *args)
+        else:
+            rows = iterate_with_params(require_initialized(self._transport, "transport"), query, params)
+
+        logger.debug(f"Streaming query: {query[:100]}...")
+        try:
+            async for row in rows:
+                yield row
+        except Exception as exc:
+            error_msg = f"Failed to stream query results: {exc}"
+            logger.error(error_msg)
+            raise DatabaseError(error_msg) from exc
+
+    def fetch_chunks(self, query: str, chunk_size: int, *args: Any) -> AsyncIterator[list[Any]]:  # noqa: ANN401
+        """
+        Stream query results in lists of up to chunk_size rows.
+
+        Args:
+            query: SQL query
+            chunk_size: Maximum rows per chunk
+            *args: Query parameters
+
+        Returns:
+            Async iterator over row chunks
+        """
+        return iterate_batches(self.iterate(query, *args), chunk_size)
 
     async def insert_batch(
         self,
         table: str,
         data: list[dict[str, Any]],
         batch_size: int | None = None,
+        schema: ColumnSchema | None = None,
     ) -> None:
         """
         Insert data in batches using aiochclient's native batch insert.
 
+        When ``coalesce_window`` is set, rows are merged with concurrent calls for
+        the same table and columns and sent in one insert using the configured
+        batch size; the call returns once that insert has finished. An explicit
+        ``batch_size`` bypasses coalescing so the rows are sent in batches of
+        that size.
+
         Args:
             table: Table name
             data: List of dictionaries representing rows
             batch_size: Batch size (uses config default if not provided)
+            schema: Column name to ClickHouse type mapping; enables RowBinary
+                encoding when ``insert_format`` is "rowbinary"
 
         Raises:
             DatabaseError: If client is not initialized or insert fails
@@ -218,9 +320,7 @@ class ClickHouseClient:
             logger.warning("No data to insert")
             return
 
-        if not self._client:
-            msg = "ClickHouse client is not initialized"
-            raise DatabaseError(msg)
+        require_initialized(self._client, "client")
 
         validate_sql_identifier(table, allow_qualified=True)
 
@@ -229,12 +329,64 @@ class ClickHouseClient:
         logger.info(f"Inserting {total_rows} rows into {table} (batch_size={effective_batch_size})")
 
         try:
-            columns = list(data[0].keys())
-            for column_name in columns:
-                validate_sql_identifier(column_name)
-            await self._process_batches(table, data, columns, effective_batch_size)
+            if self._coalescer and batch_size is None:
+                await self._coalescer.submit(table, data, schema)
+            else:
+                inserter = ClickHouseBatchInserter(self._client, self._transport, self._config, self._retry_policy)
+                await inserter.insert(table, iterate_batches(data, effective_batch_size), schema)
             logger.info(f"Successfully inserted {total_rows} rows into {table}")
         except Exception as exc:
             error_msg = f"Failed to insert batch into {table}: {exc}"
             logger.error(error_msg)
             raise DatabaseError(error_msg) from exc
+
+    async def insert_stream(
+        self,
+        table: str,
+        rows: AsyncIterable[Row] | Iterable[Row],
+        batch_size: int | None = None,
+        schema: ColumnSchema | None = None,
+    ) -> int:
+        """
+        Insert rows pulled lazily from a sync or async iterable.
+
+        A batch is flushed every batch_size rows, so at most one batch is held
+        in memory regardless of the total number of rows.
+
+        Args:
+            table: Table name
+            rows: Iterable or async iterable of row mappings with identical keys
+            batch_size: Batch size (uses config default if not provided)
+            schema: Column name to ClickHouse type mapping; enables RowBinary
+                encoding when ``insert_format`` is "rowbinary"
+
+        Returns:
+            Number of inserted rows
+
+        Raises:
+            DatabaseError: If client is not initialized or insert fails
+        """
+        require_initialized(self._client, "client")
+
+        validate_sql_identifier(table, allow_qualified=True)
+
+        effective_batch_size = batch_size or self._config.batch_size
+        logger.info(f"Streaming rows into {table} (batch_size={effective_batch_size})")
+
+        inserter = ClickHouseBatchInserter(self._client, self._transport, self._config, self._retry_policy)
+        try:
+            total_rows = await inserter.insert(
+                table,
+                iterate_batches(rows, effective_batch_size),
+                schema,
+            )
+        except Exception as exc:
+            error_msg = f"Failed to insert stream into {table}: {exc}"
+            logger.error(error_msg)
+            raise DatabaseError(error_msg) from exc
+
+        if total_rows:
+            logger.info(f"Successfully inserted {total_rows} rows into {table}")
+        else:
+            logger.warning("No data to insert")
+        return total_rows
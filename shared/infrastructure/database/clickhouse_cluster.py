@@ -0,0 +1,244 @@
+"""Load-balanced ClickHouse client over several replicas."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Mapping
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from loguru import logger
+
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from shared.infrastructure.database.batching import iterate_batches
+from shared.infrastructure.database.clickhouse_client import ClickHouseClient
+from shared.infrastructure.database.clickhouse_replicas import Replica, ReplicaSet, ReplicaStats
+from shared.infrastructure.database.clickhouse_validation import ColumnSchema, Row
+
+
+@dataclass(frozen=True)
+class ClickHouseClusterStats:
+    """Snapshot of every replica by address."""
+
+    replicas: dict[str, ReplicaStats]
+
+
+def parse_replica_address(address: str, default_port: int) -> tuple[str, int]:
+    """
+    Split a replica address into host and port.
+
+    Args:
+        address: "host" or "host:port"
+        default_port: Port used when the address has none
+
+    Returns:
+        Host and port
+    """
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        return address, default_port
+    return host, int(port)
+
+
+class ClickHouseClusterClient:
+    """
+    ClickHouse client spreading requests over ``config.replicas``.
+
+    Reads (fetch, iterate) are balanced with ``load_balancing`` and fail over to
+    the next replica on connection or transient server errors. Inserts and
+    execute go to the first healthy replica. Each replica has its own
+    ClickHouseClient with the shared settings, so per-replica retries and pool
+    limits still apply. Ejected replicas are re-probed every
+    ``replica_probe_interval`` seconds.
+    """
+
+    def __init__(self, config: ClickHouseConfig) -> None:
+        """
+        Initialize cluster client.
+
+        Args:
+            config: ClickHouse configuration; falls back to host and port when
+                no replicas are listed
+        """
+        self._config = config
+        replicas = []
+        for address in config.replicas or [f"{config.host}:{config.port}"]:
+            host, port = parse_replica_address(address, config.port)
+            replica_config = config.model_copy(update={"host": host, "port": port, "replicas": []})
+            replicas.append(Replica(f"{host}:{port}", ClickHouseClient(replica_config)))
+        self._replicas = ReplicaSet(
+            replicas,
+            strategy=config.load_balancing,
+            failure_threshold=config.replica_failure_threshold,
+        )
+        self._stack = contextlib.AsyncExitStack()
+        self._probe_task: asyncio.Task[None] | None = None
+
+    def get_stats(self) -> ClickHouseClusterStats:
+        """
+        Get health, load and client counters of every replica.
+
+        Returns:
+            Stats snapshot
+        """
+        return ClickHouseClusterStats(
+            replicas={replica.name: replica.get_stats() for replica in self._replicas.replicas},
+        )
+
+    async def __aenter__(self) -> "ClickHouseClusterClient":
+        """
+        Open a client per replica and start probing ejected replicas.
+
+        Returns:
+            Self instance
+        """
+        logger.info(f"Initializing ClickHouse cluster client ({len(self._replicas.replicas)} replicas)")
+        async with contextlib.AsyncExitStack() as stack:
+            for replica in self._replicas.replicas:
+                await stack.enter_async_context(replica.client)
+            # Replicas opened so far are closed by the stack if a later one fails
+            self._stack = stack.pop_all()
+        self._probe_task = asyncio.create_task(self._replicas.watch(self._config.replica_probe_interval))
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """
+        Stop probing and close every replica client.
+
+        Args:
+            exc_type: Exception type
+            exc_val: Exception value
+            exc_tb: Exception traceback
+        """
+        if self._probe_task:
+            self._probe_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._probe_task
+        await self._stack.aclose()
+
+    async def execute(self, query: str, *args: Any, retry: bool = False) -> str:  # noqa: ANN401
+        """
+        Execute a query on the write replica, failing over to the others.
+
+        Args:
+            query: SQL query
+            *args: Query parameters
+            retry: Retry transient failures on each replica, for idempotent queries
+
+        Returns:
+            Query result status
+        """
+        return await self._replicas.call(
+            self._replicas.for_writes(),
+            lambda client: client.execute(query, *args, retry=retry),
+        )
+
+    async def fetch(
+        self,
+        query: str,
+        *args: Any,  # noqa: ANN401
+        params: Mapping[str, Any] | None = None,
+    ) -> list[Any]:
+        """
+        Fetch query results from a balanced replica, failing over to the others.
+
+        Args:
+            query: SQL query
+            *args: Query parameters
+            params: Server-side query parameters by placeholder name
+
+        Returns:
+            Query results
+        """
+        return await self._replicas.call(
+            self._replicas.for_reads(),
+            lambda client: client.fetch(query, *args, params=params),
+        )
+
+    def iterate(
+        self,
+        query: str,
+        *args: Any,  # noqa: ANN401
+        params: Mapping[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream query results from a balanced replica.
+
+        A stream is not failed over once started.
+
+        Args:
+            query: SQL query
+            *args: Query parameters
+            params: Server-side query parameters by placeholder name
+
+        Returns:
+            Async iterator over result records
+        """
+        return self._replicas.stream(
+            self._replicas.for_reads()[0],
+            lambda client: client.iterate(query, *args, params=params),
+        )
+
+    def fetch_chunks(self, query: str, chunk_size: int, *args: Any) -> AsyncIterator[list[Any]]:  # noqa: ANN401
+        """
+        Stream query results in lists of up to chunk_size rows.
+
+        Args:
+            query: SQL query
+            chunk_size: Maximum rows per chunk
+            *args: Query parameters
+
+        Returns:
+            Async iterator over row chunks
+        """
+        return iterate_batches(self.iterate(query, *args), chunk_size)
+
+    async def insert_batch(
+        self,
+        table: str,
+        data: list[dict[str, Any]],
+        batch_size: int | None = None,
+        schema: ColumnSchema | None = None,
+    ) -> None:
+        """
+        Insert data in batches on the write replica.
+
+        Args:
+            table: Table name
+            data: List of dictionaries representing rows
+            batch_size: Batch size (uses config default if not provided)
+            schema: Column name to ClickHouse type mapping
+        """
+        await self._replicas.run(
+            self._replicas.for_writes()[0],
+            lambda client: client.insert_batch(table, data, batch_size, schema),
+        )
+
+    async def insert_stream(
+        self,
+        table: str,
+        rows: AsyncIterable[Row] | Iterable[Row],
+        batch_size: int | None = None,
+        schema: ColumnSchema | None = None,
+    ) -> int:
+        """
+        Insert rows pulled lazily from an iterable on the write replica.
+
+        Args:
+            table: Table name
+            rows: Iterable or async iterable of row mappings with identical keys
+            batch_size: Batch size (uses config default if not provided)
+            schema: Column name to ClickHouse type mapping
+
+        Returns:
+            Number of inserted rows
+        """
+        return await self._replicas.run(
+            self._replicas.for_writes()[0],
+            lambda client: client.insert_stream(table, rows, batch_size, schema),
+        )
@@ -0,0 +1,177 @@
+"""Batch insert execution for ClickHouseClient."""
+
+import uuid
+from collections.abc import AsyncIterator, Mapping
+from functools import partial
+
+from aiochclient import ChClient
+from loguru import logger
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from shared.infrastructure.database.batching import InsertPipeline
+from shared.infrastructure.database.clickhouse_transport import ClickHouseHTTPTransport
+from shared.infrastructure.database.clickhouse_validation import (
+    ColumnSchema,
+    Row,
+    get_validated_columns,
+    require_initialized,
+)
+from shared.infrastructure.database.retry import RetryPolicy
+from shared.infrastructure.database.rowbinary import RowBinaryEncoder
+
+# Optional cython extension, same fallback as aiochclient itself
+try:
+    from aiochclient._types import rows2ch
+except ImportError:  # pragma: no cover
+    from aiochclient.types import rows2ch
+
+
+def build_insert_target(table: str, columns: list[str], settings: Mapping[str, int | str]) -> str:
+    """
+    Build the ``INSERT INTO table (columns)`` prefix of an insert query.
+
+    Args:
+        table: Validated table name
+        columns: Validated column names
+        settings: Query-level settings rendered into a ``SETTINGS`` clause;
+            string values must not contain quotes
+
+    Returns:
+        Query prefix, followed by ``VALUES`` or ``FORMAT ...`` by the caller
+    """
+    target = f"INSERT INTO {table} ({', '.join(columns)})"
+    if settings:
+        rendered = ", ".join(
+            f"{name}='{setting}'" if isinstance(setting, str) else f"{name}={setting}"
+            for name, setting in settings.items()
+        )
+        target = f"{target} SETTINGS {rendered}"
+    return target
+
+
+def build_insert_payload(
+    target: str,
+    batch: list[Row],
+    columns: list[str],
+    encoder: RowBinaryEncoder | None,
+) -> tuple[str, bytes]:
+    """
+    Build query and body for an INSERT sent through the raw HTTP transport.
+
+    Args:
+        target: Query prefix from build_insert_target
+        batch: Rows to insert
+        columns: Column names in insert order
+        encoder: RowBinary encoder, or None for VALUES text
+
+    Returns:
+        Query text and request body
+    """
+    if encoder:
+        return f"{target} FORMAT RowBinary", encoder.encode(batch)
+    rows = [tuple(row_dict[col] for col in columns) for row_dict in batch]
+    return f"{target} VALUES", rows2ch(*rows)
+
+
+class ClickHouseBatchInserter:
+    """Send batches of rows to one table through aiochclient or the raw HTTP transport."""
+
+    def __init__(
+        self,
+        client: ChClient | None,
+        transport: ClickHouseHTTPTransport | None,
+        config: ClickHouseConfig,
+        retry_policy: RetryPolicy,
+    ) -> None:
+        """
+        Initialize batch inserter.
+
+        Args:
+            client: aiochclient client used for plain VALUES inserts
+            transport: Raw HTTP transport used for RowBinary and compressed inserts
+            config: ClickHouse configuration
+            retry_policy: Policy for retrying batches on transient failures
+        """
+        self._client = client
+        self._transport = transport
+        self._config = config
+        self._retry_policy = retry_policy
+        # Batch tokens are unique per insert call, so a retried batch is deduplicated
+        # while re-running the same job inserts its rows again
+        self._deduplicate = config.insert_deduplication and retry_policy.max_retries > 0
+        self._insert_id = uuid.uuid4().hex
+        self._settings: dict[str, int | str] = {}
+        if config.async_insert:
+            self._settings = {
+                "async_insert": 1,
+                "wait_for_async_insert": int(config.wait_for_async_insert),
+            }
+
+    async def _insert_single_batch(
+        self,
+        target: str,
+        batch: list[Row],
+        columns: list[str],
+        label: str,
+        encoder: RowBinaryEncoder | None,
+    ) -> None:
+        """
+        Insert a single batch of rows, retrying transient failures.
+
+        RowBinary and compressed bodies go through the raw HTTP transport,
+        plain VALUES inserts through aiochclient. The payload is encoded once
+        and resent as is on every attempt.
+        """
+        if encoder or self._config.http_compression != "none":
+            transport = require_initialized(self._transport, "transport")
+            operation = partial(transport.post, *build_insert_payload(target, batch, columns, encoder))
+        else:
+            client = require_initialized(self._client, "client")
+            rows = [tuple(row_dict[col] for col in columns) for row_dict in batch]
+            operation = partial(client.execute, f"{target} VALUES", *rows)
+
+        try:
+            await self._retry_policy.call(operation, f"Insert batch {label}")
+        except Exception as exc:
+            error_msg = f"batch {label} failed: {exc}"
+            raise DatabaseError(error_msg) from exc
+        logger.debug(f"Inserted batch {label}")
+
+    async def insert(
+        self,
+        table: str,
+        batches: AsyncIterator[list[Row]],
+        schema: ColumnSchema | None,
+    ) -> int:
+        """
+        Insert batches as they are pulled from the iterator.
+
+        Columns are taken from the schema or the first row and validated once.
+        Up to ``insert_concurrency`` batches are sent concurrently over the shared session.
+
+        Args:
+            table: Validated table name
+            batches: Async iterator over row batches
+            schema: Optional column-type schema
+
+        Returns:
+            Total number of inserted rows
+        """
+        use_rowbinary = schema is not None and self._config.insert_format == "rowbinary"
+        encoder = RowBinaryEncoder(schema) if schema and use_rowbinary else None
+        columns = get_validated_columns(schema) if schema else []
+        total_rows = 0
+        batch_number = 0
+        async with InsertPipeline(self._config.insert_concurrency) as pipeline:
+            async for batch in batches:
+                columns = columns or get_validated_columns(batch[0])
+                batch_number += 1
+                label = f"{batch_number}: {len(batch)} rows ({total_rows + 1}-{total_rows + len(batch)})"
+                settings = dict(self._settings)
+                if self._deduplicate:
+                    settings["insert_deduplication_token"] = f"{self._insert_id}-{batch_number}"
+                target = build_insert_target(table, columns, settings)
+                await pipeline.submit(self._insert_single_batch(target, batch, columns, label, encoder))
+                total_rows += len(batch)
+        return total_rows
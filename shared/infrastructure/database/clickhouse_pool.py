@@ -0,0 +1,79 @@
+"""HTTP connection pool setup and introspection for ClickHouse."""
+
+from dataclasses import dataclass
+
+from aiohttp import BaseConnector, ClientTimeout, TCPConnector
+
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of an HTTP connection pool."""
+
+    limit: int
+    limit_per_host: int
+    in_use: int
+    idle: int
+    waiting: int
+
+
+def create_connector(config: ClickHouseConfig) -> TCPConnector:
+    """
+    Create the pooled connector for ClickHouse HTTP requests.
+
+    aiohttp always sets TCP_NODELAY on its connections, so small INSERT and
+    SELECT requests are not delayed by Nagle's algorithm.
+
+    Args:
+        config: ClickHouse configuration
+
+    Returns:
+        TCP connector with configured limits, keep-alive and DNS caching
+    """
+    return TCPConnector(
+        limit=config.pool_limit,
+        limit_per_host=config.pool_limit_per_host,
+        keepalive_timeout=config.keepalive_timeout,
+        use_dns_cache=config.dns_cache_ttl > 0,
+        ttl_dns_cache=config.dns_cache_ttl or None,
+    )
+
+
+def create_timeout(config: ClickHouseConfig) -> ClientTimeout:
+    """
+    Create request timeouts for ClickHouse HTTP requests.
+
+    Args:
+        config: ClickHouse configuration
+
+    Returns:
+        Timeout with connect and socket read limits and no total limit,
+        so long streaming reads are bounded by read inactivity only
+    """
+    return ClientTimeout(total=None, connect=config.connect_timeout, sock_read=config.read_timeout)
+
+
+def get_pool_stats(connector: BaseConnector) -> PoolStats:
+    """
+    Get connection counts of a connector.
+
+    aiohttp has no public API for pool occupancy, so this reads the
+    connector's internal bookkeeping and degrades to zeros if it changes.
+
+    Args:
+        connector: aiohttp connector
+
+    Returns:
+        Pool limits with in-use, idle and waiting counts
+    """
+    acquired = getattr(connector, "_acquired", ())
+    idle_connections = getattr(connector, "_conns", {})
+    waiters = getattr(connector, "_waiters", {})
+    return PoolStats(
+        limit=connector.limit,
+        limit_per_host=connector.limit_per_host,
+        in_use=len(acquired),
+        idle=sum(len(connections) for connections in idle_connections.values()),
+        waiting=sum(len(futures) for futures in waiters.values()),
+    )
@@ -0,0 +1,220 @@
+"""Server-side query parameters and reusable query templates for ClickHouse."""
+
+import re
+from collections.abc import AsyncIterator, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+from aiochclient.records import Record, RecordsFabric
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.database.clickhouse_transport import ClickHouseHTTPTransport
+from shared.infrastructure.database.clickhouse_validation import validate_sql_identifier
+
+# {name:Type} placeholders substituted by the server from param_<name> URL arguments
+PLACEHOLDER_PATTERN = re.compile(r"\{([a-zA-Z_][a-zA-Z0-9_]*):[^{}]+\}")
+RESULT_FORMAT = "TSVWithNamesAndTypes"
+TEXT_ESCAPES = str.maketrans({"\\": r"\\", "\t": r"\t", "\n": r"\n"})
+QUOTED_ESCAPES = str.maketrans({"\\": r"\\", "'": r"\'"})
+# Column names and column types precede the rows
+HEADER_LINES = 2
+
+
+def format_query_param(value: Any, nested: bool = False) -> str:  # noqa: ANN401
+    """
+    Render a value in the text form ClickHouse parses query parameters from.
+
+    Args:
+        value: None, bool, number, string, date/datetime or a list/tuple of those
+        nested: Whether the value is an array or tuple element, where strings
+            and dates are quoted
+
+    Returns:
+        Parameter value text
+    """
+    if value is None:
+        return "NULL" if nested else r"\N"
+    if isinstance(value, bool | int | float):
+        return str(value).lower()
+    if isinstance(value, list | tuple):
+        elements = ",".join(format_query_param(element, nested=True) for element in value)
+        return f"[{elements}]" if isinstance(value, list) else f"({elements})"
+    text = value.isoformat(sep=" ") if isinstance(value, datetime) else str(value)
+    if nested:
+        return f"'{text.translate(QUOTED_ESCAPES)}'"
+    return text.translate(TEXT_ESCAPES)
+
+
+def build_query_params(params: Mapping[str, Any]) -> dict[str, str]:
+    """
+    Build the HTTP arguments that bind query parameters.
+
+    Args:
+        params: Values by placeholder name
+
+    Returns:
+        ``param_<name>`` URL arguments
+
+    Raises:
+        DatabaseError: If a name is not a valid identifier
+    """
+    arguments = {}
+    for name, value in params.items():
+        validate_sql_identifier(name)
+        arguments[f"param_{name}"] = format_query_param(value)
+    return arguments
+
+
+def decode_records(payload: bytes) -> list[Record]:
+    """
+    Decode a TSVWithNamesAndTypes response the way aiochclient does.
+
+    Args:
+        payload: Raw response body
+
+    Returns:
+        Records with mapping access by column name
+    """
+    lines = payload.splitlines(keepends=True)
+    if len(lines) < HEADER_LINES:
+        return []
+    fabric = RecordsFabric(names=lines[0], tps=lines[1])
+    return [fabric.new(line) for line in lines[HEADER_LINES:]]
+
+
+async def fetch_with_params(
+    transport: ClickHouseHTTPTransport,
+    query: str,
+    params: Mapping[str, Any],
+) -> list[Record]:
+    """
+    Run a SELECT with server-side parameters over the raw HTTP transport.
+
+    Args:
+        transport: ClickHouse HTTP transport
+        query: SELECT query with ``{name:Type}`` placeholders and no FORMAT clause
+        params: Values by placeholder name
+
+    Returns:
+        Decoded records
+    """
+    payload = await transport.post(f"{query.rstrip()}\nFORMAT {RESULT_FORMAT}", settings=build_query_params(params))
+    return decode_records(payload)
+
+
+async def iterate_with_params(
+    transport: ClickHouseHTTPTransport,
+    query: str,
+    params: Mapping[str, Any],
+) -> AsyncIterator[Record]:
+    """
+    Stream a SELECT with server-side parameters, decoding rows as they arrive.
+
+    Args:
+        transport: ClickHouse HTTP transport
+        query: SELECT query with ``{name:Type}`` placeholders and no FORMAT clause
+        params: Values by placeholder name
+
+    Yields:
+        Decoded records
+    """
+    lines = transport.stream_lines(f"{query.rstrip()}\nFORMAT {RESULT_FORMAT}", settings=build_query_params(params))
+    names = await anext(lines, b"")
+    types = await anext(lines, b"")
+    if not types:
+        return
+    fabric = RecordsFabric(names=names, tps=types)
+    async for line in lines:
+        yield fabric.new(line)
+
+
+@dataclass(frozen=True)
+class QueryTemplate:
+    """
+    Constant query text with ``{name:Type}`` placeholders.
+
+    The text never changes between calls, so the server sees one query shape
+    and results can be cached by template name and parameters.
+    """
+
+    name: str
+    sql: str
+
+    @cached_property
+    def placeholders(self) -> frozenset[str]:
+        """Names of the placeholders in the query text."""
+        return frozenset(PLACEHOLDER_PATTERN.findall(self.sql))
+
+    def bind(self, **values: Any) -> dict[str, Any]:  # noqa: ANN401
+        """
+        Check that values cover the placeholders exactly.
+
+        Args:
+            **values: Values by placeholder name
+
+        Returns:
+            Parameters to pass as ``params`` to ClickHouseClient.fetch
+
+        Raises:
+            DatabaseError: If a placeholder is missing or an unknown name is given
+        """
+        missing = self.placeholders - values.keys()
+        unknown = values.keys() - self.placeholders
+        if missing or unknown:
+            msg = f"Query {self.name} parameters mismatch: missing {sorted(missing)}, unknown {sorted(unknown)}"
+            raise DatabaseError(msg)
+        return values
+
+
+class QueryRegistry:
+    """Named query templates of an application."""
+
+    def __init__(self) -> None:
+        """Initialize empty registry."""
+        self._templates: dict[str, QueryTemplate] = {}
+
+    def __iter__(self) -> Iterator[QueryTemplate]:
+        """Iterate over registered templates."""
+        return iter(self._templates.values())
+
+    def register(self, name: str, sql: str) -> QueryTemplate:
+        """
+        Register a query template.
+
+        Args:
+            name: Unique template name
+            sql: Query text with ``{name:Type}`` placeholders
+
+        Returns:
+            Registered template
+
+        Raises:
+            DatabaseError: If the name is already registered
+        """
+        if name in self._templates:
+            msg = f"Query template {name} is already registered"
+            raise DatabaseError(msg)
+        template = QueryTemplate(name, sql)
+        self._templates[name] = template
+        return template
+
+    def get(self, name: str) -> QueryTemplate:
+        """
+        Get a registered template.
+
+        Args:
+            name: Template name
+
+        Returns:
+            Query template
+
+        Raises:
+            DatabaseError: If no template has this name
+        """
+        template = self._templates.get(name)
+        if template is None:
+            msg = f"Unknown query template: {name}"
+            raise DatabaseError(msg)
+        return template
@@ -0,0 +1,249 @@
+"""Replica selection, health tracking and failover for ClickHouse clusters."""
+
+import asyncio
+import itertools
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+from loguru import logger
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.database.clickhouse_client import ClickHouseClient, ClickHouseClientStats
+from shared.infrastructure.database.retry import is_transient_error
+
+type LoadBalancing = Literal["round_robin", "least_in_flight", "latency"]
+type ReplicaOperation[ResultT] = Callable[[ClickHouseClient], Awaitable[ResultT]]
+type ReplicaStream[ResultT] = Callable[[ClickHouseClient], AsyncIterator[ResultT]]
+
+# Weight of the newest sample in the latency moving average
+LATENCY_SMOOTHING = 0.2
+# Latency floor in seconds, so unsampled or very fast replicas get a finite weight
+MIN_LATENCY = 0.001
+
+
+@dataclass(frozen=True)
+class ReplicaStats:
+    """Snapshot of one replica's health and load."""
+
+    healthy: bool
+    in_flight: int
+    latency: float
+    failures: int
+    client: ClickHouseClientStats
+
+
+class Replica:
+    """One replica endpoint with its client and health state."""
+
+    def __init__(self, name: str, client: ClickHouseClient) -> None:
+        """
+        Initialize replica.
+
+        Args:
+            name: Replica address used in logs and stats
+            client: Client connected to this replica
+        """
+        self.name = name
+        self.client = client
+        self.healthy = True
+        self.in_flight = 0
+        self.latency: float = 0
+        self.failures = 0
+
+    def record_success(self, elapsed: float) -> None:
+        """Reset the failure streak and fold a request duration into the latency average."""
+        self.failures = 0
+        self.latency = self.latency + LATENCY_SMOOTHING * (elapsed - self.latency) if self.latency else elapsed
+
+    def get_stats(self) -> ReplicaStats:
+        """Get a snapshot of the replica state."""
+        return ReplicaStats(
+            healthy=self.healthy,
+            in_flight=self.in_flight,
+            latency=self.latency,
+            failures=self.failures,
+            client=self.client.get_stats(),
+        )
+
+
+def is_replica_failure(exc: BaseException) -> bool:
+    """
+    Check whether an error points at the replica rather than the query.
+
+    Args:
+        exc: Error raised by a replica client
+
+    Returns:
+        True for connection errors and transient server errors
+    """
+    return is_transient_error(exc.__cause__ or exc)
+
+
+def select_replica(replicas: Sequence[Replica], strategy: LoadBalancing, turn: int) -> Replica:
+    """
+    Pick the replica that should serve the next read.
+
+    Args:
+        replicas: Non-empty candidates
+        strategy: "round_robin" cycles through replicas, "least_in_flight" picks
+            the one with the fewest running requests, "latency" picks at random
+            weighted by the inverse of the average latency
+        turn: Monotonic request counter used for rotation and tie-breaking
+
+    Returns:
+        Selected replica
+    """
+    rotated = [replicas[(turn + offset) % len(replicas)] for offset in range(len(replicas))]
+    if strategy == "least_in_flight":
+        return min(rotated, key=lambda replica: replica.in_flight)
+    if strategy == "latency":
+        weights = [1 / max(replica.latency, MIN_LATENCY) for replica in rotated]
+        return random.choices(rotated, weights=weights)[0]  # noqa: S311
+    return rotated[0]
+
+
+class ReplicaSet:
+    """
+    Healthy/ejected bookkeeping and failover across replicas.
+
+    A replica is ejected after ``failure_threshold`` consecutive connection or
+    transient server failures and reinstated by a successful probe or request.
+    When every replica is ejected, all of them are tried anyway.
+    """
+
+    def __init__(self, replicas: Sequence[Replica], strategy: LoadBalancing, failure_threshold: int) -> None:
+        """
+        Initialize replica set.
+
+        Args:
+            replicas: Replicas in configuration order; the first healthy one takes writes
+            strategy: Load balancing strategy for reads
+            failure_threshold: Consecutive failures that eject a replica
+        """
+        self._replicas = list(replicas)
+        self._strategy: LoadBalancing = strategy
+        self._failure_threshold = failure_threshold
+        self._turns = itertools.count()
+
+    @property
+    def replicas(self) -> list[Replica]:
+        """All replicas in configuration order."""
+        return self._replicas
+
+    def for_reads(self) -> list[Replica]:
+        """
+        Order replicas for a read.
+
+        Returns:
+            Balancer's pick first, then the remaining candidates as fallbacks
+        """
+        candidates = self._candidates()
+        selected = select_replica(candidates, self._strategy, next(self._turns))
+        return [selected, *(replica for replica in candidates if replica is not selected)]
+
+    def for_writes(self) -> list[Replica]:
+        """
+        Order replicas for a write.
+
+        Writes stick to the first healthy replica so retries of the same insert
+        (and its deduplication token) reach the same node.
+
+        Returns:
+            Candidates in configuration order
+        """
+        return self._candidates()
+
+    async def run[ResultT](self, replica: Replica, operation: ReplicaOperation[ResultT]) -> ResultT:
+        """
+        Run an operation on one replica and record the outcome.
+
+        Args:
+            replica: Target replica
+            operation: Coroutine function called with the replica's client
+
+        Returns:
+            Operation result
+        """
+        replica.in_flight += 1
+        started = time.perf_counter()
+        try:
+            result = await operation(replica.client)
+        except DatabaseError as exc:
+            if is_replica_failure(exc):
+                self._record_failure(replica, exc)
+            raise
+        finally:
+            replica.in_flight -= 1
+        if not replica.healthy:
+            logger.info(f"ClickHouse replica {replica.name} is back")
+            replica.healthy = True
+        replica.record_success(time.perf_counter() - started)
+        return result
+
+    async def call[ResultT](self, replicas: Sequence[Replica], operation: ReplicaOperation[ResultT]) -> ResultT:
+        """
+        Run an operation, failing over to the next replica on replica failures.
+
+        Query errors such as syntax errors are raised straight away.
+
+        Args:
+            replicas: Non-empty replicas in the order to try them
+            operation: Coroutine function called with a replica's client
+
+        Returns:
+            Result from the first replica that succeeded
+        """
+        for replica in replicas[:-1]:
+            try:
+                return await self.run(replica, operation)
+            except DatabaseError as exc:
+                if not is_replica_failure(exc):
+                    raise
+                logger.warning(f"ClickHouse replica {replica.name} failed, trying next: {exc}")
+        return await self.run(replicas[-1], operation)
+
+    async def stream[ResultT](self, replica: Replica, operation: ReplicaStream[ResultT]) -> AsyncIterator[ResultT]:
+        """
+        Stream items from one replica and record replica failures.
+
+        Args:
+            replica: Target replica
+            operation: Function called with the replica's client returning an async iterator
+
+        Yields:
+            Items of the stream
+        """
+        replica.in_flight += 1
+        try:
+            async for item in operation(replica.client):
+                yield item
+        except DatabaseError as exc:
+            if is_replica_failure(exc):
+                self._record_failure(replica, exc)
+            raise
+        finally:
+            replica.in_flight -= 1
+
+    async def watch(self, interval: float) -> None:
+        """Probe ejected replicas every interval seconds until cancelled, reinstating those that answer."""
+        while True:
+            await asyncio.sleep(interval)
+            ejected = [replica for replica in self._replicas if not replica.healthy]
+            await asyncio.gather(
+                *(self.run(replica, lambda client: client.execute("SELECT 1")) for replica in ejected),
+                return_exceptions=True,
+            )
+
+    def _candidates(self) -> list[Replica]:
+        """Healthy replicas, or all of them when none is healthy."""
+        return [replica for replica in self._replicas if replica.healthy] or self._replicas
+
+    def _record_failure(self, replica: Replica, exc: BaseException) -> None:
+        """Count a replica failure and eject the replica at the threshold."""
+        replica.failures += 1
+        if replica.healthy and replica.failures >= self._failure_threshold:
+            replica.healthy = False
+            logger.warning(f"Ejecting ClickHouse replica {replica.name} after {replica.failures} failures: {exc}")
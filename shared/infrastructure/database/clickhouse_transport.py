@@ -0,0 +1,125 @@
+"""Raw HTTP transport for ClickHouse."""
+
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import ClientResponse, ClientSession
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from shared.infrastructure.database.compression import get_compressor
+
+LINE_SEPARATOR = b"\n"
+
+
+async def raise_for_clickhouse_status(response: ClientResponse) -> None:
+    """
+    Raise the ClickHouse error carried by a non-200 response.
+
+    Args:
+        response: aiohttp response
+
+    Raises:
+        DatabaseError: If the response status is not 200
+    """
+    if response.status != HTTPStatus.OK:
+        payload = await response.read()
+        error_msg = f"ClickHouse HTTP {response.status}: {payload.decode(errors='replace').strip()}"
+        raise DatabaseError(error_msg)
+
+
+class ClickHouseHTTPTransport:
+    """
+    Thin transport over the ClickHouse HTTP interface.
+
+    Used for payloads aiochclient cannot produce itself, such as
+    pre-encoded binary or compressed INSERT bodies.
+    """
+
+    def __init__(self, session: ClientSession, config: ClickHouseConfig) -> None:
+        """
+        Initialize transport.
+
+        Args:
+            session: Shared aiohttp session
+            config: ClickHouse configuration
+
+        Raises:
+            ConfigurationError: If the configured compression is unavailable
+        """
+        self._session = session
+        self._compression = config.http_compression
+        self._compressor = get_compressor(config.http_compression)
+        self._url = f"http://{config.host}:{config.port}"
+        self._params: dict[str, str] = {"database": config.database}
+        self._headers: dict[str, str] = {"X-ClickHouse-User": config.user}
+        if config.password:
+            self._headers["X-ClickHouse-Key"] = config.password
+        if config.compress_response:
+            self._params["enable_http_compression"] = "1"
+
+    async def post(
+        self,
+        query: str,
+        data: bytes | None = None,
+        settings: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        """
+        Send a query over HTTP POST.
+
+        When data is given the query goes into the URL and data is the body
+        (e.g. ``INSERT ... FORMAT RowBinary``); otherwise the query is the body.
+        Data bodies are compressed in a worker thread if compression is configured.
+
+        Args:
+            query: SQL query
+            data: Optional request body
+            settings: Optional ClickHouse settings passed as URL parameters
+
+        Returns:
+            Raw response body
+
+        Raises:
+            DatabaseError: If ClickHouse responds with an error status
+        """
+        params = {**self._params, **(settings or {})}
+        headers = self._headers
+        if data is None:
+            body = query.encode()
+        else:
+            params["query"] = query
+            body = data
+            if self._compressor:
+                body = await asyncio.to_thread(self._compressor, data)
+                headers = {**headers, "Content-Encoding": self._compression}
+
+        async with self._session.post(self._url, params=params, headers=headers, data=body) as response:
+            await raise_for_clickhouse_status(response)
+            return await response.read()
+
+    async def stream_lines(self, query: str, settings: Mapping[str, Any] | None = None) -> AsyncIterator[bytes]:
+        """
+        Send a query over HTTP POST and yield response lines as they arrive.
+
+        Args:
+            query: SQL query sent as the request body
+            settings: Optional ClickHouse settings passed as URL parameters
+
+        Yields:
+            Response lines including the trailing newline
+
+        Raises:
+            DatabaseError: If ClickHouse responds with an error status
+        """
+        params = {**self._params, **(settings or {})}
+        async with self._session.post(self._url, params=params, headers=self._headers, data=query.encode()) as response:
+            await raise_for_clickhouse_status(response)
+            buffer = b""
+            # iter_any instead of line iteration, which caps line length
+            async for chunk in response.content.iter_any():
+                lines = (buffer + chunk).split(LINE_SEPARATOR)
+                buffer = lines.pop()
+                for line in lines:
+                    yield line + LINE_SEPARATOR
@@ -0,0 +1,69 @@
+"""ClickHouse identifier validation and client helpers."""
+
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from shared.domain.entities.exceptions import DatabaseError
+
+VALID_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+VALID_QUALIFIED_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)?$")
+
+type Row = Mapping[str, Any]
+type ColumnSchema = Mapping[str, str]
+
+
+def validate_sql_identifier(identifier: str, allow_qualified: bool = False) -> None:
+    """
+    Validate SQL identifier (table or column name).
+
+    Args:
+        identifier: SQL identifier to validate
+        allow_qualified: Allow qualified names like 'database.table'
+
+    Raises:
+        DatabaseError: If identifier is invalid
+    """
+    pattern = VALID_QUALIFIED_NAME_PATTERN if allow_qualified else VALID_IDENTIFIER_PATTERN
+    if not pattern.match(identifier):
+        msg = f"Invalid SQL identifier: {identifier}"
+        raise DatabaseError(msg)
+
+
+def get_validated_columns(row: Row) -> list[str]:
+    """
+    Get column names of a row, validating each as an SQL identifier.
+
+    Args:
+        row: Row mapping
+
+    Returns:
+        Column names in row order
+
+    Raises:
+        DatabaseError: If a column name is invalid
+    """
+    columns = list(row.keys())
+    for column_name in columns:
+        validate_sql_identifier(column_name)
+    return columns
+
+
+def require_initialized[ComponentT](component: ComponentT | None, name: str) -> ComponentT:
+    """
+    Return a client component, failing if the client context was not entered.
+
+    Args:
+        component: Component created in ``__aenter__``
+        name: Component name for the error message
+
+    Returns:
+        The component
+
+    Raises:
+        DatabaseError: If the component is not initialized
+    """
+    if component is None:
+        msg = f"ClickHouse {name} is not initialized"
+        raise DatabaseError(msg)
+    return component
@@ -0,0 +1,63 @@
+"""HTTP body compression for ClickHouse requests."""
+
+import gzip
+import importlib
+from collections.abc import Callable
+from types import ModuleType
+
+from shared.domain.entities.exceptions import ConfigurationError
+
+type Compressor = Callable[[bytes], bytes]
+
+GZIP_LEVEL = 1
+ZSTD_LEVEL = 3
+
+
+def _import_optional(module_name: str, method: str) -> ModuleType:
+    """Import an optional compression library or fail with a configuration error."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as exc:
+        package = module_name.split(".", maxsplit=1)[0]
+        msg = f"{method} compression requires the '{package}' package (install ecomet[compression])"
+        raise ConfigurationError(msg) from exc
+
+
+def _compress_gzip(data: bytes) -> bytes:
+    """Compress with gzip at a fast level."""
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+
+def get_compressor(method: str) -> Compressor | None:
+    """
+    Get a body compressor for an HTTP Content-Encoding.
+
+    gzip is always available; zstd and lz4 need the optional ``zstandard``
+    and ``lz4`` packages. Returned callables create their own compressor
+    state, so they are safe to run concurrently in worker threads.
+
+    Args:
+        method: "none", "gzip", "zstd" or "lz4"
+
+    Returns:
+        Compressor callable, or None when compression is disabled
+
+    Raises:
+        ConfigurationError: If the method is unknown or its library is missing
+    """
+    if method == "none":
+        return None
+    if method == "gzip":
+        return _compress_gzip
+    if method == "zstd":
+        zstandard = _import_optional("zstandard", method)
+
+        def compress_zstd(data: bytes) -> bytes:
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+        return compress_zstd
+    if method == "lz4":
+        return _import_optional("lz4.frame", method).compress
+
+    msg = f"Unknown compression method: {method}"
+    raise ConfigurationError(msg)
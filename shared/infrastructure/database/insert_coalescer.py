@@ -0,0 +1,100 @@
+"""Client-side micro-batching of small concurrent inserts."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from loguru import logger
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.database.batching import GroupFlusher, GroupKey, PendingRows, get_group_key
+from shared.infrastructure.database.clickhouse_validation import ColumnSchema, Row
+
+type InsertFunction = Callable[..., Awaitable[Any]]
+
+
+class _PendingInsert(PendingRows):
+    """Coalesced rows together with the future their submitters wait on."""
+
+    def __init__(self, key: GroupKey, schema: ColumnSchema | None) -> None:
+        super().__init__(key, schema)
+        self.done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+
+class InsertCoalescer:
+    """
+    Coalesce concurrent small inserts into the same table.
+
+    Rows submitted within ``window`` seconds of the first pending submit for a
+    table (and the same columns/schema) are sent as one insert; reaching
+    ``max_rows`` flushes immediately. Every caller waits for the flush carrying
+    its rows and gets that flush's error, if any.
+    """
+
+    def __init__(self, insert: InsertFunction, window: float, max_rows: int) -> None:
+        """
+        Initialize insert coalescer.
+
+        Args:
+            insert: Coroutine function called as ``insert(table, rows, schema=schema)``
+            window: Seconds to collect rows before flushing
+            max_rows: Pending row count that triggers an immediate flush
+        """
+        self._insert = insert
+        self._max_rows = max_rows
+        self._groups = GroupFlusher(self._run, max_age=window)
+        self._closed = False
+
+    async def submit(self, table: str, rows: Sequence[Row], schema: ColumnSchema | None = None) -> None:
+        """
+        Add rows to the pending insert for their table and wait until it is flushed.
+
+        Args:
+            table: Validated table name
+            rows: Non-empty sequence of rows with identical keys
+            schema: Optional column-type schema
+
+        Raises:
+            DatabaseError: If the coalescer is closed
+            Exception: Error of the flush carrying these rows
+        """
+        if self._closed:
+            msg = "Insert coalescer is closed"
+            raise DatabaseError(msg)
+
+        key = get_group_key(table, rows[0], schema)
+        group = self._groups.get(key)
+        if group is None:
+            group = _PendingInsert(key, schema)
+            self._groups.add(group)
+
+        group.rows.extend(rows)
+        done = group.done
+        if len(group.rows) >= self._max_rows:
+            self._groups.start_flush(group)
+        # Shielded so a cancelled caller does not cancel the flush for everyone else
+        await asyncio.shield(done)
+
+    async def flush(self) -> None:
+        """Flush all pending inserts now and wait for every running flush."""
+        await self._groups.flush()
+
+    async def close(self) -> None:
+        """Reject new submits and flush everything still pending."""
+        self._closed = True
+        pending_rows = sum(len(group.rows) for group in self._groups.pending)
+        if pending_rows:
+            logger.info(f"Flushing {pending_rows} coalesced rows on shutdown")
+        await self._groups.flush()
+
+    async def _run(self, group: _PendingInsert) -> None:
+        """Insert a group's rows and resolve its waiters."""
+        logger.debug(f"Flushing {len(group.rows)} coalesced rows into {group.table}")
+        try:
+            await self._insert(group.table, group.rows, schema=group.schema)
+        except Exception as exc:
+            group.done.set_exception(exc)
+            # Mark as retrieved in case every waiter was cancelled
+            group.done.exception()
+        else:
+            group.done.set_result(None)
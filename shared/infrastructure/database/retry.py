@@ -0,0 +1,151 @@
+"""Retry with exponential backoff for transient ClickHouse failures."""
+
+import asyncio
+import random
+import re
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+from loguru import logger
+
+ERROR_CODE_PATTERN = re.compile(r"\bCode: (\d+)")
+HTTP_STATUS_PATTERN = re.compile(r"(?:ClickHouse HTTP|status code) (\d{3})\b")
+
+# Server error codes worth retrying: overload, timeouts, network and replication hiccups
+TRANSIENT_ERROR_CODES = frozenset(
+    (
+        3,  # UNEXPECTED_END_OF_FILE
+        159,  # TIMEOUT_EXCEEDED
+        202,  # TOO_MANY_SIMULTANEOUS_QUERIES
+        209,  # SOCKET_TIMEOUT
+        210,  # NETWORK_ERROR
+        242,  # TABLE_IS_READ_ONLY
+        252,  # TOO_MANY_PARTS
+        285,  # TOO_FEW_LIVE_REPLICAS
+        319,  # UNKNOWN_STATUS_OF_INSERT
+        425,  # SYSTEM_ERROR
+        999,  # KEEPER_EXCEPTION
+    )
+)
+RETRYABLE_HTTP_STATUSES = frozenset(
+    (
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    )
+)
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Check whether a failed ClickHouse call is worth retrying.
+
+    Connection resets, timeouts, 502/503/504 responses and transient server
+    error codes are retryable; syntax, type and other client errors are not.
+
+    Args:
+        exc: Raised exception
+
+    Returns:
+        True if the operation may succeed when repeated
+    """
+    if isinstance(exc, ClientConnectionError | ClientPayloadError | ConnectionError | TimeoutError):
+        return True
+
+    message = str(exc)
+    code_match = ERROR_CODE_PATTERN.search(message)
+    if code_match:
+        return int(code_match.group(1)) in TRANSIENT_ERROR_CODES
+    status_match = HTTP_STATUS_PATTERN.search(message)
+    return bool(status_match) and int(status_match.group(1)) in RETRYABLE_HTTP_STATUSES
+
+
+@dataclass
+class RetryStats:
+    """Retry counters accumulated over the lifetime of a retry policy."""
+
+    retries: int = 0
+    recovered: int = 0
+    exhausted: int = 0
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient failures."""
+
+    def __init__(self, max_retries: int, backoff_base: float, backoff_max: float) -> None:
+        """
+        Initialize retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying)
+            backoff_base: Upper bound of the first delay in seconds
+            backoff_max: Cap for any single delay in seconds
+        """
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._stats = RetryStats()
+
+    @property
+    def max_retries(self) -> int:
+        """Retries after the first attempt."""
+        return self._max_retries
+
+    @property
+    def stats(self) -> RetryStats:
+        """Accumulated retry counters."""
+        return self._stats
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Get a jittered delay before the given retry.
+
+        Args:
+            attempt: Zero-based retry number
+
+        Returns:
+            Delay in seconds, uniform in [0, min(backoff_max, backoff_base * 2**attempt)]
+        """
+        ceiling = min(self._backoff_max, self._backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)  # noqa: S311 - jitter, not cryptography
+
+    async def call[ResultT](self, operation: Callable[[], Awaitable[ResultT]], description: str) -> ResultT:
+        """
+        Run an operation, repeating it on transient failures.
+
+        Args:
+            operation: Factory creating a fresh awaitable for each attempt
+            description: Operation name for log messages
+
+        Returns:
+            Operation result
+
+        Raises:
+            Exception: The last error if it is not transient or retries are exhausted
+        """
+        attempt = 0
+        while True:
+            try:
+                result = await operation()
+            except Exception as exc:
+                await self._backoff_or_raise(exc, attempt, description)
+                attempt += 1
+            else:
+                if attempt:
+                    self._stats.recovered += 1
+                return result
+
+    async def _backoff_or_raise(self, exc: Exception, attempt: int, description: str) -> None:
+        """Sleep before the next attempt, or re-raise if the failure must not be retried."""
+        if attempt >= self._max_retries or not is_transient_error(exc):
+            if attempt:
+                self._stats.exhausted += 1
+                logger.error(f"{description} failed after {attempt} retries: {exc}")
+            raise exc
+
+        delay = self.get_delay(attempt)
+        self._stats.retries += 1
+        logger.warning(f"{description} failed: {exc}; retry {attempt + 1}/{self._max_retries} in {delay:.2f}s")
+        await asyncio.sleep(delay)
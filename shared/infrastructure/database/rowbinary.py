@@ -0,0 +1,189 @@
+"""ClickHouse RowBinary encoder."""
+
+import re
+import struct
+from collections.abc import Callable, Iterable, Mapping
+from datetime import UTC, date, datetime
+from types import MappingProxyType
+from typing import Any
+
+from shared.domain.entities.exceptions import DatabaseError
+
+type ValueWriter = Callable[[bytearray, Any], None]
+
+EPOCH_DATE = datetime.fromtimestamp(0, tz=UTC).date()
+WRAPPER_TYPE_PATTERN = re.compile(r"^(Nullable|LowCardinality)\((.+)\)$", re.IGNORECASE)
+VARINT_CONTINUATION = 0x80
+VARINT_PAYLOAD_MASK = 0x7F
+VARINT_SHIFT = 7
+
+FIXED_WIDTH_FORMATS = MappingProxyType(
+    {
+        "int8": "<b",
+        "int16": "<h",
+        "int32": "<i",
+        "int64": "<q",
+        "uint8": "<B",
+        "uint16": "<H",
+        "uint32": "<I",
+        "uint64": "<Q",
+        "float32": "<f",
+        "float64": "<d",
+        "bool": "<?",
+    }
+)
+
+
+def _write_varint(buffer: bytearray, number: int) -> None:
+    """Write unsigned LEB128 integer."""
+    while number >= VARINT_CONTINUATION:
+        buffer.append((number & VARINT_PAYLOAD_MASK) | VARINT_CONTINUATION)
+        number >>= VARINT_SHIFT
+    buffer.append(number)
+
+
+def _write_string(buffer: bytearray, value: str | bytes) -> None:
+    """Write length-prefixed string."""
+    raw = value.encode() if isinstance(value, str) else value
+    _write_varint(buffer, len(raw))
+    buffer.extend(raw)
+
+
+def _make_fixed_writer(struct_format: str) -> ValueWriter:
+    """Create writer for a fixed-width numeric type."""
+    pack = struct.Struct(struct_format).pack
+
+    def write(buffer: bytearray, value: Any) -> None:  # noqa: ANN401
+        buffer.extend(pack(value))
+
+    return write
+
+
+def _write_date(buffer: bytearray, value: date) -> None:
+    """Write Date as UInt16 days since epoch."""
+    buffer.extend(struct.pack("<H", (value - EPOCH_DATE).days))
+
+
+def _write_datetime(buffer: bytearray, value: datetime) -> None:
+    """Write DateTime as UInt32 seconds since epoch (naive values are treated as UTC)."""
+    aware = value if value.tzinfo else value.replace(tzinfo=UTC)
+    buffer.extend(struct.pack("<I", int(aware.timestamp())))
+
+
+def _make_defaulting_writer(inner: ValueWriter, default: Any) -> ValueWriter:  # noqa: ANN401
+    """Create writer storing the column default for None, as ClickHouse does for VALUES inserts."""
+
+    def write(buffer: bytearray, value: Any) -> None:  # noqa: ANN401
+        inner(buffer, default if value is None else value)
+
+    return write
+
+
+def _make_nullable_writer(inner: ValueWriter) -> ValueWriter:
+    """Create writer prefixing values with a null marker byte."""
+
+    def write(buffer: bytearray, value: Any) -> None:  # noqa: ANN401
+        if value is None:
+            buffer.append(1)
+            return
+        buffer.append(0)
+        inner(buffer, value)
+
+    return write
+
+
+NAMED_WRITERS: MappingProxyType[str, ValueWriter] = MappingProxyType(
+    {
+        "string": _write_string,
+        "date": _write_date,
+        "datetime": _write_datetime,
+    }
+)
+
+# Values written for None in columns that are not Nullable; fixed-width types default to 0
+NAMED_DEFAULTS: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "string": "",
+        "date": EPOCH_DATE,
+        "datetime": datetime.fromtimestamp(0, tz=UTC),
+    }
+)
+
+
+def get_value_writer(column_type: str) -> ValueWriter:
+    """
+    Get RowBinary writer for a ClickHouse column type.
+
+    Supports integers, floats, Bool, String, Date, DateTime and their
+    Nullable / LowCardinality wrappers. Type names are case-insensitive.
+    None is written as NULL in Nullable columns and as the type default
+    (0, "" or the epoch) elsewhere.
+
+    Args:
+        column_type: ClickHouse type name, e.g. "Int32" or "Nullable(String)"
+
+    Returns:
+        Function appending the encoded value to a buffer
+
+    Raises:
+        DatabaseError: If the type is not supported
+    """
+    normalized = column_type.strip()
+    wrapper_match = WRAPPER_TYPE_PATTERN.match(normalized)
+    if wrapper_match:
+        wrapper, inner_type = wrapper_match.groups()
+        inner = get_value_writer(inner_type)
+        return _make_nullable_writer(inner) if wrapper.lower() == "nullable" else inner
+
+    type_name = normalized.lower()
+    fixed_format = FIXED_WIDTH_FORMATS.get(type_name)
+    if fixed_format:
+        return _make_defaulting_writer(_make_fixed_writer(fixed_format), 0)
+    named_writer = NAMED_WRITERS.get(type_name)
+    if named_writer:
+        return _make_defaulting_writer(named_writer, NAMED_DEFAULTS[type_name])
+
+    msg = f"Unsupported ClickHouse type for RowBinary: {column_type}"
+    raise DatabaseError(msg)
+
+
+class RowBinaryEncoder:
+    """Encode row mappings into ClickHouse RowBinary format using a column-type schema."""
+
+    def __init__(self, schema: Mapping[str, str]) -> None:
+        """
+        Initialize encoder.
+
+        Args:
+            schema: Ordered mapping of column name to ClickHouse type
+
+        Raises:
+            DatabaseError: If schema is empty or contains unsupported types
+        """
+        if not schema:
+            msg = "RowBinary schema must define at least one column"
+            raise DatabaseError(msg)
+        self._columns = list(schema)
+        self._writers = [(column, get_value_writer(column_type)) for column, column_type in schema.items()]
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names in encoding order."""
+        return self._columns
+
+    def encode(self, rows: Iterable[Mapping[str, Any]]) -> bytes:
+        """
+        Encode rows into a RowBinary payload.
+
+        Args:
+            rows: Row mappings containing every schema column
+
+        Returns:
+            RowBinary bytes
+        """
+        buffer = bytearray()
+        writers = self._writers
+        for row in rows:
+            for column, write in writers:
+                write(buffer, row[column])
+        return bytes(buffer)
@@ -0,0 +1,189 @@
+"""Write-behind buffer for ClickHouse tables."""
+
+import asyncio
+import sys
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass
+from types import TracebackType
+
+from loguru import logger
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from shared.infrastructure.database.batching import GroupFlusher, GroupKey, PendingRows, get_group_key
+from shared.infrastructure.database.clickhouse_client import ClickHouseClient
+from shared.infrastructure.database.clickhouse_validation import ColumnSchema, Row, validate_sql_identifier
+
+
+def estimate_row_size(row: Row) -> int:
+    """
+    Estimate memory held by a row.
+
+    Counts the shallow size of the mapping and its values; cheap enough to run
+    per row and close enough for a memory budget.
+
+    Args:
+        row: Row mapping
+
+    Returns:
+        Approximate size in bytes
+    """
+    return sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+
+
+@dataclass
+class WriteBufferStats:
+    """Row counters accumulated over the lifetime of a write buffer."""
+
+    rows_buffered: int = 0
+    rows_flushed: int = 0
+    rows_failed: int = 0
+    flushes: int = 0
+    last_error: str | None = None
+
+
+class _TableBuffer(PendingRows):
+    """Buffered rows for one table and column set with their estimated size."""
+
+    def __init__(self, key: GroupKey, schema: ColumnSchema | None) -> None:
+        super().__init__(key, schema)
+        self.size = 0
+
+
+class ClickHouseWriteBuffer:
+    """
+    Long-lived write-behind buffer in front of ClickHouseClient.
+
+    Rows from any number of coroutines are grouped per table and column set and
+    flushed in the background when a group reaches ``buffer_max_rows``, when its
+    oldest row is ``buffer_max_age`` seconds old, or when the buffer as a whole
+    (pending and in-flight rows) exceeds ``buffer_max_bytes``. Writers wait while
+    the memory budget is exhausted. Failed flushes are not raised to writers:
+    they are logged, counted and the last error is kept in ``stats``.
+    """
+
+    def __init__(self, client: ClickHouseClient, config: ClickHouseConfig) -> None:
+        """
+        Initialize write buffer.
+
+        Args:
+            client: Open ClickHouse client used for flushing
+            config: ClickHouse configuration with the buffer limits
+        """
+        self._client = client
+        self._config = config
+        self._groups = GroupFlusher(self._run, max_age=config.buffer_max_age)
+        self._held_bytes = 0
+        self._space_freed = asyncio.Event()
+        self._stats = WriteBufferStats()
+        self._closed = False
+
+    async def __aenter__(self) -> "ClickHouseWriteBuffer":
+        """Enter buffer context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Drain the buffer."""
+        await self.close()
+
+    @property
+    def stats(self) -> WriteBufferStats:
+        """Accumulated row counters."""
+        return self._stats
+
+    async def write(
+        self,
+        table: str,
+        rows: AsyncIterable[Row] | Iterable[Row],
+        schema: ColumnSchema | None = None,
+    ) -> int:
+        """
+        Buffer rows for a table, waiting while the memory budget is exhausted.
+
+        Args:
+            table: Table name
+            rows: Sync or async iterable of row mappings
+            schema: Column name to ClickHouse type mapping passed to inserts
+
+        Returns:
+            Number of buffered rows
+
+        Raises:
+            DatabaseError: If the buffer is closed or the table name is invalid
+        """
+        if self._closed:
+            msg = "ClickHouse write buffer is closed"
+            raise DatabaseError(msg)
+        validate_sql_identifier(table, allow_qualified=True)
+
+        count = 0
+        if isinstance(rows, AsyncIterable):
+            async for row in rows:
+                await self._add(table, row, schema)
+                count += 1
+        else:
+            for row in rows:
+                await self._add(table, row, schema)
+                count += 1
+        return count
+
+    async def flush(self) -> None:
+        """Flush every pending group and wait for all running flushes."""
+        await self._groups.flush()
+
+    async def close(self) -> None:
+        """Reject new writes and drain everything buffered."""
+        self._closed = True
+        pending = sum(len(group.rows) for group in self._groups.pending)
+        logger.info(f"Draining ClickHouse write buffer ({pending} pending rows)")
+        await self.flush()
+        logger.info(
+            f"ClickHouse write buffer drained: {self._stats.rows_flushed} rows flushed, "
+            f"{self._stats.rows_failed} failed",
+        )
+
+    async def _add(self, table: str, row: Row, schema: ColumnSchema | None) -> None:
+        """Add one row to its group, applying backpressure and size triggers."""
+        while self._held_bytes >= self._config.buffer_max_bytes:
+            await self._wait_for_space()
+
+        key = get_group_key(table, row, schema)
+        group = self._groups.get(key)
+        if group is None:
+            group = _TableBuffer(key, schema)
+            self._groups.add(group)
+
+        size = estimate_row_size(row)
+        group.rows.append(row)
+        group.size += size
+        self._held_bytes += size
+        self._stats.rows_buffered += 1
+        if len(group.rows) >= self._config.buffer_max_rows:
+            self._groups.start_flush(group)
+
+    async def _wait_for_space(self) -> None:
+        """Flush pending groups and wait until a flush releases memory."""
+        self._space_freed.clear()
+        for group in self._groups.pending:
+            self._groups.start_flush(group)
+        await self._space_freed.wait()
+
+    async def _run(self, group: _TableBuffer) -> None:
+        """Insert a group's rows, record the outcome and release its memory."""
+        self._stats.flushes += 1
+        try:
+            await self._client.insert_stream(group.table, group.rows, schema=group.schema)
+        except Exception as exc:
+            self._stats.rows_failed += len(group.rows)
+            self._stats.last_error = f"{group.table}: {exc}"
+            logger.error(f"Failed to flush {len(group.rows)} buffered rows into {group.table}: {exc}")
+        else:
+            self._stats.rows_flushed += len(group.rows)
+        finally:
+            self._held_bytes -= group.size
+            self._space_freed.set()
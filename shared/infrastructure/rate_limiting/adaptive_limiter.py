@@ -0,0 +1,165 @@
+"""Rate limiter that adapts to GitHub-style rate limit response headers."""
+
+import asyncio
+import time
+from collections.abc import Mapping
+
+from loguru import logger
+
+from shared.infrastructure.rate_limiting.token_bucket import TokenBucketRateLimiter
+
+REMAINING_HEADER = "X-RateLimit-Remaining"
+RESET_HEADER = "X-RateLimit-Reset"
+RETRY_AFTER_HEADER = "Retry-After"
+
+TOO_MANY_REQUESTS = 429
+FORBIDDEN = 403
+BAD_REQUEST = 400
+
+# GitHub asks to wait at least a minute after a secondary limit without Retry-After
+INITIAL_BACKOFF = 60.0
+MAX_BACKOFF = 900.0
+# Slack for clock skew between us and the API when waiting for a quota reset
+RESET_MARGIN = 1.0
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    """Parse an integer header, ignoring missing or malformed values."""
+    try:
+        return int(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Rate limiter (RPS) retuned from ``X-RateLimit-*`` and ``Retry-After`` headers.
+
+    Requests are paced by a token bucket whose rate follows the quota left
+    until the window resets, between the configured rate and ``max_rate``.
+    Spending the quota early never costs throughput: once it is exhausted,
+    every caller pauses until the reset, which is when the quota comes back
+    anyway. The remaining budget is also counted down locally per acquire, so
+    concurrent requests stop before the API starts refusing them.
+
+    A 429, or a 403 with ``Retry-After``, is a secondary rate limit: all
+    callers pause for ``Retry-After`` seconds, or for an exponential backoff
+    starting at a minute when the header is missing.
+    """
+
+    def __init__(self, rate: float, max_rate: float, burst: int | None = None) -> None:
+        """
+        Initialize adaptive rate limiter.
+
+        Args:
+            rate: Tokens per second before any response is seen, and the lowest retuned rate
+            max_rate: Highest retuned rate
+            burst: Maximum burst size (defaults to max_rate)
+        """
+        self._rate = rate
+        self._max_rate = max_rate
+        self._bucket = TokenBucketRateLimiter(rate, burst or max(int(max_rate), 1))
+        self._remaining: int | None = None
+        self._reset: int | None = None
+        self._paused_until = time.monotonic()
+        self._backoff = INITIAL_BACKOFF
+
+        logger.debug(f"AdaptiveRateLimiter initialized: rate={rate}, max_rate={max_rate}")
+
+    async def acquire(self, n: int = 1) -> None:
+        """
+        Acquire n tokens, waiting out pauses and then the pacing bucket.
+
+        Args:
+            n: Number of tokens
+        """
+        await self._wait_for_pause()
+        await self._bucket.acquire(n)
+        # A pause may have started while queued in the bucket
+        await self._wait_for_pause()
+        self._spend(n)
+
+    async def try_acquire(self, n: int = 1) -> bool:
+        """
+        Acquire n tokens if not paused and the bucket has them now.
+
+        Args:
+            n: Number of tokens
+
+        Returns:
+            True if the tokens were acquired
+        """
+        if self._paused_until > time.monotonic() or not await self._bucket.try_acquire(n):
+            return False
+        self._spend(n)
+        return True
+
+    async def release(self, n: int = 1) -> None:
+        """Release is a no-op for rate limiting."""
+
+    async def observe(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        latency: float | None = None,  # noqa: ARG002
+    ) -> None:
+        """
+        Update pacing from a response.
+
+        Args:
+            status: HTTP status code
+            headers: Response headers
+            latency: Seconds until the response arrived (unused)
+        """
+        retry_after = _header_int(headers, RETRY_AFTER_HEADER)
+        if status == TOO_MANY_REQUESTS or (status == FORBIDDEN and retry_after is not None):
+            self._pause(self._backoff if retry_after is None else retry_after, "secondary rate limit")
+            self._backoff = min(self._backoff * 2, MAX_BACKOFF)
+            return
+        if status < BAD_REQUEST:
+            self._backoff = INITIAL_BACKOFF
+
+        remaining = _header_int(headers, REMAINING_HEADER)
+        reset = _header_int(headers, RESET_HEADER)
+        if remaining is not None and reset is not None:
+            self._update_quota(remaining, reset)
+
+    def _update_quota(self, remaining: int, reset: int) -> None:
+        """Track the remaining quota and retune the rate to spend it before the reset."""
+        if reset != self._reset or self._remaining is None:
+            self._reset = reset
+            self._remaining = remaining
+        else:
+            # Responses of concurrent requests arrive out of order; the lowest count is the latest
+            self._remaining = min(self._remaining, remaining)
+
+        seconds_left = max(reset - time.time(), RESET_MARGIN)
+        self._bucket.retune(min(max(self._remaining / seconds_left, self._rate), self._max_rate))
+        if self._remaining <= 0:
+            self._pause(seconds_left + RESET_MARGIN, "rate limit exhausted")
+
+    def _spend(self, n: int) -> None:
+        """Count n requests against the known quota, pausing once it runs out."""
+        if self._remaining is None or self._reset is None:
+            return
+        if time.time() >= self._reset:
+            # The window has reset; the next response tells the new quota
+            self._remaining = None
+            return
+        self._remaining -= n
+        if self._remaining <= 0:
+            self._pause(self._reset - time.time() + RESET_MARGIN, "rate limit exhausted")
+
+    def _pause(self, delay: float, reason: str) -> None:
+        """Hold back all callers for delay seconds."""
+        until = time.monotonic() + delay
+        if until > self._paused_until:
+            self._paused_until = until
+            logger.warning(f"Rate limiter paused for {delay:.1f}s: {reason}")
+
+    async def _wait_for_pause(self) -> None:
+        """Sleep until no pause is in effect."""
+        delay = self._paused_until - time.monotonic()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._paused_until - time.monotonic()
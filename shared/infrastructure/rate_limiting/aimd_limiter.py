@@ -0,0 +1,106 @@
+"""Adaptive concurrency limiter (AIMD) driven by request latency and errors."""
+
+from collections.abc import Mapping
+
+from loguru import logger
+
+from shared.infrastructure.rate_limiting.semaphore_limiter import SemaphoreRateLimiter
+
+SERVER_ERROR = 500
+TOO_MANY_REQUESTS = 429
+
+# How fast the latency baseline follows slower samples, so a lasting upstream slowdown becomes the new normal
+BASELINE_DRIFT = 0.01
+
+
+class AIMDConcurrencyLimiter(SemaphoreRateLimiter):
+    """
+    Concurrency limiter (MCR) whose limit follows upstream conditions.
+
+    Additive increase, multiplicative decrease: every response that was not
+    slow grows the limit by 1 / limit (about one per round of requests)
+    while the limit is in use, and every slow response (latency above
+    ``tolerance`` times the baseline) or 5xx/429 response multiplies it by
+    ``backoff_ratio``. The baseline is the lowest latency seen, slowly
+    drifting towards newer samples.
+
+    Latency is reported through ``observe`` by the caller, which times only
+    the request itself: time spent queueing in this or any other limiter
+    would otherwise read as a slow upstream. RateLimitedHTTPClient does so
+    around each request.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        tolerance: float = 2.0,
+        backoff_ratio: float = 0.9,
+    ) -> None:
+        """
+        Initialize AIMD concurrency limiter.
+
+        Args:
+            initial_limit: Concurrency limit to start with
+            min_limit: Lowest limit
+            max_limit: Highest limit, and the largest weight of a single acquire
+            tolerance: Latency over baseline ratio above which a request counts as slow
+            backoff_ratio: Factor applied to the limit on a slow or failed request
+        """
+        super().__init__(max_limit)
+        self._min_limit = min_limit
+        self._tolerance = tolerance
+        self._backoff_ratio = backoff_ratio
+        self._estimate = float(initial_limit)
+        self._limit = initial_limit
+        self._baseline: float | None = None
+        logger.debug(f"AIMDConcurrencyLimiter initialized: limit={initial_limit}, range={min_limit}..{max_limit}")
+
+    async def observe(
+        self,
+        status: int,
+        headers: Mapping[str, str],  # noqa: ARG002
+        latency: float | None = None,
+    ) -> None:
+        """
+        Adjust the limit from a response.
+
+        Server errors and rate limit responses back off; any other timed
+        response is a latency sample.
+
+        Args:
+            status: HTTP status code
+            headers: Response headers
+            latency: Seconds the request took, not counting time spent in limiters
+        """
+        if status >= SERVER_ERROR or status == TOO_MANY_REQUESTS:
+            self._adjust(self._estimate * self._backoff_ratio)
+        elif latency is not None:
+            self._sample(latency)
+
+    def _sample(self, latency: float) -> None:
+        """Grow or shrink the limit from one request latency."""
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            self._baseline += (latency - self._baseline) * BASELINE_DRIFT
+
+        if latency > self._baseline * self._tolerance:
+            self._adjust(self._estimate * self._backoff_ratio)
+        elif self._in_flight * 2 >= self._limit:
+            # Only grow a limit that is actually used
+            self._adjust(self._estimate + 1 / self._estimate)
+
+    def _adjust(self, estimate: float) -> None:
+        """Set the limit estimate within bounds."""
+        self._estimate = min(max(estimate, self._min_limit), self._max_concurrent)
+        limit = int(self._estimate)
+        if limit == self._limit:
+            return
+        logger.debug(f"Concurrency limit {self._limit} -> {limit}")
+        grown = limit > self._limit
+        self._limit = limit
+        if grown:
+            # Queued callers may fit now; otherwise they would wait for the next release
+            self._wake()
@@ -1,8 +1,10 @@
 """Composite rate limiter combining multiple strategies."""
 
+from collections.abc import Mapping, Sequence
+
 from loguru import logger
 
-from shared.domain.protocols.rate_limiter import RateLimiter
+from shared.domain.protocols.rate_limiter import RateLimiter, RateLimitFeedback
 
 
 class CompositeRateLimiter:
@@ -18,12 +20,57 @@ class CompositeRateLimiter:
         self._limiters = limiters
         logger.debug(f"CompositeRateLimiter initialized with {len(limiters)} limiters")
 
-    async def acquire(self) -> None:
-        """Acquire all limiters in sequence."""
+    async def acquire(self, n: int = 1) -> None:
+        """
+        Acquire n permits from all limiters in sequence.
+
+        If a limiter fails or the caller is cancelled, permits already taken
+        from the previous limiters are released.
+
+        Args:
+            n: Number of permits
+        """
+        acquired: list[RateLimiter] = []
+        try:
+            for limiter in self._limiters:
+                await limiter.acquire(n)
+                acquired.append(limiter)
+        except BaseException:
+            await self._release(acquired, n)
+            raise
+
+    async def try_acquire(self, n: int = 1) -> bool:
+        """
+        Acquire n permits from all limiters only if every one has them now.
+
+        Permits taken before a limiter refuses are released again; limiters
+        whose release is a no-op (token bucket) keep them spent.
+
+        Args:
+            n: Number of permits
+
+        Returns:
+            True if all limiters granted the permits
+        """
+        acquired: list[RateLimiter] = []
+        for limiter in self._limiters:
+            if not await limiter.try_acquire(n):
+                await self._release(acquired, n)
+                return False
+            acquired.append(limiter)
+        return True
+
+    async def release(self, n: int = 1) -> None:
+        """Release n permits to all limiters in reverse sequence."""
+        await self._release(self._limiters, n)
+
+    async def observe(self, status: int, headers: Mapping[str, str], latency: float | None = None) -> None:
+        """Pass a response to every limiter that adapts to responses."""
         for limiter in self._limiters:
-            await limiter.acquire()
+            if isinstance(limiter, RateLimitFeedback):
+                await limiter.observe(status, headers, latency)
 
-    async def release(self) -> None:
-        """Release all limiters in reverse sequence."""
-        for limiter in reversed(self._limiters):
-            await limiter.release()
+    async def _release(self, limiters: Sequence[RateLimiter], n: int) -> None:
+        """Release n permits to the given limiters in reverse sequence."""
+        for limiter in reversed(limiters):
+            await limiter.release(n)
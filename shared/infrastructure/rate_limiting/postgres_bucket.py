@@ -0,0 +1,184 @@
+"""Token bucket rate limiter shared across processes through PostgreSQL."""
+
+import asyncio
+import time
+
+import asyncpg
+from loguru import logger
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.database.postgres_pool import PostgreSQLPool
+
+# Lease size as a share of the burst: enough to skip most round trips, small enough to keep replicas fair
+LEASE_SHARE = 4
+# Leased tokens unused for this long are dropped, so an idle replica cannot burst with stale tokens later.
+# Tokens gathered by a waiting caller are kept however long it waits.
+LEASE_TTL = 1.0
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    name TEXT PRIMARY KEY,
+    tokens DOUBLE PRECISION NOT NULL,
+    granted DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL
+)
+"""
+
+# $1 bucket name, $2 burst, $3 rate, $4 tokens wanted. now() is fixed for the statement, so every
+# expression sees the same refill; elapsed time is never lost, a late lock holder only borrows it.
+_REFILLED = "LEAST($2::float8, bucket.tokens + EXTRACT(EPOCH FROM now() - bucket.updated_at)::float8 * $3::float8)"
+_GRANTED = f"GREATEST(LEAST($4::float8, FLOOR({_REFILLED})), 0)"
+
+# Refill and lease in one atomic upsert: the row lock serializes replicas, a new bucket starts full
+LEASE_TOKENS = f"""
+INSERT INTO rate_limit_buckets AS bucket (name, tokens, granted, updated_at)
+VALUES ($1, $2::float8 - LEAST($4::float8, $2::float8), LEAST($4::float8, $2::float8), now())
+ON CONFLICT (name) DO UPDATE SET
+    granted = {_GRANTED},
+    tokens = {_REFILLED} - {_GRANTED},
+    updated_at = now()
+RETURNING granted::int AS granted, tokens
+"""  # noqa: S608 - only constant fragments are interpolated
+
+
+class PostgresTokenBucketRateLimiter:
+    """
+    Token bucket rate limiter (RPS) whose state lives in a PostgreSQL row.
+
+    Every replica using the same bucket name shares one budget. Tokens are
+    leased in batches with a single upsert and handed out locally, so most
+    acquires cost no round trip; idle leases expire after ``LEASE_TTL`` to
+    keep the global rate honest. Callers that have to wait for the bucket
+    queue in FIFO order per process: the head gathers its tokens across
+    refills while later callers, weighted or not, cannot take them.
+    """
+
+    def __init__(
+        self,
+        pool: PostgreSQLPool,
+        name: str,
+        rate: float,
+        burst: int | None = None,
+        lease_size: int | None = None,
+    ) -> None:
+        """
+        Initialize PostgreSQL token bucket rate limiter.
+
+        Args:
+            pool: PostgreSQL pool holding the bucket table
+            name: Bucket name shared by all replicas
+            rate: Tokens per second (RPS) across all replicas
+            burst: Maximum burst size (defaults to rate)
+            lease_size: Tokens fetched per round trip (defaults to a quarter of burst)
+        """
+        self._pool = pool
+        self._name = name
+        self._rate = rate
+        self._burst = burst or max(int(rate), 1)
+        self._lease_size = lease_size or max(self._burst // LEASE_SHARE, 1)
+        self._leased = 0
+        self._leased_at = time.monotonic()
+        self._queue = asyncio.Lock()
+
+        logger.debug(f"PostgresTokenBucketRateLimiter initialized: name={name}, rate={rate}, burst={self._burst}")
+
+    async def create_table(self) -> None:
+        """Create the bucket table if it does not exist."""
+        async with self._pool.acquire() as connection:
+            await connection.execute(CREATE_TABLE)
+
+    async def acquire(self, n: int = 1) -> None:
+        """
+        Acquire n tokens, leasing from PostgreSQL and waiting for refills as needed.
+
+        Args:
+            n: Number of tokens
+
+        Raises:
+            ValueError: If n is not between 1 and burst
+            DatabaseError: If PostgreSQL is unavailable
+        """
+        self._check_weight(n)
+        if not self._queue.locked() and self._take(n):
+            return
+        async with self._queue:
+            while not self._take(n):
+                delay = await self._refill(n)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+    async def try_acquire(self, n: int = 1) -> bool:
+        """
+        Acquire n tokens from the local lease, or one lease round trip, without waiting.
+
+        Args:
+            n: Number of tokens
+
+        Returns:
+            True if the tokens were acquired
+
+        Raises:
+            ValueError: If n is not between 1 and burst
+            DatabaseError: If PostgreSQL is unavailable
+        """
+        self._check_weight(n)
+        if self._queue.locked():
+            return False
+        if self._take(n):
+            return True
+        async with self._queue:
+            await self._refill(n)
+            return self._take(n)
+
+    async def release(self, n: int = 1) -> None:
+        """Release is a no-op for token bucket."""
+
+    def _check_weight(self, n: int) -> None:
+        """Reject weights that could never be granted."""
+        if not 1 <= n <= self._burst:
+            msg = f"n must be between 1 and burst ({self._burst}), got {n}"
+            raise ValueError(msg)
+
+    def _take(self, n: int) -> bool:
+        """Take n tokens from the local lease, dropping it first if it went stale."""
+        self._expire()
+        if self._leased < n:
+            return False
+        self._leased -= n
+        return True
+
+    def _expire(self) -> None:
+        """Drop a lease unused for longer than LEASE_TTL, unless the queue head is gathering it."""
+        stale = time.monotonic() - self._leased_at > LEASE_TTL
+        if stale and not self._queue.locked():
+            self._leased = 0
+
+    async def _refill(self, n: int) -> float:
+        """
+        Lease tokens until n are held locally; the caller holds the queue lock.
+
+        Returns:
+            Seconds to wait before the shared bucket can cover the rest, or 0
+
+        Raises:
+            DatabaseError: If the lease statement fails
+        """
+        missing = n - self._leased
+        async with self._pool.acquire() as connection:
+            try:
+                row = await connection.fetchrow(
+                    LEASE_TOKENS,
+                    self._name,
+                    float(self._burst),
+                    float(self._rate),
+                    float(min(max(self._lease_size, missing), self._burst)),
+                )
+            except asyncpg.PostgresError as exc:
+                error_msg = f"Failed to lease tokens from rate limit bucket {self._name}: {exc}"
+                logger.error(error_msg)
+                raise DatabaseError(error_msg) from exc
+        # The upsert always returns its row
+        granted, tokens = row["granted"], row["tokens"]  # pyright: ignore[reportOptionalSubscript]
+        self._leased += granted
+        self._leased_at = time.monotonic()
+        return max(n - self._leased - tokens, 0) / self._rate
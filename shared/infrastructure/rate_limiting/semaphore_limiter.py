@@ -1,12 +1,32 @@
 """Semaphore-based rate limiter for max concurrent requests."""
 
 import asyncio
+from collections import deque
+from dataclasses import dataclass
 
 from loguru import logger
 
+# Weight of a queued caller and the future resolved when its permits are granted
+type Waiter = tuple[int, asyncio.Future[None]]
+
+
+@dataclass(frozen=True)
+class ConcurrencyStats:
+    """Snapshot of a concurrency limiter."""
+
+    limit: int
+    in_flight: int
+    waiting: int
+
 
 class SemaphoreRateLimiter:
-    """Semaphore-based rate limiter for max concurrent requests (MCR)."""
+    """
+    Semaphore-based rate limiter for max concurrent requests (MCR).
+
+    A weighted semaphore: each caller takes n permits at once. Waiters are
+    served in FIFO order, so a large request is not starved by smaller ones
+    arriving after it.
+    """
 
     def __init__(self, max_concurrent: int) -> None:
         """
@@ -15,16 +35,93 @@ class SemaphoreRateLimiter:
         Args:
             max_concurrent: Maximum concurrent operations
         """
-        self._semaphore = asyncio.Semaphore(max_concurrent)
         self._max_concurrent = max_concurrent
+        self._limit = max_concurrent
+        self._in_flight = 0
+        self._waiters: deque[Waiter] = deque()
         logger.debug(f"SemaphoreRateLimiter initialized: max_concurrent={max_concurrent}")
 
-    async def acquire(self) -> None:
-        """Acquire semaphore (blocks if max concurrent reached)."""
-        await self._semaphore.acquire()
-        logger.debug(f"Semaphore acquired, available: {self._semaphore._value}")
+    @property
+    def stats(self) -> ConcurrencyStats:
+        """Current limit, permits in use and queued callers."""
+        return ConcurrencyStats(limit=self._limit, in_flight=self._in_flight, waiting=len(self._waiters))
+
+    async def acquire(self, n: int = 1) -> None:
+        """
+        Acquire n permits (blocks if max concurrent reached).
+
+        Args:
+            n: Number of permits
+
+        Raises:
+            ValueError: If n is not between 1 and max_concurrent
+        """
+        if self._take(n):
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((n, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted but cancelled before resuming: hand the permits on
+                self._put(n)
+            else:
+                # A large waiter leaving the head may unblock smaller ones behind it
+                self._wake()
+            raise
+        logger.debug(f"Semaphore acquired, in flight: {self._in_flight}/{self._limit}")
+
+    async def try_acquire(self, n: int = 1) -> bool:
+        """
+        Acquire n permits if available now, without queueing behind waiters.
+
+        Args:
+            n: Number of permits
+
+        Returns:
+            True if the permits were acquired
+
+        Raises:
+            ValueError: If n is not between 1 and max_concurrent
+        """
+        return self._take(n)
+
+    async def release(self, n: int = 1) -> None:
+        """Release n permits."""
+        self._put(n)
+
+    def _take(self, n: int) -> bool:
+        """Take n permits unless callers are queued or they do not fit."""
+        if not 1 <= n <= self._max_concurrent:
+            msg = f"n must be between 1 and max_concurrent ({self._max_concurrent}), got {n}"
+            raise ValueError(msg)
+        if self._waiters or not self._fits(n):
+            return False
+        self._in_flight += n
+        logger.debug(f"Semaphore acquired, in flight: {self._in_flight}/{self._limit}")
+        return True
+
+    def _put(self, n: int) -> None:
+        """Return n permits and wake the waiters that now fit."""
+        self._in_flight -= n
+        self._wake()
+        logger.debug(f"Semaphore released, in flight: {self._in_flight}/{self._limit}")
+
+    def _fits(self, n: int) -> bool:
+        """Check whether n more permits fit under the limit; an idle limiter admits any weight."""
+        return self._in_flight + n <= self._limit or not self._in_flight
 
-    async def release(self) -> None:
-        """Release semaphore."""
-        self._semaphore.release()
-        logger.debug(f"Semaphore released, available: {self._semaphore._value}")
+    def _wake(self) -> None:
+        """Grant permits to waiters at the head of the queue while they fit."""
+        while self._waiters:
+            n, waiter = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+            elif self._fits(n):
+                self._waiters.popleft()
+                self._in_flight += n
+                waiter.set_result(None)
+            else:
+                break
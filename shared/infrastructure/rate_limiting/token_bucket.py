@@ -2,16 +2,27 @@
 
 import asyncio
 import time
+from collections import deque
 
 from loguru import logger
 
-from shared.domain.entities.exceptions import RateLimitError
+# Weight of a queued caller and the future resolved when it may proceed
+type Waiter = tuple[int, asyncio.Future[None]]
 
 
 class TokenBucketRateLimiter:
-    """Token bucket algorithm for rate limiting (RPS)."""
-
-    def __init__(self, rate: int, burst: int | None = None) -> None:
+    """
+    Token bucket algorithm for rate limiting (RPS).
+
+    Implemented as GCRA (virtual scheduling): instead of a token count the
+    limiter keeps the theoretical arrival time (TAT) of the next request, and a
+    request of n tokens conforms once ``now >= TAT - (burst - n) / rate``.
+    Callers that cannot proceed queue in FIFO order and are woken by a single
+    timer at their slot, so no lock is held while sleeping and every acquire
+    succeeds eventually. A caller cancelled while waiting consumes no budget.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
         """
         Initialize token bucket rate limiter.
 
@@ -20,44 +31,122 @@ class TokenBucketRateLimiter:
             burst: Maximum burst size (defaults to rate)
         """
         self._rate = rate
-        self._burst = burst or rate
-        self._tokens = float(self._burst)
-        self._last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._burst = burst or max(int(rate), 1)
+        self._interval = 1 / rate
+        self._tolerance = self._burst * self._interval
+        self._tat = time.monotonic()
+        self._waiters: deque[Waiter] = deque()
+        self._timer: asyncio.TimerHandle | None = None
 
         logger.debug(f"TokenBucketRateLimiter initialized: rate={rate}, burst={self._burst}")
 
-    async def acquire(self) -> None:
+    async def acquire(self, n: int = 1) -> None:
         """
-        Acquire a token (blocks if no tokens available).
+        Acquire n tokens, waiting in FIFO order if they are not available.
+
+        Args:
+            n: Number of tokens
 
         Raises:
-            RateLimitError: If rate limit is exceeded
+            ValueError: If n is not between 1 and burst
+        """
+        self._check_weight(n)
+        now = time.monotonic()
+        if not self._waiters and now >= self._slot(n):
+            self._grant(now, n)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((n, waiter))
+        self._schedule()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted but cancelled before resuming: the slot goes back to the bucket
+                self._tat -= n * self._interval
+            raise
+
+    async def try_acquire(self, n: int = 1) -> bool:
         """
-        async with self._lock:
-            await self._refill_tokens()
+        Acquire n tokens if available now, without queueing behind waiters.
 
-            if self._tokens < 1:
-                wait_time = (1 - self._tokens) / self._rate
-                logger.debug(f"Rate limit: waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
-                await self._refill_tokens()
+        Args:
+            n: Number of tokens
 
-            if self._tokens < 1:
-                msg = "Rate limit exceeded after waiting"
-                raise RateLimitError(msg)
+        Returns:
+            True if the tokens were acquired
 
-            self._tokens -= 1
-            logger.debug(f"Token acquired, remaining: {self._tokens:.2f}")
+        Raises:
+            ValueError: If n is not between 1 and burst
+        """
+        self._check_weight(n)
+        now = time.monotonic()
+        if self._waiters or now < self._slot(n):
+            return False
+        self._grant(now, n)
+        return True
 
-    async def release(self) -> None:
+    async def release(self, n: int = 1) -> None:
         """Release is a no-op for token bucket."""
 
-    async def _refill_tokens(self) -> None:
-        """Refill tokens based on elapsed time."""
-        now = time.monotonic()
-        elapsed = now - self._last_update
+    def retune(self, rate: float) -> None:
+        """
+        Change the rate, keeping the burst size and the queued waiters.
 
-        new_tokens = elapsed * self._rate
-        self._tokens = min(self._tokens + new_tokens, self._burst)
-        self._last_update = now
+        Args:
+            rate: Tokens per second (RPS)
+        """
+        if rate == self._rate:
+            return
+        # Keep the tokens owed: the time still reserved scales with the rate
+        now = time.monotonic()
+        if self._tat > now:
+            self._tat = now + (self._tat - now) * self._rate / rate
+        self._rate = rate
+        self._interval = 1 / rate
+        self._tolerance = self._burst * self._interval
+        if self._timer is not None:
+            # Re-arm for the first waiter's slot at the new rate
+            self._timer.cancel()
+            self._timer = None
+            self._schedule()
+
+    def _check_weight(self, n: int) -> None:
+        """Reject weights that could never conform."""
+        if not 1 <= n <= self._burst:
+            msg = f"n must be between 1 and burst ({self._burst}), got {n}"
+            raise ValueError(msg)
+
+    def _slot(self, n: int) -> float:
+        """Earliest time a request of n tokens conforms."""
+        return self._tat - self._tolerance + n * self._interval
+
+    def _grant(self, now: float, n: int) -> None:
+        """Advance the theoretical arrival time by n requests."""
+        self._tat = max(now, self._tat) + n * self._interval
+
+    def _schedule(self) -> None:
+        """Arm the timer for the slot of the first waiter."""
+        if self._timer is None and self._waiters:
+            n, _ = self._waiters[0]
+            delay = max(self._slot(n) - time.monotonic(), 0)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._wake)
+
+    def _wake(self) -> None:
+        """Let every waiter whose slot has come proceed, in arrival order."""
+        self._timer = None
+        now = time.monotonic()
+        while self._waiters:
+            n, waiter = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+            elif now >= self._slot(n):
+                self._waiters.popleft()
+                # Granted as of now, not as of arrival: after a late timer or a stalled loop
+                # the queue drains at most a burst at once instead of every overdue waiter
+                self._grant(now, n)
+                waiter.set_result(None)
+            else:
+                break
+        self._schedule()
@@ -1,9 +1,17 @@
 """Health check endpoint."""
 
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
 from typing import Any
 
-from fastapi import APIRouter, status
-from pydantic import BaseModel
+from fastapi import APIRouter, Request, Response, status
+from loguru import logger
+from pydantic import BaseModel, Field
+
+type HealthCheck = Callable[[], Awaitable[Any]]
+type StatsProvider = Callable[[], Mapping[str, Any]]
+
+HEALTH_CHECK_TIMEOUT = 2.0
 
 
 class HealthResponse(BaseModel):
@@ -11,12 +19,43 @@ class HealthResponse(BaseModel):
 
     status: str
     version: str
+    checks: dict[str, str] = Field(default_factory=dict)
+    stats: dict[str, dict[str, Any]] = Field(default_factory=dict)
+
+
+async def run_health_checks(checks: Mapping[str, HealthCheck], timeout: float = HEALTH_CHECK_TIMEOUT) -> dict[str, str]:
+    """
+    Run dependency probes concurrently.
+
+    Args:
+        checks: Probe coroutine functions by dependency name; a probe passes unless it raises
+        timeout: Seconds each probe may take
+
+    Returns:
+        "ok" or "unavailable" by dependency name
+    """
+    results = await asyncio.gather(
+        *(asyncio.wait_for(check(), timeout) for check in checks.values()),
+        return_exceptions=True,
+    )
+    statuses = {}
+    for name, result in zip(checks, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning(f"Health check {name} failed: {result!r}")
+        statuses[name] = "unavailable" if isinstance(result, BaseException) else "ok"
+    return statuses
 
 
 def create_health_router(version: str) -> APIRouter:
     """
     Create health check router.
 
+    Dependency probes are read from ``app.state.health_checks`` (a mapping of
+    name to probe, see run_health_checks) at request time, so the lifespan can
+    register them once its resources exist. Any failed probe turns the
+    response into 503. Runtime counters such as connection pool usage are
+    read the same way from ``app.state.health_stats`` (name to StatsProvider).
+
     Args:
         version: Application version
 
@@ -30,10 +69,20 @@ def create_health_router(version: str) -> APIRouter:
         response_model=HealthResponse,
         status_code=status.HTTP_200_OK,
         summary="Health check",
-        description="Check if the service is healthy",
+        description="Check if the service and its dependencies are healthy",
     )
-    async def health_check() -> dict[str, Any]:
+    async def health_check(request: Request, response: Response) -> dict[str, Any]:
         """Health check endpoint."""
-        return {"status": "healthy", "version": version}
+        checks = await run_health_checks(getattr(request.app.state, "health_checks", {}))
+        healthy = all(check_status == "ok" for check_status in checks.values())
+        if not healthy:
+            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        providers: Mapping[str, StatsProvider] = getattr(request.app.state, "health_stats", {})
+        return {
+            "status": "healthy" if healthy else "unhealthy",
+            "version": version,
+            "checks": checks,
+            "stats": {name: dict(provider()) for name, provider in providers.items()},
+        }
 
     return router
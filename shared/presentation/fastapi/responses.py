@@ -0,0 +1,49 @@
+"""Fast JSON responses for FastAPI services."""
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+type JSONDumps = Callable[[Any], bytes]
+
+
+def _load_dumps() -> JSONDumps:
+    """Use orjson when the optional package is installed, pydantic-core otherwise."""
+    try:
+        return importlib.import_module("orjson").dumps
+    except ImportError:
+        return pydantic_core.to_json
+
+
+# Compact UTF-8 JSON; handles dicts, lists, tuples, dates and datetimes
+dumps_json: JSONDumps = _load_dumps()
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response for content the application built itself.
+
+    Returning it from an endpoint skips ``response_model`` validation and
+    serialization, which only re-check a response model we just constructed;
+    keep ``response_model`` on the route for the OpenAPI schema. Pydantic
+    models are written straight to JSON bytes by pydantic-core, other content
+    goes through orjson when installed (``ecomet[json]``).
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """
+        Serialize content to JSON bytes.
+
+        Args:
+            content: Pydantic model or JSON-compatible data
+
+        Returns:
+            Response body
+        """
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return dumps_json(content)
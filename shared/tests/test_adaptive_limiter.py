@@ -0,0 +1,127 @@
+"""Tests for the header-driven adaptive rate limiter."""
+
+import time
+
+import pytest
+
+from shared.infrastructure.rate_limiting.adaptive_limiter import INITIAL_BACKOFF, RESET_MARGIN, AdaptiveRateLimiter
+from shared.infrastructure.rate_limiting.composite_limiter import CompositeRateLimiter
+from shared.infrastructure.rate_limiting.semaphore_limiter import SemaphoreRateLimiter
+
+
+def quota_headers(remaining, seconds_to_reset):
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time()) + seconds_to_reset),
+    }
+
+
+def paused_for(limiter):
+    return limiter._paused_until - time.monotonic()
+
+
+@pytest.mark.anyio
+async def test_spends_plentiful_quota_up_to_max_rate():
+    limiter = AdaptiveRateLimiter(rate=1, max_rate=10)
+
+    await limiter.observe(200, quota_headers(remaining=1000, seconds_to_reset=10))
+
+    assert limiter._bucket._rate == 10
+
+
+@pytest.mark.anyio
+async def test_rate_never_drops_below_configured_rate():
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=10)
+
+    await limiter.observe(200, quota_headers(remaining=10, seconds_to_reset=3600))
+
+    assert limiter._bucket._rate == 5
+
+
+@pytest.mark.anyio
+async def test_pauses_until_reset_when_quota_exhausted():
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=10)
+
+    await limiter.observe(403, quota_headers(remaining=0, seconds_to_reset=30))
+
+    assert 29 < paused_for(limiter) <= 30 + RESET_MARGIN
+    assert not await limiter.try_acquire()
+
+
+@pytest.mark.anyio
+async def test_counts_quota_down_locally():
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=10)
+    await limiter.observe(200, quota_headers(remaining=2, seconds_to_reset=60))
+
+    assert await limiter.try_acquire()
+    assert await limiter.try_acquire()
+    # The last request of the window went out; the rest wait for the reset
+    assert not await limiter.try_acquire()
+    assert paused_for(limiter) > 58
+
+
+@pytest.mark.anyio
+async def test_out_of_order_responses_keep_lowest_remaining():
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=10)
+    headers = quota_headers(remaining=1, seconds_to_reset=60)
+    await limiter.observe(200, headers)
+
+    await limiter.observe(200, {**headers, "X-RateLimit-Remaining": "50"})
+
+    assert limiter._remaining == 1
+
+
+@pytest.mark.anyio
+async def test_secondary_limit_pauses_for_retry_after():
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=10)
+
+    await limiter.observe(403, {"Retry-After": "30"})
+
+    assert 29 < paused_for(limiter) <= 30
+    assert limiter._backoff == INITIAL_BACKOFF * 2
+
+
+@pytest.mark.anyio
+async def test_secondary_limit_without_retry_after_backs_off_exponentially():
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=10)
+
+    await limiter.observe(429, {})
+    assert paused_for(limiter) > INITIAL_BACKOFF - 1
+
+    await limiter.observe(429, {})
+    assert paused_for(limiter) > INITIAL_BACKOFF * 2 - 1
+
+    await limiter.observe(200, {})
+    assert limiter._backoff == INITIAL_BACKOFF
+
+
+@pytest.mark.anyio
+async def test_forbidden_without_rate_limit_headers_does_not_pause():
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=10)
+
+    await limiter.observe(403, {"X-RateLimit-Remaining": "not a number"})
+
+    assert paused_for(limiter) <= 0
+    assert await limiter.try_acquire()
+
+
+@pytest.mark.anyio
+async def test_acquire_waits_out_pause():
+    limiter = AdaptiveRateLimiter(rate=100, max_rate=100)
+    limiter._pause(0.1, "test")
+    start_time = time.monotonic()
+
+    await limiter.acquire()
+
+    assert time.monotonic() - start_time >= 0.1
+
+
+@pytest.mark.anyio
+async def test_composite_forwards_responses_to_adaptive_limiters():
+    adaptive = AdaptiveRateLimiter(rate=5, max_rate=10)
+    limiter = CompositeRateLimiter(SemaphoreRateLimiter(max_concurrent=2), adaptive)
+
+    await limiter.observe(429, {"Retry-After": "30"})
+
+    assert not await limiter.try_acquire()
+    assert paused_for(adaptive) > 29
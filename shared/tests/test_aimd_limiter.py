@@ -0,0 +1,116 @@
+"""Tests for the AIMD concurrency limiter."""
+
+import asyncio
+
+import pytest
+
+from shared.infrastructure.rate_limiting.aimd_limiter import AIMDConcurrencyLimiter
+from shared.infrastructure.rate_limiting.semaphore_limiter import ConcurrencyStats
+
+
+async def run_round(limiter, concurrency, latency):
+    """Run concurrency requests at once, each answered with 200 after latency."""
+    for _ in range(concurrency):
+        await limiter.acquire()
+    for _ in range(concurrency):
+        await limiter.observe(200, {}, latency)
+    for _ in range(concurrency):
+        await limiter.release()
+
+
+@pytest.mark.anyio
+async def test_limit_grows_while_used_and_fast():
+    limiter = AIMDConcurrencyLimiter(initial_limit=4, max_limit=10)
+
+    for _ in range(4):
+        await run_round(limiter, concurrency=limiter.stats.limit, latency=0.1)
+
+    assert limiter.stats.limit > 4
+
+
+@pytest.mark.anyio
+async def test_limit_does_not_grow_when_unused():
+    limiter = AIMDConcurrencyLimiter(initial_limit=4, max_limit=10)
+
+    for _ in range(20):
+        await run_round(limiter, concurrency=1, latency=0.1)
+
+    assert limiter.stats.limit == 4
+
+
+@pytest.mark.anyio
+async def test_slow_requests_shrink_limit():
+    limiter = AIMDConcurrencyLimiter(initial_limit=10, max_limit=10, backoff_ratio=0.5)
+    await run_round(limiter, concurrency=1, latency=0.1)
+
+    await run_round(limiter, concurrency=1, latency=0.5)
+
+    assert limiter.stats.limit == 5
+
+
+@pytest.mark.anyio
+async def test_error_responses_shrink_limit_once():
+    limiter = AIMDConcurrencyLimiter(initial_limit=10, max_limit=10, backoff_ratio=0.5)
+    await run_round(limiter, concurrency=1, latency=0.1)
+
+    await limiter.acquire()
+    await limiter.observe(503, {}, 5)
+    await limiter.release()
+
+    # The slow failed request is not sampled as latency on top of the backoff
+    assert limiter.stats.limit == 5
+
+
+@pytest.mark.anyio
+async def test_untimed_responses_are_not_sampled():
+    limiter = AIMDConcurrencyLimiter(initial_limit=2, max_limit=10)
+
+    for _ in range(10):
+        await limiter.acquire()
+        await limiter.acquire()
+        await limiter.observe(200, {})
+        await limiter.release()
+        await limiter.release()
+
+    assert limiter.stats.limit == 2
+
+
+@pytest.mark.anyio
+async def test_limit_stays_within_bounds():
+    limiter = AIMDConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=3, backoff_ratio=0.1)
+
+    for _ in range(10):
+        await run_round(limiter, concurrency=limiter.stats.limit, latency=0.1)
+    assert limiter.stats.limit == 3
+
+    await limiter.observe(429, {})
+    assert limiter.stats.limit == 2
+
+
+@pytest.mark.anyio
+async def test_growing_limit_wakes_queued_callers():
+    limiter = AIMDConcurrencyLimiter(initial_limit=2, max_limit=10)
+    await limiter.acquire()
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    while limiter.stats.limit == 2:
+        await limiter.observe(200, {}, 0.1)
+    await asyncio.sleep(0)
+
+    assert waiting.done()
+    assert limiter.stats.in_flight == 3
+
+
+@pytest.mark.anyio
+async def test_stats_report_queued_callers():
+    limiter = AIMDConcurrencyLimiter(initial_limit=1, max_limit=10)
+    await limiter.acquire()
+
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    assert limiter.stats == ConcurrencyStats(limit=1, in_flight=1, waiting=1)
+    await limiter.release()
+    await waiting
@@ -1,9 +1,11 @@
 """Tests for base domain entity."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pydantic import ValidationError
 
-from shared.domain.entities.base import DomainEntity
+from shared.domain.entities.base import DomainEntity, compact_entity
 
 
 def test_domain_entity_is_frozen() -> None:
@@ -35,3 +37,25 @@ def test_domain_entity_creation() -> None:
 
     assert entity.name == "test"
     assert entity.value == 42
+
+
+def test_compact_entity_is_frozen_and_slotted() -> None:
+    @compact_entity
+    class TestEntity:
+        name: str
+        value: int
+
+    entity = TestEntity(name="test", value=42)
+
+    with pytest.raises(FrozenInstanceError):
+        entity.name = "changed"  # type: ignore[misc]
+    assert not hasattr(entity, "__dict__")
+    assert entity == TestEntity("test", 42)
+
+
+def test_compact_entity_skips_validation() -> None:
+    @compact_entity
+    class TestEntity:
+        value: int
+
+    assert TestEntity(value="not an int").value == "not an int"  # type: ignore[arg-type]
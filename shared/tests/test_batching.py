@@ -0,0 +1,124 @@
+"""Tests for batching helpers."""
+
+import asyncio
+
+import pytest
+
+from shared.infrastructure.database.batching import InsertPipeline, iterate_batches
+
+
+async def _collect(batches):
+    return [batch async for batch in batches]
+
+
+@pytest.mark.anyio
+async def test_iterate_batches_sync_iterable():
+    batches = await _collect(iterate_batches(range(5), batch_size=2))
+
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.anyio
+async def test_iterate_batches_async_iterable():
+    async def rows():
+        for i in range(4):
+            yield i
+
+    batches = await _collect(iterate_batches(rows(), batch_size=2))
+
+    assert batches == [[0, 1], [2, 3]]
+
+
+@pytest.mark.anyio
+async def test_iterate_batches_pulls_lazily():
+    pulled = []
+
+    def rows():
+        for i in range(6):
+            pulled.append(i)
+            yield i
+
+    batches = iterate_batches(rows(), batch_size=3)
+    first = await anext(batches)
+
+    assert first == [0, 1, 2]
+    assert pulled == [0, 1, 2]
+
+
+@pytest.mark.anyio
+async def test_iterate_batches_empty():
+    assert await _collect(iterate_batches([], batch_size=10)) == []
+
+
+@pytest.mark.anyio
+async def test_iterate_batches_rejects_non_positive_size():
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        await _collect(iterate_batches([1], batch_size=0))
+
+
+@pytest.mark.anyio
+async def test_insert_pipeline_bounds_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def operation():
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    async with InsertPipeline(concurrency=3) as pipeline:
+        for _ in range(10):
+            await pipeline.submit(operation())
+
+    assert max_in_flight == 3
+    assert in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_insert_pipeline_reports_errors_in_submission_order():
+    async def operation(delay, error):
+        await asyncio.sleep(delay)
+        if error:
+            raise RuntimeError(error)
+
+    async def run():
+        async with InsertPipeline(concurrency=2) as pipeline:
+            await pipeline.submit(operation(0.03, "first"))
+            await pipeline.submit(operation(0, "second"))
+
+    with pytest.raises(RuntimeError, match="first"):
+        await run()
+
+
+@pytest.mark.anyio
+async def test_insert_pipeline_cancels_in_flight_on_error():
+    cancelled = asyncio.Event()
+
+    async def failing():
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def run():
+        async with InsertPipeline(concurrency=2) as pipeline:
+            await pipeline.submit(failing())
+            await pipeline.submit(slow())
+            await pipeline.submit(slow())
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await run()
+
+    assert cancelled.is_set()
+
+
+def test_insert_pipeline_rejects_non_positive_concurrency():
+    with pytest.raises(ValueError, match="concurrency must be positive"):
+        InsertPipeline(concurrency=0)
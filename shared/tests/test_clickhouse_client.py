@@ -1,15 +1,18 @@
 """Tests for ClickHouse client."""
 
+import asyncio
+import re
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from aiohttp import ClientSession
 
-from shared.domain.entities.exceptions import DatabaseError
+from shared.domain.entities.exceptions import ConfigurationError, DatabaseError
 from shared.infrastructure.config.clickhouse import ClickHouseConfig
 from shared.infrastructure.database.clickhouse_client import (
     ClickHouseClient,
     validate_sql_identifier,
+    warm_up_connections,
 )
 
 
@@ -56,6 +59,8 @@ class TestClickHouseClient:
             password="secret",
             database="test_db",
             batch_size=1000,
+            retry_backoff_base=0.001,
+            insert_deduplication=False,
         )
 
     @pytest.fixture
@@ -97,6 +102,21 @@ class TestClickHouseClient:
             async with ClickHouseClient(config):
                 pass
 
+    async def test_context_manager_closes_session_when_setup_fails(self, config, mock_session, mock_ch_client):
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession", return_value=mock_session),
+            patch("shared.infrastructure.database.clickhouse_client.ChClient", return_value=mock_ch_client),
+            patch(
+                "shared.infrastructure.database.clickhouse_client.ClickHouseHTTPTransport",
+                side_effect=ConfigurationError("zstandard is not installed"),
+            ),
+        ):
+            client = ClickHouseClient(config)
+            with pytest.raises(DatabaseError, match="zstandard is not installed"):
+                await client.__aenter__()
+
+        mock_session.close.assert_awaited_once()
+
     async def test_context_manager_cleanup_on_exception(self, config, mock_session, mock_ch_client):
         with (
             patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
@@ -315,3 +335,485 @@ class TestClickHouseClient:
                 pass
 
             mock_session.close.assert_not_called()
+
+    async def test_insert_stream_async_iterable(self, config, mock_session, mock_ch_client):
+        async def rows():
+            for i in range(5):
+                yield {"id": i, "name": f"test_{i}"}
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                inserted = await client.insert_stream("test_table", rows(), batch_size=2)
+
+            assert inserted == 5
+            assert mock_ch_client.execute.call_count == 3
+            first_call = mock_ch_client.execute.call_args_list[0]
+            assert first_call.args == ("INSERT INTO test_table (id, name) VALUES", (0, "test_0"), (1, "test_1"))
+
+    async def test_insert_stream_sync_iterable(self, config, mock_session, mock_ch_client):
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                inserted = await client.insert_stream("test_table", ({"id": i} for i in range(1500)))
+
+            assert inserted == 1500
+            assert mock_ch_client.execute.call_count == 2
+
+    async def test_insert_stream_empty(self, config, mock_session, mock_ch_client):
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                inserted = await client.insert_stream("test_table", iter([]))
+
+            assert inserted == 0
+            mock_ch_client.execute.assert_not_called()
+
+    async def test_insert_stream_not_initialized(self, config):
+        client = ClickHouseClient(config)
+        with pytest.raises(DatabaseError, match="client is not initialized"):
+            await client.insert_stream("test_table", [{"id": 1}])
+
+    async def test_insert_stream_execution_fails(self, config, mock_session, mock_ch_client):
+        mock_ch_client.execute = AsyncMock(side_effect=Exception("Insert failed"))
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                with pytest.raises(DatabaseError, match="Failed to insert stream"):
+                    await client.insert_stream("test_table", [{"id": 1}])
+
+    async def test_insert_batch_concurrent_batches(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"insert_concurrency": 3})
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_execute(*args):  # noqa: ANN002
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        mock_ch_client.execute = AsyncMock(side_effect=slow_execute)
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                await client.insert_batch("test_table", [{"id": i} for i in range(10)], batch_size=1)
+
+            assert mock_ch_client.execute.call_count == 10
+            assert max_in_flight == 3
+
+    async def test_insert_batch_error_names_failed_batch(self, config, mock_session, mock_ch_client):
+        mock_ch_client.execute = AsyncMock(side_effect=[None, Exception("Insert failed")])
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                with pytest.raises(DatabaseError, match=r"batch 2: 1 rows \(2-2\) failed"):
+                    await client.insert_batch("test_table", [{"id": 1}, {"id": 2}], batch_size=1)
+
+    async def test_insert_stream_rowbinary_format(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"insert_format": "rowbinary"})
+        mock_transport = AsyncMock()
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ClickHouseHTTPTransport") as mock_transport_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+            mock_transport_cls.return_value = mock_transport
+
+            async with ClickHouseClient(config) as client:
+                inserted = await client.insert_stream(
+                    "test_table",
+                    [{"name": "a", "id": 1}, {"name": "b", "id": 2}],
+                    schema={"id": "UInt8", "name": "String"},
+                )
+
+            assert inserted == 2
+            mock_ch_client.execute.assert_not_called()
+            mock_transport.post.assert_called_once_with(
+                "INSERT INTO test_table (id, name) FORMAT RowBinary",
+                b"\x01\x01a\x02\x01b",
+            )
+
+    async def test_fetch_with_params_uses_transport(self, config, mock_session, mock_ch_client):
+        mock_transport = AsyncMock()
+        mock_transport.post.return_value = b"id\nUInt8\n1\n"
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ClickHouseHTTPTransport") as mock_transport_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+            mock_transport_cls.return_value = mock_transport
+
+            async with ClickHouseClient(config) as client:
+                result = await client.fetch("SELECT {id:UInt8} AS id", params={"id": 1})
+
+            assert [dict(row) for row in result] == [{"id": 1}]
+            mock_ch_client.fetch.assert_not_called()
+            assert mock_transport.post.call_args.kwargs["settings"] == {"param_id": "1"}
+
+    async def test_insert_batch_schema_ignored_for_values_format(self, config, mock_session, mock_ch_client):
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                await client.insert_batch(
+                    "test_table", [{"name": "a", "id": 1}], schema={"id": "UInt8", "name": "String"}
+                )
+
+            mock_ch_client.execute.assert_called_once_with("INSERT INTO test_table (id, name) VALUES", (1, "a"))
+
+    async def test_insert_rowbinary_not_initialized(self, config):
+        config = config.model_copy(update={"insert_format": "rowbinary"})
+        client = ClickHouseClient(config)
+        client._client = AsyncMock()
+
+        with pytest.raises(DatabaseError, match="transport is not initialized"):
+            await client.insert_batch("test_table", [{"id": 1}], schema={"id": "UInt8"})
+
+    async def test_compressed_values_insert_uses_transport(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"http_compression": "gzip", "compress_response": True})
+        mock_transport = AsyncMock()
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ClickHouseHTTPTransport") as mock_transport_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+            mock_transport_cls.return_value = mock_transport
+
+            async with ClickHouseClient(config) as client:
+                await client.insert_batch("test_table", [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+
+            assert mock_ch_cls.call_args.kwargs["compress_response"] is True
+            mock_ch_client.execute.assert_not_called()
+            mock_transport.post.assert_called_once_with("INSERT INTO test_table (id, name) VALUES", b"(1,'a'),(2,'b')")
+
+    async def test_iterate_streams_rows(self, config, mock_session, mock_ch_client):
+        async def rows(query, *args):  # noqa: ANN002
+            for i in range(3):
+                yield {"id": i}
+
+        mock_ch_client.iterate = rows
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                result = [row async for row in client.iterate("SELECT id FROM test")]
+
+            assert result == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    async def test_fetch_chunks(self, config, mock_session, mock_ch_client):
+        async def rows(query, *args):  # noqa: ANN002
+            for i in range(5):
+                yield {"id": i}
+
+        mock_ch_client.iterate = rows
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                chunks = [chunk async for chunk in client.fetch_chunks("SELECT id FROM test", 2)]
+
+            assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    async def test_iterate_not_initialized(self, config):
+        client = ClickHouseClient(config)
+        with pytest.raises(DatabaseError, match="client is not initialized"):
+            await anext(client.iterate("SELECT 1"))
+
+    async def test_iterate_query_fails(self, config, mock_session, mock_ch_client):
+        async def failing(query, *args):  # noqa: ANN002
+            yield {"id": 0}
+            msg = "connection reset"
+            raise ConnectionError(msg)
+
+        mock_ch_client.iterate = failing
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                rows = client.iterate("SELECT id FROM test")
+                assert await anext(rows) == {"id": 0}
+                with pytest.raises(DatabaseError, match="Failed to stream query results"):
+                    await anext(rows)
+
+    async def test_execute_does_not_retry_by_default(self, config, mock_session, mock_ch_client):
+        mock_ch_client.execute = AsyncMock(side_effect=[ConnectionResetError("reset"), "OK"])
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                with pytest.raises(DatabaseError, match="reset"):
+                    await client.execute("INSERT INTO t SELECT * FROM s")
+
+            assert mock_ch_client.execute.call_count == 1
+            assert client.get_stats().retry.retries == 0
+
+    async def test_execute_retries_transient_error(self, config, mock_session, mock_ch_client):
+        mock_ch_client.execute = AsyncMock(side_effect=[ConnectionResetError("reset"), "OK"])
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                result = await client.execute("SELECT 1", retry=True)
+
+            assert result == "OK"
+            assert mock_ch_client.execute.call_count == 2
+            assert client.get_stats().retry.retries == 1
+            assert client.get_stats().retry.recovered == 1
+
+    async def test_fetch_does_not_retry_permanent_error(self, config, mock_session, mock_ch_client):
+        mock_ch_client.fetch = AsyncMock(side_effect=Exception("Code: 62. DB::Exception: Syntax error"))
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                with pytest.raises(DatabaseError, match="Syntax error"):
+                    await client.fetch("SELEC 1")
+
+            assert mock_ch_client.fetch.call_count == 1
+            assert client.get_stats().retry.retries == 0
+
+    async def test_fetch_gives_up_after_max_retries(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"max_retries": 2})
+        mock_ch_client.fetch = AsyncMock(side_effect=TimeoutError())
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                with pytest.raises(DatabaseError, match="Failed to fetch query results"):
+                    await client.fetch("SELECT 1")
+
+            assert mock_ch_client.fetch.call_count == 3
+            assert client.get_stats().retry.exhausted == 1
+
+    async def test_insert_batch_retry_reuses_deduplication_token(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"insert_deduplication": True})
+        mock_ch_client.execute = AsyncMock(
+            side_effect=[None, Exception("Code: 252. DB::Exception: Too many parts"), None],
+        )
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                await client.insert_batch("test_table", [{"id": 1}, {"id": 2}], batch_size=1)
+
+            queries = [call.args[0] for call in mock_ch_client.execute.call_args_list]
+            assert len(queries) == 3
+            assert queries[1] == queries[2]
+            assert queries[0] != queries[1]
+            assert re.fullmatch(
+                r"INSERT INTO test_table \(id\) SETTINGS insert_deduplication_token='[0-9a-f]{32}-2' VALUES",
+                queries[1],
+            )
+            assert client.get_stats().retry.recovered == 1
+
+    async def test_async_insert_settings(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"async_insert": True, "wait_for_async_insert": False})
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                await client.insert_batch("test_table", [{"id": 1}])
+
+            mock_ch_client.execute.assert_called_once_with(
+                "INSERT INTO test_table (id) SETTINGS async_insert=1, wait_for_async_insert=0 VALUES",
+                (1,),
+            )
+
+    async def test_insert_batch_coalesces_concurrent_calls(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"coalesce_window": 0.01})
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                await asyncio.gather(
+                    client.insert_batch("test_table", [{"id": 1}]),
+                    client.insert_batch("test_table", [{"id": 2}]),
+                )
+
+            mock_ch_client.execute.assert_called_once_with("INSERT INTO test_table (id) VALUES", (1,), (2,))
+
+    async def test_insert_batch_with_batch_size_is_not_coalesced(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"coalesce_window": 60})
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                await client.insert_batch("test_table", [{"id": 1}, {"id": 2}], batch_size=1)
+
+                assert mock_ch_client.execute.call_count == 2
+
+    async def test_exit_flushes_coalesced_rows(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"coalesce_window": 60})
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                pending = asyncio.create_task(client.insert_batch("test_table", [{"id": 1}]))
+                await asyncio.sleep(0)
+                mock_ch_client.execute.assert_not_called()
+
+            await pending
+            mock_ch_client.execute.assert_called_once_with("INSERT INTO test_table (id) VALUES", (1,))
+            mock_session.close.assert_called_once()
+
+    async def test_warm_up_opens_connections(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"warmup_connections": 3})
+        mock_ch_client.is_alive = AsyncMock(return_value=True)
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config):
+                assert mock_ch_client.is_alive.await_count == 3
+
+    async def test_warm_up_failure_does_not_fail_startup(self, config, mock_session, mock_ch_client):
+        config = config.model_copy(update={"warmup_connections": 2})
+        mock_ch_client.is_alive = AsyncMock(side_effect=[False, ConnectionRefusedError()])
+
+        with (
+            patch("shared.infrastructure.database.clickhouse_client.ClientSession") as mock_session_cls,
+            patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls,
+        ):
+            mock_session_cls.return_value = mock_session
+            mock_ch_cls.return_value = mock_ch_client
+
+            async with ClickHouseClient(config) as client:
+                assert client is not None
+
+            assert mock_ch_client.is_alive.await_count == 2
+
+    async def test_warm_up_counts_successful_probes(self):
+        ch_client = AsyncMock()
+        ch_client.is_alive = AsyncMock(side_effect=[True, False, TimeoutError()])
+
+        assert await warm_up_connections(ch_client, 3) == 1
+        assert await warm_up_connections(ch_client, 0) == 0
+
+    async def test_get_stats_reports_pool(self, config, mock_ch_client):
+        config = config.model_copy(update={"pool_limit": 7})
+
+        with patch("shared.infrastructure.database.clickhouse_client.ChClient") as mock_ch_cls:
+            mock_ch_cls.return_value = mock_ch_client
+            client = ClickHouseClient(config)
+            assert client.get_stats().pool is None
+
+            async with client:
+                stats = client.get_stats()
+
+            assert stats.pool is not None
+            assert stats.pool.limit == 7
+            assert stats.pool.in_use == 0
+            assert stats.retry.retries == 0
+            assert client.get_stats().pool is None
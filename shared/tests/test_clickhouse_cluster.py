@@ -0,0 +1,221 @@
+"""Tests for the multi-replica ClickHouse client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import ClientConnectionError
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from shared.infrastructure.database.clickhouse_client import ClickHouseClient
+from shared.infrastructure.database.clickhouse_cluster import ClickHouseClusterClient, parse_replica_address
+from shared.infrastructure.database.clickhouse_replicas import Replica, ReplicaSet, select_replica
+
+
+def replica_down() -> DatabaseError:
+    error = DatabaseError("Failed to fetch query results: connection refused")
+    error.__cause__ = ClientConnectionError("connection refused")
+    return error
+
+
+def make_clients(count: int) -> list[AsyncMock]:
+    return [AsyncMock(spec=ClickHouseClient) for _ in range(count)]
+
+
+def make_replicas(clients: list[AsyncMock]) -> list[Replica]:
+    return [Replica(f"ch{index}:8123", client) for index, client in enumerate(clients)]
+
+
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    [
+        ("ch1:8124", ("ch1", 8124)),
+        ("ch1", ("ch1", 8123)),
+        ("[::1]:9000", ("[::1]", 9000)),
+    ],
+)
+def test_parse_replica_address(address, expected):
+    assert parse_replica_address(address, default_port=8123) == expected
+
+
+class TestSelectReplica:
+    """Tests for load balancing strategies."""
+
+    def test_round_robin_cycles(self):
+        replicas = make_replicas(make_clients(3))
+
+        picks = [select_replica(replicas, "round_robin", turn).name for turn in range(4)]
+
+        assert picks == ["ch0:8123", "ch1:8123", "ch2:8123", "ch0:8123"]
+
+    def test_least_in_flight(self):
+        replicas = make_replicas(make_clients(3))
+        replicas[0].in_flight = 2
+        replicas[2].in_flight = 1
+
+        assert select_replica(replicas, "least_in_flight", 0) is replicas[1]
+
+    def test_latency_weights_by_inverse_latency(self):
+        replicas = make_replicas(make_clients(2))
+        replicas[0].latency = 0.01
+        replicas[1].latency = 0.1
+
+        with patch("shared.infrastructure.database.clickhouse_replicas.random.choices") as choices:
+            choices.return_value = [replicas[0]]
+            assert select_replica(replicas, "latency", 0) is replicas[0]
+
+        weights = choices.call_args.kwargs["weights"]
+        assert weights[0] == pytest.approx(10 * weights[1])
+
+
+@pytest.mark.anyio
+class TestReplicaSet:
+    """Tests for failover and ejection."""
+
+    async def test_call_fails_over_on_replica_failure(self):
+        clients = make_clients(2)
+        replicas = make_replicas(clients)
+        clients[0].fetch.side_effect = replica_down()
+        clients[1].fetch.return_value = [{"x": 1}]
+        replica_set = ReplicaSet(replicas, strategy="round_robin", failure_threshold=3)
+
+        result = await replica_set.call(replicas, lambda client: client.fetch("SELECT 1"))
+
+        assert result == [{"x": 1}]
+        assert replicas[0].failures == 1
+        assert replicas[0].healthy is True
+        assert replicas[1].latency > 0
+
+    async def test_query_error_is_not_failed_over(self):
+        clients = make_clients(2)
+        replicas = make_replicas(clients)
+        clients[0].fetch.side_effect = DatabaseError("Code: 62. Syntax error")
+        replica_set = ReplicaSet(replicas, strategy="round_robin", failure_threshold=1)
+
+        with pytest.raises(DatabaseError, match="Syntax error"):
+            await replica_set.call(replicas, lambda client: client.fetch("SELEC 1"))
+
+        clients[1].fetch.assert_not_awaited()
+        assert replicas[0].healthy is True
+
+    async def test_ejects_after_threshold_and_skips_replica(self):
+        clients = make_clients(2)
+        replicas = make_replicas(clients)
+        clients[0].fetch.side_effect = replica_down()
+        replica_set = ReplicaSet(replicas, strategy="round_robin", failure_threshold=2)
+
+        for _ in range(2):
+            await replica_set.call(replicas, lambda client: client.fetch("SELECT 1"))
+
+        assert replicas[0].healthy is False
+        assert replica_set.for_reads() == [replicas[1]]
+        assert replica_set.for_writes() == [replicas[1]]
+
+    async def test_all_ejected_falls_back_to_every_replica(self):
+        replicas = make_replicas(make_clients(2))
+        for replica in replicas:
+            replica.healthy = False
+        replica_set = ReplicaSet(replicas, strategy="round_robin", failure_threshold=1)
+
+        assert replica_set.for_writes() == replicas
+
+        await replica_set.run(replicas[0], lambda client: client.execute("SELECT 1"))
+
+        assert replicas[0].healthy is True
+
+    async def test_watch_reinstates_recovered_replica(self):
+        clients = make_clients(2)
+        replicas = make_replicas(clients)
+        replicas[1].healthy = False
+        replica_set = ReplicaSet(replicas, strategy="round_robin", failure_threshold=1)
+
+        task = asyncio.create_task(replica_set.watch(0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        assert replicas[1].healthy is True
+        clients[1].execute.assert_awaited_with("SELECT 1")
+        clients[0].execute.assert_not_awaited()
+
+    async def test_stream_tracks_in_flight(self):
+        replicas = make_replicas(make_clients(1))
+
+        async def rows():
+            assert replicas[0].in_flight == 1
+            yield {"x": 1}
+
+        replicas[0].client = MagicMock()
+        replicas[0].client.iterate = lambda *_: rows()
+        replica_set = ReplicaSet(replicas, strategy="round_robin", failure_threshold=1)
+
+        result = [row async for row in replica_set.stream(replicas[0], lambda client: client.iterate("SELECT 1"))]
+
+        assert result == [{"x": 1}]
+        assert replicas[0].in_flight == 0
+
+
+@pytest.mark.anyio
+class TestClickHouseClusterClient:
+    """Tests for ClickHouseClusterClient."""
+
+    @pytest.fixture
+    def config(self):
+        return ClickHouseConfig(replicas=["ch1:8123", "ch2:8123"])
+
+    @pytest.fixture
+    def replica_clients(self):
+        clients = [AsyncMock(get_stats=MagicMock()), AsyncMock(get_stats=MagicMock())]
+        with patch("shared.infrastructure.database.clickhouse_cluster.ClickHouseClient", side_effect=clients) as cls:
+            yield cls, clients
+
+    async def test_creates_client_per_replica(self, config, replica_clients):
+        cls, clients = replica_clients
+
+        async with ClickHouseClusterClient(config):
+            pass
+
+        hosts = [(call.args[0].host, call.args[0].port, call.args[0].replicas) for call in cls.call_args_list]
+        assert hosts == [("ch1", 8123, []), ("ch2", 8123, [])]
+        for client in clients:
+            client.__aenter__.assert_awaited_once()
+            client.__aexit__.assert_awaited_once()
+
+    async def test_failed_replica_closes_opened_ones(self, config, replica_clients):
+        _, clients = replica_clients
+        clients[1].__aenter__.side_effect = DatabaseError("ch2 unreachable")
+
+        with pytest.raises(DatabaseError, match="ch2 unreachable"):
+            await ClickHouseClusterClient(config).__aenter__()
+
+        clients[0].__aexit__.assert_awaited_once()
+        clients[1].__aexit__.assert_not_awaited()
+
+    async def test_fetch_round_robins_over_replicas(self, config, replica_clients):
+        _, clients = replica_clients
+
+        async with ClickHouseClusterClient(config) as cluster:
+            for _ in range(4):
+                await cluster.fetch("SELECT 1")
+
+        assert [client.fetch.await_count for client in clients] == [2, 2]
+
+    async def test_inserts_go_to_first_healthy_replica(self, config, replica_clients):
+        _, clients = replica_clients
+        clients[0].insert_stream.side_effect = replica_down()
+
+        async with ClickHouseClusterClient(config.model_copy(update={"replica_failure_threshold": 1})) as cluster:
+            with pytest.raises(DatabaseError):
+                await cluster.insert_stream("t", [{"id": 1}])
+            await cluster.insert_batch("t", [{"id": 1}])
+
+        clients[1].insert_stream.assert_not_awaited()
+        clients[1].insert_batch.assert_awaited_once_with("t", [{"id": 1}], None, None)
+        assert cluster.get_stats().replicas["ch1:8123"].healthy is False
+
+    async def test_falls_back_to_host_and_port(self, replica_clients):
+        cls, _ = replica_clients
+
+        ClickHouseClusterClient(ClickHouseConfig(host="ch", port=8123))
+
+        assert cls.call_args.args[0].host == "ch"
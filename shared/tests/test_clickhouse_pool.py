@@ -0,0 +1,62 @@
+"""Tests for ClickHouse connection pool helpers."""
+
+from collections import OrderedDict, deque
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from shared.infrastructure.database.clickhouse_pool import (
+    PoolStats,
+    create_connector,
+    create_timeout,
+    get_pool_stats,
+)
+
+
+@pytest.mark.anyio
+async def test_create_connector_uses_config():
+    config = ClickHouseConfig(pool_limit=20, pool_limit_per_host=5, keepalive_timeout=60, dns_cache_ttl=30)
+
+    connector = create_connector(config)
+    try:
+        assert connector.limit == 20
+        assert connector.limit_per_host == 5
+        assert connector.use_dns_cache is True
+    finally:
+        await connector.close()
+
+
+@pytest.mark.anyio
+async def test_create_connector_without_dns_cache():
+    connector = create_connector(ClickHouseConfig(dns_cache_ttl=0))
+    try:
+        assert connector.use_dns_cache is False
+    finally:
+        await connector.close()
+
+
+def test_create_timeout():
+    timeout = create_timeout(ClickHouseConfig(connect_timeout=3, read_timeout=30))
+
+    assert timeout.total is None
+    assert timeout.connect == 3
+    assert timeout.sock_read == 30
+
+
+@pytest.mark.anyio
+async def test_get_pool_stats_fresh_connector():
+    connector = create_connector(ClickHouseConfig(pool_limit=10))
+    try:
+        assert get_pool_stats(connector) == PoolStats(limit=10, limit_per_host=0, in_use=0, idle=0, waiting=0)
+    finally:
+        await connector.close()
+
+
+def test_get_pool_stats_counts_connections():
+    connector = MagicMock(limit=10, limit_per_host=2)
+    connector._acquired = {object(), object()}
+    connector._conns = {"a": deque([(object(), 0.0)]), "b": deque([(object(), 0.0), (object(), 0.0)])}
+    connector._waiters = {"a": OrderedDict.fromkeys([object(), object()])}
+
+    assert get_pool_stats(connector) == PoolStats(limit=10, limit_per_host=2, in_use=2, idle=3, waiting=2)
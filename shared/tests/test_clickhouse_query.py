@@ -0,0 +1,136 @@
+"""Tests for ClickHouse query parameters and templates."""
+
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.database.clickhouse_query import (
+    QueryRegistry,
+    QueryTemplate,
+    build_query_params,
+    decode_records,
+    fetch_with_params,
+    format_query_param,
+    iterate_with_params,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (1111111, "1111111"),
+        (1.5, "1.5"),
+        (True, "true"),
+        (None, r"\N"),
+        ("a\tb\\c\nd", r"a\tb\\c\nd"),
+        (date(2025, 1, 1), "2025-01-01"),
+        (datetime(2025, 1, 1, 12, 30), "2025-01-01 12:30:00"),  # noqa: DTZ001
+        (["it's", None], r"['it\'s',NULL]"),
+        ((1, "a"), "(1,'a')"),
+        ([date(2025, 1, 1)], "['2025-01-01']"),
+    ],
+)
+def test_format_query_param(value, expected):
+    assert format_query_param(value) == expected
+
+
+def test_build_query_params():
+    assert build_query_params({"campaign_id": 1, "phrase": "x"}) == {"param_campaign_id": "1", "param_phrase": "x"}
+
+
+def test_build_query_params_rejects_invalid_name():
+    with pytest.raises(DatabaseError, match="Invalid SQL identifier"):
+        build_query_params({"id; DROP": 1})
+
+
+def test_decode_records():
+    payload = b"phrase\tviews_by_hour\nString\tArray(Tuple(UInt8, Int64))\nx\\ty\t[(12,1),(13,3)]\n"
+
+    records = decode_records(payload)
+
+    assert [dict(record) for record in records] == [{"phrase": "x\ty", "views_by_hour": [(12, 1), (13, 3)]}]
+
+
+def test_decode_records_without_rows():
+    assert decode_records(b"id\nUInt8\n") == []
+    assert decode_records(b"") == []
+
+
+@pytest.mark.anyio
+async def test_fetch_with_params_binds_on_server():
+    transport = AsyncMock()
+    transport.post.return_value = b"id\nUInt32\n7\n"
+
+    records = await fetch_with_params(transport, "SELECT {id:UInt32} AS id\n", {"id": 7})
+
+    assert [record["id"] for record in records] == [7]
+    transport.post.assert_awaited_once_with(
+        "SELECT {id:UInt32} AS id\nFORMAT TSVWithNamesAndTypes",
+        settings={"param_id": "7"},
+    )
+
+
+async def _lines(*lines):  # noqa: ANN002
+    for line in lines:
+        yield line
+
+
+@pytest.mark.anyio
+async def test_iterate_with_params_decodes_streamed_rows():
+    transport = MagicMock()
+    transport.stream_lines.return_value = _lines(b"id\n", b"UInt32\n", b"1\n", b"2\n")
+
+    records = [record["id"] async for record in iterate_with_params(transport, "SELECT id", {"a": [1, 2]})]
+
+    assert records == [1, 2]
+    transport.stream_lines.assert_called_once_with(
+        "SELECT id\nFORMAT TSVWithNamesAndTypes",
+        settings={"param_a": "[1,2]"},
+    )
+
+
+@pytest.mark.anyio
+async def test_iterate_with_params_empty_response():
+    transport = MagicMock()
+    transport.stream_lines.return_value = _lines()
+
+    assert [record async for record in iterate_with_params(transport, "SELECT id", {})] == []
+
+
+class TestQueryTemplate:
+    """Tests for QueryTemplate and QueryRegistry."""
+
+    def test_placeholders(self):
+        template = QueryTemplate("t", "SELECT * FROM t WHERE a = {a:Int32} AND b IN {b:Array(String)}")
+
+        assert template.placeholders == {"a", "b"}
+
+    def test_bind_returns_values(self):
+        template = QueryTemplate("t", "SELECT {a:Int32}")
+
+        assert template.bind(a=1) == {"a": 1}
+
+    @pytest.mark.parametrize("values", [{}, {"a": 1, "b": 2}])
+    def test_bind_rejects_mismatch(self, values):
+        template = QueryTemplate("t", "SELECT {a:Int32}")
+
+        with pytest.raises(DatabaseError, match="parameters mismatch"):
+            template.bind(**values)
+
+    def test_registry(self):
+        registry = QueryRegistry()
+        template = registry.register("t", "SELECT 1")
+
+        assert registry.get("t") is template
+        assert list(registry) == [template]
+
+    def test_registry_rejects_duplicates_and_unknown_names(self):
+        registry = QueryRegistry()
+        registry.register("t", "SELECT 1")
+
+        with pytest.raises(DatabaseError, match="already registered"):
+            registry.register("t", "SELECT 2")
+        with pytest.raises(DatabaseError, match="Unknown query template"):
+            registry.get("missing")
@@ -0,0 +1,128 @@
+"""Tests for ClickHouse HTTP transport."""
+
+import gzip
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from shared.infrastructure.database.clickhouse_transport import ClickHouseHTTPTransport
+
+
+async def _iterate(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _make_session(status=200, body=b"", chunks=()):
+    response = MagicMock()
+    response.status = status
+    response.read = AsyncMock(return_value=body)
+    response.content.iter_any = lambda: _iterate(chunks)
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=None)
+    session = MagicMock()
+    session.post = MagicMock(return_value=context)
+    return session
+
+
+@pytest.fixture
+def config():
+    return ClickHouseConfig(host="ch", port=8123, user="default", password="secret", database="test_db")
+
+
+@pytest.mark.anyio
+async def test_post_with_data_puts_query_in_url(config):
+    session = _make_session(body=b"ok")
+    transport = ClickHouseHTTPTransport(session, config)
+
+    result = await transport.post("INSERT INTO t (a) FORMAT RowBinary", b"\x01", settings={"async_insert": 1})
+
+    assert result == b"ok"
+    call = session.post.call_args
+    assert call.args == ("http://ch:8123",)
+    assert call.kwargs["params"] == {
+        "database": "test_db",
+        "async_insert": 1,
+        "query": "INSERT INTO t (a) FORMAT RowBinary",
+    }
+    assert call.kwargs["data"] == b"\x01"
+    assert call.kwargs["headers"] == {"X-ClickHouse-User": "default", "X-ClickHouse-Key": "secret"}
+
+
+@pytest.mark.anyio
+async def test_post_without_data_sends_query_as_body(config):
+    session = _make_session()
+    transport = ClickHouseHTTPTransport(session, config)
+
+    await transport.post("SELECT 1")
+
+    call = session.post.call_args
+    assert call.kwargs["params"] == {"database": "test_db"}
+    assert call.kwargs["data"] == b"SELECT 1"
+
+
+@pytest.mark.anyio
+async def test_post_error_status(config):
+    session = _make_session(status=500, body=b"Code: 62. DB::Exception: Syntax error\n")
+    transport = ClickHouseHTTPTransport(session, config)
+
+    with pytest.raises(DatabaseError, match="ClickHouse HTTP 500: Code: 62"):
+        await transport.post("SELEC 1")
+
+
+@pytest.mark.anyio
+async def test_post_compresses_data_body(config):
+    config = config.model_copy(update={"http_compression": "gzip"})
+    session = _make_session()
+    transport = ClickHouseHTTPTransport(session, config)
+
+    await transport.post("INSERT INTO t (a) VALUES", b"(1),(2)")
+
+    call = session.post.call_args
+    assert gzip.decompress(call.kwargs["data"]) == b"(1),(2)"
+    assert call.kwargs["headers"]["Content-Encoding"] == "gzip"
+
+
+@pytest.mark.anyio
+async def test_post_does_not_compress_query_body(config):
+    config = config.model_copy(update={"http_compression": "gzip"})
+    session = _make_session()
+    transport = ClickHouseHTTPTransport(session, config)
+
+    await transport.post("SELECT 1")
+
+    call = session.post.call_args
+    assert call.kwargs["data"] == b"SELECT 1"
+    assert "Content-Encoding" not in call.kwargs["headers"]
+
+
+def test_compress_response_enables_http_compression(config):
+    config = config.model_copy(update={"compress_response": True})
+    transport = ClickHouseHTTPTransport(_make_session(), config)
+
+    assert transport._params["enable_http_compression"] == "1"
+
+
+@pytest.mark.anyio
+async def test_stream_lines_rejoins_lines_split_across_chunks(config):
+    session = _make_session(chunks=[b"id\nUIn", b"t8\n1\n2", b"\n"])
+    transport = ClickHouseHTTPTransport(session, config)
+
+    lines = [line async for line in transport.stream_lines("SELECT id", settings={"param_x": "1"})]
+
+    assert lines == [b"id\n", b"UInt8\n", b"1\n", b"2\n"]
+    call = session.post.call_args
+    assert call.kwargs["params"] == {"database": "test_db", "param_x": "1"}
+    assert call.kwargs["data"] == b"SELECT id"
+
+
+@pytest.mark.anyio
+async def test_stream_lines_error_status(config):
+    session = _make_session(status=404, body=b"Code: 60. DB::Exception: Unknown table")
+    transport = ClickHouseHTTPTransport(session, config)
+
+    with pytest.raises(DatabaseError, match="ClickHouse HTTP 404: Code: 60"):
+        await anext(transport.stream_lines("SELECT * FROM missing"))
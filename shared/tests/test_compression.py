@@ -0,0 +1,62 @@
+"""Tests for HTTP body compression."""
+
+import gzip
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.domain.entities.exceptions import ConfigurationError
+from shared.infrastructure.database.compression import get_compressor
+
+
+def test_none_disables_compression():
+    assert get_compressor("none") is None
+
+
+def test_gzip_roundtrip():
+    compress = get_compressor("gzip")
+
+    assert compress is not None
+    assert gzip.decompress(compress(b"payload" * 100)) == b"payload" * 100
+
+
+def test_zstd_uses_optional_library():
+    zstandard = MagicMock()
+    zstandard.ZstdCompressor.return_value.compress.return_value = b"zstd"
+
+    with patch("shared.infrastructure.database.compression.importlib.import_module", return_value=zstandard):
+        compress = get_compressor("zstd")
+        assert compress is not None
+        assert compress(b"data") == b"zstd"
+
+    zstandard.ZstdCompressor.return_value.compress.assert_called_once_with(b"data")
+
+
+def test_lz4_uses_frame_module():
+    lz4_frame = MagicMock()
+
+    with patch(
+        "shared.infrastructure.database.compression.importlib.import_module",
+        return_value=lz4_frame,
+    ) as import_module:
+        compress = get_compressor("lz4")
+
+    import_module.assert_called_once_with("lz4.frame")
+    assert compress is lz4_frame.compress
+
+
+@pytest.mark.parametrize(("method", "package"), [("zstd", "zstandard"), ("lz4", "lz4")])
+def test_missing_optional_library(method, package):
+    with (
+        patch(
+            "shared.infrastructure.database.compression.importlib.import_module",
+            side_effect=ImportError("missing"),
+        ),
+        pytest.raises(ConfigurationError, match=f"requires the '{package}' package"),
+    ):
+        get_compressor(method)
+
+
+def test_unknown_method():
+    with pytest.raises(ConfigurationError, match="Unknown compression method"):
+        get_compressor("brotli")
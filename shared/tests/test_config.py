@@ -3,6 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
+from shared.infrastructure.config.cache import CacheConfig
 from shared.infrastructure.config.clickhouse import ClickHouseConfig
 from shared.infrastructure.config.github import GitHubConfig
 from shared.infrastructure.config.postgres import PostgresConfig
@@ -37,6 +38,28 @@ def test_clickhouse_config_defaults(monkeypatch):
     assert config.port == 9000
     assert config.database == "test"
     assert config.batch_size == 1000
+    assert config.insert_concurrency == 1
+    assert config.insert_format == "values"
+    assert config.http_compression == "none"
+    assert config.compress_response is False
+    assert config.max_retries == 3
+    assert config.insert_deduplication is True
+    assert config.async_insert is False
+    assert config.coalesce_window == 0
+    assert config.buffer_max_rows == 10_000
+    assert config.pool_limit == 100
+    assert config.keepalive_timeout == 15.0
+    assert config.read_timeout == 300.0
+
+
+def test_clickhouse_config_validates_insert_concurrency():
+    with pytest.raises(ValidationError):
+        ClickHouseConfig(insert_concurrency=0)
+
+
+def test_clickhouse_config_validates_retry_backoff():
+    with pytest.raises(ValidationError):
+        ClickHouseConfig(retry_backoff_base=0)
 
 
 def test_clickhouse_config_validates_port():
@@ -44,6 +67,19 @@ def test_clickhouse_config_validates_port():
         ClickHouseConfig(port=99999)
 
 
+def test_cache_config_defaults():
+    config = CacheConfig(_env_file=None)
+
+    assert config.enabled is True
+    assert config.ttl == 600
+    assert config.aligned is True
+
+
+def test_cache_config_validates_ttl():
+    with pytest.raises(ValidationError):
+        CacheConfig(ttl=0)
+
+
 def test_github_config_requires_access_token(monkeypatch):
     monkeypatch.delenv("GITHUB_ACCESS_TOKEN", raising=False)
 
@@ -1,9 +1,11 @@
 """Tests for health check router."""
 
+import asyncio
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from shared.presentation.fastapi.health import create_health_router
+from shared.presentation.fastapi.health import create_health_router, run_health_checks
 
 
 @pytest.fixture
@@ -27,3 +29,56 @@ async def test_health_check_endpoint(health_app) -> None:
     data = response.json()
     assert data["status"] == "healthy"
     assert data["version"] == "1.2.3"
+
+
+@pytest.mark.anyio
+async def test_health_check_reports_dependencies(health_app) -> None:
+    async def healthy_probe() -> None:
+        return None
+
+    health_app.state.health_checks = {"clickhouse": healthy_probe}
+
+    async with AsyncClient(transport=ASGITransport(app=health_app), base_url="http://test") as client:
+        response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["checks"] == {"clickhouse": "ok"}
+
+
+@pytest.mark.anyio
+async def test_health_check_failed_dependency(health_app) -> None:
+    async def failing_probe() -> None:
+        msg = "connection refused"
+        raise ConnectionError(msg)
+
+    async def healthy_probe() -> None:
+        return None
+
+    health_app.state.health_checks = {"clickhouse": failing_probe, "cache": healthy_probe}
+
+    async with AsyncClient(transport=ASGITransport(app=health_app), base_url="http://test") as client:
+        response = await client.get("/health")
+
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "unhealthy"
+    assert data["checks"] == {"clickhouse": "unavailable", "cache": "ok"}
+
+
+@pytest.mark.anyio
+async def test_run_health_checks_times_out() -> None:
+    async def hanging_probe() -> None:
+        await asyncio.sleep(10)
+
+    assert await run_health_checks({"slow": hanging_probe}, timeout=0.01) == {"slow": "unavailable"}
+
+
+@pytest.mark.anyio
+async def test_health_check_includes_stats(health_app) -> None:
+    health_app.state.health_stats = {"clickhouse": lambda: {"pool": {"in_use": 1, "idle": 2}}}
+
+    async with AsyncClient(transport=ASGITransport(app=health_app), base_url="http://test") as client:
+        response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["stats"] == {"clickhouse": {"pool": {"in_use": 1, "idle": 2}}}
@@ -0,0 +1,90 @@
+"""Tests for insert coalescer."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.database.insert_coalescer import InsertCoalescer
+
+
+@pytest.mark.anyio
+class TestInsertCoalescer:
+    """Tests for InsertCoalescer."""
+
+    async def test_concurrent_submits_are_merged(self):
+        insert = AsyncMock(return_value=3)
+        coalescer = InsertCoalescer(insert, window=0.01, max_rows=100)
+
+        await asyncio.gather(
+            coalescer.submit("t", [{"id": 1}]),
+            coalescer.submit("t", [{"id": 2}, {"id": 3}]),
+        )
+
+        insert.assert_awaited_once_with("t", [{"id": 1}, {"id": 2}, {"id": 3}], schema=None)
+
+    async def test_groups_by_table_and_columns(self):
+        insert = AsyncMock()
+        coalescer = InsertCoalescer(insert, window=0.01, max_rows=100)
+
+        await asyncio.gather(
+            coalescer.submit("t1", [{"id": 1}]),
+            coalescer.submit("t2", [{"id": 2}]),
+            coalescer.submit("t1", [{"name": "a"}]),
+        )
+
+        assert insert.await_count == 3
+
+    async def test_max_rows_flushes_before_window(self):
+        insert = AsyncMock()
+        coalescer = InsertCoalescer(insert, window=60, max_rows=2)
+
+        await asyncio.wait_for(
+            asyncio.gather(coalescer.submit("t", [{"id": 1}]), coalescer.submit("t", [{"id": 2}])),
+            timeout=1,
+        )
+
+        insert.assert_awaited_once_with("t", [{"id": 1}, {"id": 2}], schema=None)
+
+    async def test_error_reaches_every_waiter(self):
+        insert = AsyncMock(side_effect=DatabaseError("insert failed"))
+        coalescer = InsertCoalescer(insert, window=0.01, max_rows=100)
+
+        results = await asyncio.gather(
+            coalescer.submit("t", [{"id": 1}]),
+            coalescer.submit("t", [{"id": 2}]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, DatabaseError) for result in results)
+        assert insert.await_count == 1
+
+    async def test_close_flushes_pending_rows(self):
+        insert = AsyncMock()
+        coalescer = InsertCoalescer(insert, window=60, max_rows=100)
+
+        waiter = asyncio.create_task(coalescer.submit("t", [{"id": 1}], schema={"id": "UInt8"}))
+        await asyncio.sleep(0)
+        await coalescer.close()
+        await waiter
+
+        insert.assert_awaited_once_with("t", [{"id": 1}], schema={"id": "UInt8"})
+
+    async def test_submit_after_close_fails(self):
+        coalescer = InsertCoalescer(AsyncMock(), window=0.01, max_rows=100)
+        await coalescer.close()
+
+        with pytest.raises(DatabaseError, match="coalescer is closed"):
+            await coalescer.submit("t", [{"id": 1}])
+
+    async def test_cancelled_waiter_does_not_cancel_flush(self):
+        insert = AsyncMock()
+        coalescer = InsertCoalescer(insert, window=0.01, max_rows=100)
+
+        cancelled = asyncio.create_task(coalescer.submit("t", [{"id": 1}]))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await coalescer.submit("t", [{"id": 2}])
+
+        insert.assert_awaited_once_with("t", [{"id": 1}, {"id": 2}], schema=None)
@@ -0,0 +1,148 @@
+"""Tests for the PostgreSQL-backed token bucket."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock
+
+import asyncpg
+import pytest
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.database.postgres_pool import PostgreSQLPool
+from shared.infrastructure.rate_limiting.postgres_bucket import (
+    CREATE_TABLE,
+    LEASE_TOKENS,
+    LEASE_TTL,
+    PostgresTokenBucketRateLimiter,
+)
+
+
+class FakePool(PostgreSQLPool):
+    """Pool handing out one mock connection whose fetchrow returns rows in order."""
+
+    def __init__(self, *rows) -> None:  # noqa: ANN002
+        self.connection = AsyncMock()
+        self.connection.fetchrow.side_effect = list(rows)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        yield self.connection
+
+
+def lease(granted, tokens):
+    return {"granted": granted, "tokens": tokens}
+
+
+@pytest.mark.anyio
+async def test_one_round_trip_serves_a_lease():
+    pool = FakePool(lease(granted=4, tokens=6.0))
+    limiter = PostgresTokenBucketRateLimiter(pool, "github", rate=10, lease_size=4)
+
+    for _ in range(4):
+        await limiter.acquire()
+
+    pool.connection.fetchrow.assert_awaited_once_with(LEASE_TOKENS, "github", 10.0, 10.0, 4.0)
+
+
+@pytest.mark.anyio
+async def test_waits_for_shared_bucket_to_refill():
+    pool = FakePool(lease(granted=0, tokens=0.5), lease(granted=1, tokens=0.0))
+    limiter = PostgresTokenBucketRateLimiter(pool, "github", rate=10, lease_size=1)
+    start_time = time.monotonic()
+
+    await limiter.acquire()
+
+    # Half a token was missing at 10 tokens per second
+    assert 0.04 <= time.monotonic() - start_time < 0.2
+    assert pool.connection.fetchrow.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_weighted_acquire_leases_missing_tokens():
+    pool = FakePool(lease(granted=1, tokens=0.0), lease(granted=5, tokens=0.0))
+    limiter = PostgresTokenBucketRateLimiter(pool, "github", rate=1000, burst=10, lease_size=1)
+
+    await limiter.acquire()
+    await limiter.acquire(5)
+
+    assert pool.connection.fetchrow.await_args.args[-1] == 5.0
+
+
+@pytest.mark.anyio
+async def test_expired_lease_is_dropped():
+    pool = FakePool(lease(granted=4, tokens=0.0), lease(granted=4, tokens=0.0))
+    limiter = PostgresTokenBucketRateLimiter(pool, "github", rate=10, lease_size=4)
+    await limiter.acquire()
+
+    limiter._leased_at -= LEASE_TTL + 1
+    await limiter.acquire()
+
+    assert pool.connection.fetchrow.await_count == 2
+
+
+async def start_waiting_acquire(limiter, pool, n):
+    """Start an acquire of n tokens and return once it sleeps after its first lease."""
+    task = asyncio.create_task(limiter.acquire(n))
+    while not pool.connection.fetchrow.await_count:
+        await asyncio.sleep(0)
+    return task
+
+
+@pytest.mark.anyio
+async def test_waiting_caller_keeps_partial_lease_past_ttl():
+    pool = FakePool(lease(granted=2, tokens=0.0), lease(granted=3, tokens=0.0))
+    limiter = PostgresTokenBucketRateLimiter(pool, "github", rate=100, burst=10, lease_size=1)
+    waiting = await start_waiting_acquire(limiter, pool, 5)
+
+    limiter._leased_at -= LEASE_TTL + 1
+    await waiting
+
+    assert pool.connection.fetchrow.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_later_callers_do_not_take_tokens_of_a_waiting_caller():
+    pool = FakePool(lease(granted=2, tokens=0.0), lease(granted=3, tokens=0.0), lease(granted=1, tokens=0.0))
+    limiter = PostgresTokenBucketRateLimiter(pool, "github", rate=100, burst=10, lease_size=1)
+    waiting = await start_waiting_acquire(limiter, pool, 5)
+
+    assert not await limiter.try_acquire()
+    later = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not later.done()
+
+    await asyncio.gather(waiting, later)
+    assert pool.connection.fetchrow.await_count == 3
+
+
+@pytest.mark.anyio
+async def test_lease_errors_raise_database_error():
+    pool = FakePool(asyncpg.PostgresError("relation does not exist"))
+    limiter = PostgresTokenBucketRateLimiter(pool, "github", rate=10)
+
+    with pytest.raises(DatabaseError, match="Failed to lease tokens from rate limit bucket github"):
+        await limiter.acquire()
+
+
+@pytest.mark.anyio
+async def test_try_acquire_does_not_wait():
+    pool = FakePool(lease(granted=0, tokens=0.2))
+    limiter = PostgresTokenBucketRateLimiter(pool, "github", rate=1)
+
+    assert not await limiter.try_acquire()
+
+    with pytest.raises(ValueError, match="between 1 and burst"):
+        await limiter.try_acquire(2)
+
+
+@pytest.mark.anyio
+async def test_create_table():
+    pool = FakePool()
+    limiter = PostgresTokenBucketRateLimiter(pool, "github", rate=1)
+
+    await limiter.create_table()
+
+    pool.connection.execute.assert_awaited_once_with(CREATE_TABLE)
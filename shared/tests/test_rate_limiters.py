@@ -5,6 +5,7 @@ import time
 
 import pytest
 
+from shared.infrastructure.rate_limiting import token_bucket
 from shared.infrastructure.rate_limiting.composite_limiter import CompositeRateLimiter
 from shared.infrastructure.rate_limiting.semaphore_limiter import SemaphoreRateLimiter
 from shared.infrastructure.rate_limiting.token_bucket import TokenBucketRateLimiter
@@ -100,3 +101,202 @@ async def test_token_bucket_release_is_noop():
     limiter = TokenBucketRateLimiter(rate=5, burst=5)
     await limiter.acquire()
     await limiter.release()
+
+
+@pytest.mark.anyio
+async def test_token_bucket_serves_waiters_in_fifo_order():
+    limiter = TokenBucketRateLimiter(rate=100, burst=1)
+    order = []
+
+    async def acquire(index):
+        await limiter.acquire()
+        order.append(index)
+
+    await asyncio.gather(*(acquire(index) for index in range(10)))
+
+    assert order == list(range(10))
+
+
+@pytest.mark.anyio
+async def test_token_bucket_spaces_concurrent_waiters_at_rate():
+    limiter = TokenBucketRateLimiter(rate=50, burst=1)
+    start_time = time.monotonic()
+
+    await asyncio.gather(*(limiter.acquire() for _ in range(11)))
+
+    # One immediate token, then ten more at 20 ms intervals
+    assert 0.2 <= time.monotonic() - start_time < 0.3
+
+
+@pytest.mark.anyio
+async def test_token_bucket_cancelled_waiter_returns_reservation():
+    limiter = TokenBucketRateLimiter(rate=10, burst=1)
+    await limiter.acquire()
+    start_time = time.monotonic()
+
+    cancelled = asyncio.create_task(limiter.acquire())
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    await waiting
+
+    # The second waiter takes the first slot instead of waiting for its own
+    assert time.monotonic() - start_time < 0.15
+    assert cancelled.cancelled()
+
+
+@pytest.mark.anyio
+async def test_token_bucket_weighted_acquire_consumes_n_tokens():
+    limiter = TokenBucketRateLimiter(rate=10, burst=5)
+    start_time = time.monotonic()
+
+    await limiter.acquire(5)
+    await limiter.acquire(2)
+
+    # The burst is spent at once, two more tokens take two intervals
+    assert 0.15 <= time.monotonic() - start_time < 0.3
+
+
+@pytest.mark.anyio
+async def test_token_bucket_try_acquire_does_not_consume_on_refusal():
+    limiter = TokenBucketRateLimiter(rate=10, burst=5)
+
+    assert await limiter.try_acquire(3)
+    assert not await limiter.try_acquire(3)
+    assert await limiter.try_acquire(2)
+    assert not await limiter.try_acquire()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("n", [0, 6])
+async def test_token_bucket_rejects_weight_outside_burst(n):
+    limiter = TokenBucketRateLimiter(rate=10, burst=5)
+
+    with pytest.raises(ValueError, match="between 1 and burst"):
+        await limiter.acquire(n)
+
+
+@pytest.mark.anyio
+async def test_semaphore_weighted_acquire_and_release():
+    limiter = SemaphoreRateLimiter(max_concurrent=4)
+
+    await limiter.acquire(3)
+    assert not await limiter.try_acquire(2)
+    assert await limiter.try_acquire(1)
+
+    await limiter.release(3)
+    assert await limiter.try_acquire(3)
+
+    with pytest.raises(ValueError, match="between 1 and max_concurrent"):
+        await limiter.acquire(5)
+
+
+@pytest.mark.anyio
+async def test_semaphore_large_waiter_is_not_starved():
+    limiter = SemaphoreRateLimiter(max_concurrent=2)
+    await limiter.acquire()
+    order = []
+
+    async def acquire(name, n):
+        await limiter.acquire(n)
+        order.append(name)
+
+    large = asyncio.create_task(acquire("large", 2))
+    await asyncio.sleep(0)
+    small = asyncio.create_task(acquire("small", 1))
+    await asyncio.sleep(0)
+
+    # A permit is free, but the small request queues behind the large one
+    assert order == []
+    await limiter.release()
+    await large
+    await limiter.release(2)
+    await small
+
+    assert order == ["large", "small"]
+
+
+@pytest.mark.anyio
+async def test_semaphore_cancelled_waiter_unblocks_queue():
+    limiter = SemaphoreRateLimiter(max_concurrent=2)
+    await limiter.acquire()
+
+    large = asyncio.create_task(limiter.acquire(2))
+    await asyncio.sleep(0)
+    small = asyncio.create_task(limiter.acquire(1))
+    await asyncio.sleep(0)
+    large.cancel()
+
+    await asyncio.wait_for(small, timeout=1)
+    assert large.cancelled()
+
+
+@pytest.mark.anyio
+async def test_composite_try_acquire_releases_on_refusal():
+    semaphore = SemaphoreRateLimiter(max_concurrent=5)
+    limiter = CompositeRateLimiter(semaphore, TokenBucketRateLimiter(rate=10, burst=2))
+
+    assert await limiter.try_acquire(2)
+    assert not await limiter.try_acquire(2)
+
+    # The semaphore permits taken before the bucket refused were returned
+    assert await semaphore.try_acquire(3)
+
+
+@pytest.mark.anyio
+async def test_composite_acquire_releases_when_cancelled():
+    semaphore = SemaphoreRateLimiter(max_concurrent=2)
+    bucket = TokenBucketRateLimiter(rate=1, burst=1)
+    limiter = CompositeRateLimiter(semaphore, bucket)
+    await bucket.acquire()
+
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert await semaphore.try_acquire(2)
+
+
+@pytest.mark.anyio
+async def test_token_bucket_retune_rearms_waiters():
+    limiter = TokenBucketRateLimiter(rate=1, burst=1)
+    await limiter.acquire()
+    start_time = time.monotonic()
+
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    limiter.retune(100)
+    await waiting
+
+    assert time.monotonic() - start_time < 0.5
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = time.monotonic()
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.mark.anyio
+async def test_token_bucket_stall_releases_at_most_a_burst(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(token_bucket, "time", clock)
+    limiter = TokenBucketRateLimiter(rate=5, burst=5)
+    for _ in range(5):
+        assert await limiter.try_acquire()
+    waiters = [asyncio.create_task(limiter.acquire()) for _ in range(20)]
+    await asyncio.sleep(0)
+
+    # The event loop stalls for four seconds, then the timer fires late
+    clock.now += 4
+    limiter._wake()
+    await asyncio.sleep(0)
+
+    assert sum(waiter.done() for waiter in waiters) == 5
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
@@ -0,0 +1,59 @@
+"""Tests for fast JSON responses."""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from shared.presentation.fastapi import responses
+from shared.presentation.fastapi.responses import FastJSONResponse, dumps_json
+
+
+class Item(BaseModel):
+    name: str
+    day: date
+    points: list[tuple[int, int]]
+
+
+def test_renders_pydantic_model_without_validation():
+    item = Item.model_construct(name="платье", day=date(2025, 1, 1), points=[(12, 1)])
+
+    response = FastJSONResponse(item)
+
+    assert response.body == '{"name":"платье","day":"2025-01-01","points":[[12,1]]}'.encode()
+    assert response.media_type == "application/json"
+
+
+def test_dumps_json_handles_tuples_and_datetimes():
+    content = {"bucket": datetime(2025, 1, 1, 12), "views": (1, 2)}  # noqa: DTZ001
+
+    assert dumps_json(content) == b'{"bucket":"2025-01-01T12:00:00","views":[1,2]}'
+
+
+def test_prefers_orjson_when_installed():
+    orjson = MagicMock()
+
+    with patch("shared.presentation.fastapi.responses.importlib.import_module", return_value=orjson) as import_module:
+        assert responses._load_dumps() is orjson.dumps
+
+    import_module.assert_called_once_with("orjson")
+
+
+@pytest.mark.anyio
+async def test_returned_response_skips_response_model():
+    app = FastAPI()
+
+    @app.get("/item", response_model=Item)
+    async def get_item() -> FastJSONResponse:
+        # Would fail response_model validation: points are not pairs
+        return FastJSONResponse({"name": "x", "day": "2025-01-01", "points": [1]})
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/item")
+
+    assert response.status_code == 200
+    assert response.json()["points"] == [1]
+    assert "Item" in app.openapi()["components"]["schemas"]
@@ -0,0 +1,98 @@
+"""Tests for ClickHouse retry policy."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import ServerDisconnectedError
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.database.retry import RetryPolicy, is_transient_error
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        ServerDisconnectedError(),
+        ConnectionResetError("reset by peer"),
+        TimeoutError(),
+        DatabaseError("ClickHouse HTTP 503: Service Unavailable"),
+        Exception("Received error response with status code 502 and empty body"),
+        Exception("Code: 252. DB::Exception: Too many parts (300)"),
+        DatabaseError("ClickHouse HTTP 500: Code: 319. DB::Exception: Unknown status of insert"),
+    ],
+)
+def test_transient_errors(exc):
+    assert is_transient_error(exc)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        Exception("Code: 62. DB::Exception: Syntax error"),
+        DatabaseError("ClickHouse HTTP 500: Code: 60. DB::Exception: Table test.t does not exist"),
+        DatabaseError("ClickHouse HTTP 400: bad request"),
+        ValueError("invalid literal"),
+    ],
+)
+def test_permanent_errors(exc):
+    assert not is_transient_error(exc)
+
+
+def test_delay_is_capped_and_grows():
+    policy = RetryPolicy(max_retries=10, backoff_base=0.5, backoff_max=2.0)
+
+    with patch("shared.infrastructure.database.retry.random.uniform", side_effect=lambda _, high: high):
+        assert [policy.get_delay(attempt) for attempt in range(4)] == [0.5, 1.0, 2.0, 2.0]
+
+
+@pytest.mark.anyio
+class TestRetryPolicyCall:
+    """Tests for RetryPolicy.call."""
+
+    async def test_success_without_retry(self):
+        policy = RetryPolicy(max_retries=3, backoff_base=0.001, backoff_max=0.01)
+        operation = AsyncMock(return_value="ok")
+
+        assert await policy.call(operation, "op") == "ok"
+        assert operation.call_count == 1
+        assert policy.stats.retries == 0
+
+    async def test_recovers_after_transient_failures(self):
+        policy = RetryPolicy(max_retries=3, backoff_base=0.001, backoff_max=0.01)
+        operation = AsyncMock(side_effect=[TimeoutError(), ConnectionResetError(), "ok"])
+
+        assert await policy.call(operation, "op") == "ok"
+        assert operation.call_count == 3
+        assert policy.stats.retries == 2
+        assert policy.stats.recovered == 1
+        assert policy.stats.exhausted == 0
+
+    async def test_exhausts_retries(self):
+        policy = RetryPolicy(max_retries=2, backoff_base=0.001, backoff_max=0.01)
+        operation = AsyncMock(side_effect=TimeoutError())
+
+        with pytest.raises(TimeoutError):
+            await policy.call(operation, "op")
+
+        assert operation.call_count == 3
+        assert policy.stats.retries == 2
+        assert policy.stats.exhausted == 1
+
+    async def test_permanent_error_is_not_retried(self):
+        policy = RetryPolicy(max_retries=3, backoff_base=0.001, backoff_max=0.01)
+        operation = AsyncMock(side_effect=ValueError("bad"))
+
+        with pytest.raises(ValueError, match="bad"):
+            await policy.call(operation, "op")
+
+        assert operation.call_count == 1
+        assert policy.stats.exhausted == 0
+
+    async def test_zero_retries_disables_retrying(self):
+        policy = RetryPolicy(max_retries=0, backoff_base=0.001, backoff_max=0.01)
+        operation = AsyncMock(side_effect=TimeoutError())
+
+        with pytest.raises(TimeoutError):
+            await policy.call(operation, "op")
+
+        assert operation.call_count == 1
@@ -0,0 +1,80 @@
+"""Tests for RowBinary encoder."""
+
+import struct
+from datetime import UTC, date, datetime
+
+import pytest
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.database.rowbinary import RowBinaryEncoder, get_value_writer
+
+
+def _encode(column_type, value):
+    buffer = bytearray()
+    get_value_writer(column_type)(buffer, value)
+    return bytes(buffer)
+
+
+@pytest.mark.parametrize(
+    ("column_type", "value", "expected"),
+    [
+        ("Int8", -1, b"\xff"),
+        ("Int32", 1000, struct.pack("<i", 1000)),
+        ("UInt32", 7, struct.pack("<I", 7)),
+        ("UInt64", 2**40, struct.pack("<Q", 2**40)),
+        ("Float64", 1.5, struct.pack("<d", 1.5)),
+        ("Bool", True, b"\x01"),
+        ("String", "abc", b"\x03abc"),
+        ("String", "платье", b"\x0c" + "платье".encode()),
+        ("Date", date(1970, 1, 11), struct.pack("<H", 10)),
+        ("date", date(2025, 1, 1), struct.pack("<H", 20089)),
+        ("DateTime", datetime(2025, 1, 1, 12, 0, tzinfo=UTC), struct.pack("<I", 1735732800)),
+        ("datetime", datetime(2025, 1, 1, 12, 0), struct.pack("<I", 1735732800)),  # noqa: DTZ001
+        ("Nullable(Int32)", None, b"\x01"),
+        ("Nullable(Int32)", 5, b"\x00" + struct.pack("<i", 5)),
+        ("LowCardinality(String)", "x", b"\x01x"),
+        ("String", None, b"\x00"),
+        ("LowCardinality(String)", None, b"\x00"),
+        ("Int32", None, struct.pack("<i", 0)),
+        ("Date", None, struct.pack("<H", 0)),
+        ("DateTime", None, struct.pack("<I", 0)),
+        ("Nullable(String)", None, b"\x01"),
+    ],
+)
+def test_value_writers(column_type, value, expected):
+    assert _encode(column_type, value) == expected
+
+
+def test_long_string_uses_multibyte_varint():
+    encoded = _encode("String", "a" * 300)
+
+    assert encoded[:2] == b"\xac\x02"
+    assert len(encoded) == 302
+
+
+def test_unsupported_type():
+    with pytest.raises(DatabaseError, match="Unsupported ClickHouse type"):
+        get_value_writer("Array(String)")
+
+
+def test_encoder_uses_schema_column_order():
+    encoder = RowBinaryEncoder({"repo": "String", "position": "UInt32"})
+
+    payload = encoder.encode([{"position": 1, "repo": "a/b"}, {"position": 2, "repo": "c"}])
+
+    assert encoder.columns == ["repo", "position"]
+    assert payload == b"\x03a/b" + struct.pack("<I", 1) + b"\x01c" + struct.pack("<I", 2)
+
+
+def test_encoder_rejects_empty_schema():
+    with pytest.raises(DatabaseError, match="at least one column"):
+        RowBinaryEncoder({})
+
+
+def test_encoder_writes_default_for_null_language():
+    # GitHub returns null for repositories without a detected language
+    encoder = RowBinaryEncoder({"name": "String", "language": "String", "stars": "Int32"})
+
+    payload = encoder.encode([{"name": "repo", "language": None, "stars": 1}])
+
+    assert payload == b"\x04repo\x00" + struct.pack("<i", 1)
@@ -0,0 +1,123 @@
+"""Tests for TTL cache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shared.infrastructure.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.anyio
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    async def test_hit_after_miss(self):
+        cache = TTLCache(ttl=10, max_size=10, clock=FakeClock())
+        loader = AsyncMock(return_value=[1])
+
+        assert await cache.get_or_load("k", loader) == [1]
+        assert await cache.get_or_load("k", loader) == [1]
+
+        loader.assert_awaited_once()
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    async def test_expires_after_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, max_size=10, clock=clock)
+        loader = AsyncMock(side_effect=[1, 2])
+
+        await cache.get_or_load("k", loader)
+        clock.now += 10
+
+        assert await cache.get_or_load("k", loader) == 2
+
+    async def test_aligned_expiry_at_interval_boundary(self):
+        clock = FakeClock(now=1195)
+        cache = TTLCache(ttl=600, max_size=10, aligned=True, clock=clock)
+        loader = AsyncMock(side_effect=[1, 2])
+
+        await cache.get_or_load("k", loader)
+        clock.now = 1199
+        assert await cache.get_or_load("k", loader) == 1
+        clock.now = 1200
+        assert await cache.get_or_load("k", loader) == 2
+
+    async def test_concurrent_misses_share_one_load(self):
+        cache = TTLCache(ttl=10, max_size=10)
+        calls = 0
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(cache.get_or_load("k", load) for _ in range(5)))
+
+        assert results == [1] * 5
+        assert calls == 1
+        assert (cache.stats.misses, cache.stats.coalesced) == (1, 4)
+
+    async def test_failed_load_is_not_cached(self):
+        cache = TTLCache(ttl=10, max_size=10)
+        loader = AsyncMock(side_effect=[RuntimeError("boom"), 1])
+
+        results = await asyncio.gather(
+            cache.get_or_load("k", loader),
+            cache.get_or_load("k", loader),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await cache.get_or_load("k", loader) == 1
+
+    async def test_cancelled_caller_does_not_cancel_load(self):
+        cache = TTLCache(ttl=10, max_size=10)
+        started = asyncio.Event()
+
+        async def load() -> int:
+            started.set()
+            await asyncio.sleep(0.01)
+            return 1
+
+        first = asyncio.create_task(cache.get_or_load("k", load))
+        await started.wait()
+        second = asyncio.create_task(cache.get_or_load("k", load))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 1
+
+    async def test_evicts_least_recently_used(self):
+        cache = TTLCache(ttl=10, max_size=2)
+
+        await cache.get_or_load("a", AsyncMock(return_value=1))
+        await cache.get_or_load("b", AsyncMock(return_value=2))
+        await cache.get_or_load("a", AsyncMock())
+        await cache.get_or_load("c", AsyncMock(return_value=3))
+
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        reloaded = AsyncMock(return_value=22)
+        assert await cache.get_or_load("b", reloaded) == 22
+
+    async def test_invalidate_and_clear(self):
+        cache = TTLCache(ttl=10, max_size=10)
+        await cache.get_or_load("a", AsyncMock(return_value=1))
+        await cache.get_or_load("b", AsyncMock(return_value=2))
+
+        cache.invalidate("a")
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,120 @@
+"""Tests for ClickHouse write buffer."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shared.domain.entities.exceptions import DatabaseError
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from shared.infrastructure.database.write_buffer import ClickHouseWriteBuffer, estimate_row_size
+
+
+@pytest.fixture
+def client():
+    mock_client = AsyncMock()
+    mock_client.insert_stream = AsyncMock(side_effect=lambda _table, rows, **_: len(rows))
+    return mock_client
+
+
+def make_config(buffer_max_rows: int = 100, buffer_max_bytes: int = 64 * 1024 * 1024) -> ClickHouseConfig:
+    return ClickHouseConfig(buffer_max_rows=buffer_max_rows, buffer_max_age=60, buffer_max_bytes=buffer_max_bytes)
+
+
+def test_estimate_row_size_grows_with_values():
+    assert estimate_row_size({"name": "x" * 1000}) > estimate_row_size({"name": "x"})
+
+
+@pytest.mark.anyio
+class TestClickHouseWriteBuffer:
+    """Tests for ClickHouseWriteBuffer."""
+
+    async def test_groups_rows_per_table_and_drains_on_close(self, client):
+        async with ClickHouseWriteBuffer(client, make_config()) as buffer:
+            assert await buffer.write("t1", [{"id": 1}]) == 1
+            await asyncio.gather(
+                buffer.write("t1", ({"id": i} for i in range(2, 4))),
+                buffer.write("t2", [{"name": "a"}], schema={"name": "String"}),
+            )
+            client.insert_stream.assert_not_called()
+
+        assert client.insert_stream.await_count == 2
+        client.insert_stream.assert_any_await("t1", [{"id": 1}, {"id": 2}, {"id": 3}], schema=None)
+        client.insert_stream.assert_any_await("t2", [{"name": "a"}], schema={"name": "String"})
+        assert buffer.stats.rows_buffered == 4
+        assert buffer.stats.rows_flushed == 4
+        assert buffer.stats.flushes == 2
+
+    async def test_async_iterable_rows(self, client):
+        async def rows():
+            for i in range(3):
+                yield {"id": i}
+
+        async with ClickHouseWriteBuffer(client, make_config()) as buffer:
+            assert await buffer.write("t", rows()) == 3
+
+        client.insert_stream.assert_awaited_once()
+
+    async def test_flushes_when_group_is_full(self, client):
+        buffer = ClickHouseWriteBuffer(client, make_config(buffer_max_rows=2))
+
+        await buffer.write("t", [{"id": i} for i in range(5)])
+        await asyncio.sleep(0)
+
+        assert client.insert_stream.await_count == 2
+        await buffer.close()
+        assert client.insert_stream.await_count == 3
+        assert buffer.stats.rows_flushed == 5
+
+    async def test_flushes_by_age(self, client):
+        buffer = ClickHouseWriteBuffer(client, ClickHouseConfig(buffer_max_age=0.01))
+
+        await buffer.write("t", [{"id": 1}])
+        await asyncio.sleep(0.05)
+
+        client.insert_stream.assert_awaited_once_with("t", [{"id": 1}], schema=None)
+        await buffer.close()
+
+    async def test_backpressure_waits_for_flush(self, client):
+        release = asyncio.Event()
+
+        async def slow_insert(table, rows, schema=None):
+            await release.wait()
+            return len(rows)
+
+        client.insert_stream = AsyncMock(side_effect=slow_insert)
+        buffer = ClickHouseWriteBuffer(client, make_config(buffer_max_bytes=1))
+
+        await buffer.write("t", [{"id": 1}])
+        blocked = asyncio.create_task(buffer.write("t", [{"id": 2}]))
+        await asyncio.sleep(0.01)
+
+        assert not blocked.done()
+        client.insert_stream.assert_awaited_once_with("t", [{"id": 1}], schema=None)
+
+        release.set()
+        assert await asyncio.wait_for(blocked, timeout=1) == 1
+        await buffer.close()
+        assert buffer.stats.rows_flushed == 2
+
+    async def test_failed_flush_is_counted(self, client):
+        client.insert_stream = AsyncMock(side_effect=DatabaseError("insert failed"))
+
+        async with ClickHouseWriteBuffer(client, make_config()) as buffer:
+            await buffer.write("t", [{"id": 1}, {"id": 2}])
+
+        assert buffer.stats.rows_failed == 2
+        assert buffer.stats.rows_flushed == 0
+        assert buffer.stats.last_error == "t: insert failed"
+
+    async def test_write_after_close_fails(self, client):
+        buffer = ClickHouseWriteBuffer(client, make_config())
+        await buffer.close()
+
+        with pytest.raises(DatabaseError, match="write buffer is closed"):
+            await buffer.write("t", [{"id": 1}])
+
+    async def test_invalid_table_name(self, client):
+        async with ClickHouseWriteBuffer(client, make_config()) as buffer:
+            with pytest.raises(DatabaseError, match="Invalid SQL identifier"):
+                await buffer.write("bad table", [{"id": 1}])
@@ -6,6 +6,7 @@ import asyncpg
 from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel
 
+from shared.presentation.fastapi.responses import FastJSONResponse
 from tasks.task_1.presentation.dependencies import get_pg_connection
 
 
@@ -25,8 +26,8 @@ def create_router() -> APIRouter:
     )
     async def get_db_version(
         conn: Annotated[asyncpg.Connection, Depends(get_pg_connection)],
-    ) -> DBVersionResponse:
+    ) -> FastJSONResponse:
         version: str = await conn.fetchval("SELECT version()")
-        return DBVersionResponse(version=version)
+        return FastJSONResponse(DBVersionResponse(version=version))
 
     return router
@@ -1,16 +1,18 @@
 """Domain entities for Task 2."""
 
-from shared.domain.entities.base import DomainEntity
+from shared.domain.entities.base import compact_entity
 
 
-class RepositoryAuthorCommitsNum(DomainEntity):
+@compact_entity
+class RepositoryAuthorCommitsNum:
     """Repository author commits number."""
 
     author: str
     commits_num: int
 
 
-class Repository(DomainEntity):
+@compact_entity
+class Repository:
     """GitHub repository with commit statistics."""
 
     name: str
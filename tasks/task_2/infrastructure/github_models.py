@@ -0,0 +1,27 @@
+"""GitHub API payload models for Task 2."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class GithubOwner(BaseModel):
+    """Repository owner in a GitHub API payload."""
+
+    login: str
+
+
+class GithubRepositoryItem(BaseModel):
+    """
+    Repository item of the GitHub search API.
+
+    The API response is the trust boundary of the scraper: items are checked
+    here once, and the domain entities built from them skip validation.
+    """
+
+    model_config = ConfigDict(strict=True)
+
+    name: str
+    owner: GithubOwner
+    stargazers_count: int
+    watchers_count: int
+    forks_count: int
+    language: str | None = None
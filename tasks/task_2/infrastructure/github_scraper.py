@@ -9,6 +9,7 @@ from loguru import logger
 from shared.domain.entities.exceptions import ScraperError
 from tasks.task_2.domain.entities import Repository, RepositoryAuthorCommitsNum
 from tasks.task_2.domain.protocols import HTTPClient
+from tasks.task_2.infrastructure.github_models import GithubRepositoryItem
 
 
 class GithubReposScrapper:
@@ -126,9 +127,13 @@ class GithubReposScrapper:
 
         Returns:
             Repository with commit statistics
+
+        Raises:
+            pydantic.ValidationError: If the repository data is malformed
         """
-        owner = repo_data["owner"]["login"]
-        name = repo_data["name"]
+        item = GithubRepositoryItem.model_validate(repo_data)
+        owner = item.owner.login
+        name = item.name
 
         logger.debug(f"Fetching commits for {owner}/{name}")
         commits = await self._get_repository_commits(owner, name)
@@ -140,10 +145,10 @@ class GithubReposScrapper:
             name=name,
             owner=owner,
             position=position,
-            stars=repo_data["stargazers_count"],
-            watchers=repo_data["watchers_count"],
-            forks=repo_data["forks_count"],
-            language=repo_data.get("language"),
+            stars=item.stargazers_count,
+            watchers=item.watchers_count,
+            forks=item.forks_count,
+            language=item.language,
             authors_commits_num_today=author_commits,
         )
 
@@ -187,7 +192,10 @@ class GithubReposScrapper:
         author_counts: dict[str, int] = defaultdict(int)
 
         for commit in commits:
-            author = commit.get("commit", {}).get("author", {}).get("name", "Unknown")
+            # GitHub sends null for missing authors and names, not just absent keys
+            commit_data = commit.get("commit") or {}
+            author_data = commit_data.get("author") or {}
+            author = author_data.get("name") or "Unknown"
             author_counts[author] += 1
 
         return [
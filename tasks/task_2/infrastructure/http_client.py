@@ -1,12 +1,18 @@
 """HTTP client with rate limiting for GitHub API."""
 
+import time
+from collections.abc import Mapping
+from http import HTTPStatus
 from typing import Any
 
 import aiohttp
 from loguru import logger
 
 from shared.domain.entities.exceptions import ScraperError
-from shared.domain.protocols.rate_limiter import RateLimiter
+from shared.domain.protocols.rate_limiter import RateLimiter, RateLimitFeedback
+
+# Reported to adaptive limiters for requests that failed without a response (connection errors)
+NO_RESPONSE_STATUS = HTTPStatus.SERVICE_UNAVAILABLE
 
 
 class RateLimitedHTTPClient:
@@ -56,20 +62,33 @@ class RateLimitedHTTPClient:
             raise ScraperError(msg)
 
         await self._rate_limiter.acquire()
+        responded = False
         try:
             logger.debug(f"Making GET request to {url}")
+            # Timed from here so time spent waiting in the rate limiter is not counted as latency
+            started = time.monotonic()
             async with self._session.get(url, **kwargs) as response:
+                responded = True
+                await self._observe(response.status, response.headers, time.monotonic() - started)
                 response.raise_for_status()
                 data = await response.json()
                 logger.debug(f"Successfully fetched data from {url}")
                 return data
         except aiohttp.ClientError as exc:
+            if not responded:
+                # A connection failure is an upstream failure too; the limiter should back off
+                await self._observe(NO_RESPONSE_STATUS, {}, None)
             error_msg = f"HTTP request failed: {exc}"
             logger.error(error_msg)
             raise ScraperError(error_msg) from exc
         finally:
             await self._rate_limiter.release()
 
+    async def _observe(self, status: int, headers: Mapping[str, str], latency: float | None) -> None:
+        """Report a request outcome to the rate limiter if it adapts to responses."""
+        if isinstance(self._rate_limiter, RateLimitFeedback):
+            await self._rate_limiter.observe(status, headers, latency)
+
     async def close(self) -> None:
         """Close HTTP client session."""
         if self._session:
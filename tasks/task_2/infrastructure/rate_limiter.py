@@ -0,0 +1,102 @@
+"""GitHub API rate limiter assembly from configuration."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from shared.domain.protocols.rate_limiter import RateLimiter
+from shared.infrastructure.config.github import GitHubConfig
+from shared.infrastructure.config.postgres import PostgresConfig
+from shared.infrastructure.database.postgres_pool import PostgreSQLPool
+from shared.infrastructure.rate_limiting.adaptive_limiter import AdaptiveRateLimiter
+from shared.infrastructure.rate_limiting.aimd_limiter import AIMDConcurrencyLimiter
+from shared.infrastructure.rate_limiting.composite_limiter import CompositeRateLimiter
+from shared.infrastructure.rate_limiting.postgres_bucket import PostgresTokenBucketRateLimiter
+from shared.infrastructure.rate_limiting.semaphore_limiter import SemaphoreRateLimiter
+from shared.infrastructure.rate_limiting.token_bucket import TokenBucketRateLimiter
+
+# GitHub refuses more than 100 concurrent requests as a secondary rate limit
+GITHUB_MAX_CONCURRENT_REQUESTS = 100
+SHARED_BUCKET_NAME = "github"
+# Leases are serialized per process, so the shared bucket needs few connections
+SHARED_BUCKET_POOL_SIZE = 2
+
+
+def create_concurrency_limiter(config: GitHubConfig) -> SemaphoreRateLimiter:
+    """
+    Create the GitHub API concurrency limiter (MCR) from configuration.
+
+    Args:
+        config: GitHub API configuration
+
+    Returns:
+        Fixed semaphore, or AIMD limiter starting at max_concurrent_requests
+    """
+    if config.adaptive_concurrency:
+        return AIMDConcurrencyLimiter(
+            initial_limit=config.max_concurrent_requests,
+            max_limit=GITHUB_MAX_CONCURRENT_REQUESTS,
+        )
+    return SemaphoreRateLimiter(max_concurrent=config.max_concurrent_requests)
+
+
+def create_rate_limiter(
+    config: GitHubConfig,
+    concurrency_limiter: SemaphoreRateLimiter | None = None,
+    shared_bucket: RateLimiter | None = None,
+) -> CompositeRateLimiter:
+    """
+    Create the GitHub API rate limiter (MCR + RPS) from configuration.
+
+    Args:
+        config: GitHub API configuration
+        concurrency_limiter: MCR limiter to use; created from config when omitted
+        shared_bucket: RPS limiter shared across replicas; replaces the in-process token bucket
+
+    Returns:
+        Composite of a concurrency limiter and the RPS limiters
+    """
+    limiters: list[RateLimiter] = [concurrency_limiter or create_concurrency_limiter(config)]
+    if shared_bucket is not None:
+        limiters.append(shared_bucket)
+    if config.adaptive_rate_limit:
+        limiters.append(
+            AdaptiveRateLimiter(rate=config.requests_per_second, max_rate=config.max_requests_per_second),
+        )
+    elif shared_bucket is None:
+        limiters.append(TokenBucketRateLimiter(rate=config.requests_per_second))
+    return CompositeRateLimiter(*limiters)
+
+
+@asynccontextmanager
+async def open_rate_limiter(
+    config: GitHubConfig,
+    concurrency_limiter: SemaphoreRateLimiter | None = None,
+) -> AsyncIterator[CompositeRateLimiter]:
+    """
+    Create the GitHub API rate limiter, with a PostgreSQL bucket when the budget is shared.
+
+    With ``shared_rate_limit`` the requests_per_second budget is enforced
+    across all replicas by a PostgreSQL token bucket, whose pool stays open
+    while the limiter is in use.
+
+    Args:
+        config: GitHub API configuration
+        concurrency_limiter: MCR limiter to use; created from config when omitted
+
+    Yields:
+        Composite rate limiter
+    """
+    if not config.shared_rate_limit:
+        yield create_rate_limiter(config, concurrency_limiter)
+        return
+
+    # Validation still loads POSTGRES_* settings; only the pool size is overridden
+    postgres_config = PostgresConfig.model_validate({"min_pool_size": 1, "max_pool_size": SHARED_BUCKET_POOL_SIZE})
+    pool = PostgreSQLPool(postgres_config)
+    await pool.create_pool()
+    try:
+        bucket = PostgresTokenBucketRateLimiter(pool, SHARED_BUCKET_NAME, rate=config.requests_per_second)
+        await bucket.create_table()
+        yield create_rate_limiter(config, concurrency_limiter, bucket)
+    finally:
+        await pool.close_pool()
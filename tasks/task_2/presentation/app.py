@@ -2,6 +2,7 @@
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -9,14 +10,12 @@ from loguru import logger
 
 from shared.infrastructure.config.github import GitHubConfig
 from shared.infrastructure.logging.setup import setup_logging
-from shared.infrastructure.rate_limiting.composite_limiter import CompositeRateLimiter
-from shared.infrastructure.rate_limiting.semaphore_limiter import SemaphoreRateLimiter
-from shared.infrastructure.rate_limiting.token_bucket import TokenBucketRateLimiter
 from shared.infrastructure.version import get_version_from_pyproject
 from shared.presentation.fastapi.exception_handlers import register_exception_handlers
 from shared.presentation.fastapi.health import create_health_router
 from tasks.task_2.infrastructure.github_scraper import GithubReposScrapper
 from tasks.task_2.infrastructure.http_client import RateLimitedHTTPClient
+from tasks.task_2.infrastructure.rate_limiter import create_concurrency_limiter, open_rate_limiter
 from tasks.task_2.presentation.endpoints import router
 
 TASK_ROOT = Path(__file__).parent.parent
@@ -38,19 +37,20 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Initialize GitHub scraper
     config = GitHubConfig()
-    rate_limiter = CompositeRateLimiter(
-        SemaphoreRateLimiter(max_concurrent=config.max_concurrent_requests),
-        TokenBucketRateLimiter(rate=config.requests_per_second),
-    )
-
-    async with RateLimitedHTTPClient(
-        config.access_token.get_secret_value(),
-        rate_limiter,
-    ) as client:
+    concurrency_limiter = create_concurrency_limiter(config)
+
+    async with (
+        open_rate_limiter(config, concurrency_limiter) as rate_limiter,
+        RateLimitedHTTPClient(
+            config.access_token.get_secret_value(),
+            rate_limiter,
+        ) as client,
+    ):
         scraper = GithubReposScrapper(client, top_limit=config.top_repositories_limit)
 
         app.state.scraper = scraper
         app.state.client = client
+        app.state.health_stats = {"github_concurrency": lambda: asdict(concurrency_limiter.stats)}
 
         logger.info("GitHub scraper initialized")
 
@@ -5,6 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 from loguru import logger
 
+from shared.presentation.fastapi.responses import FastJSONResponse
 from tasks.task_2.infrastructure.github_scraper import GithubReposScrapper
 from tasks.task_2.presentation.dependencies import get_scraper
 from tasks.task_2.presentation.models import (
@@ -20,7 +21,7 @@ router = APIRouter(prefix="/api", tags=["repositories"])
 async def get_repositories(
     scraper: Annotated[GithubReposScrapper, Depends(get_scraper)],
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
-) -> RepositoriesResponse:
+) -> FastJSONResponse:
     """
     Get top GitHub repositories with commit statistics.
 
@@ -35,7 +36,7 @@ async def get_repositories(
 
     repositories = await scraper.get_repositories(limit)
 
-    return RepositoriesResponse(
+    response = RepositoriesResponse(
         total=len(repositories),
         repositories=[
             RepositoryResponse(
@@ -57,3 +58,4 @@ async def get_repositories(
             for repo in repositories
         ],
     )
+    return FastJSONResponse(response)
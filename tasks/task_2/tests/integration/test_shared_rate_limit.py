@@ -0,0 +1,44 @@
+"""Integration tests for the PostgreSQL-backed shared rate limit."""
+
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+
+from shared.infrastructure.config.postgres import PostgresConfig
+from shared.infrastructure.database.postgres_pool import PostgreSQLPool
+from shared.infrastructure.rate_limiting.postgres_bucket import PostgresTokenBucketRateLimiter
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("POSTGRES_DATABASE_URL"),
+    reason="PostgreSQL DATABASE_URL not configured",
+)
+
+
+@pytest.fixture
+async def pool():
+    pool = PostgreSQLPool(PostgresConfig.model_validate({"min_pool_size": 1, "max_pool_size": 4}))
+    await pool.create_pool()
+    yield pool
+    await pool.close_pool()
+
+
+@pytest.mark.anyio
+async def test_replicas_share_one_budget(pool):
+    name = f"test-{uuid.uuid4()}"
+    # Two replicas with their own leases and wait queues, one bucket row
+    replicas = [PostgresTokenBucketRateLimiter(pool, name, rate=20, burst=5, lease_size=2) for _ in range(2)]
+    await replicas[0].create_table()
+    start_time = time.monotonic()
+
+    try:
+        await asyncio.gather(*(replicas[index % 2].acquire() for index in range(45)))
+        elapsed = time.monotonic() - start_time
+    finally:
+        async with pool.acquire() as connection:
+            await connection.execute("DELETE FROM rate_limit_buckets WHERE name = $1", name)
+
+    # The burst of 5 goes at once, the other 40 tokens refill at 20 per second in total
+    assert 1.9 <= elapsed < 3.0
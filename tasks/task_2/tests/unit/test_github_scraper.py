@@ -78,6 +78,19 @@ async def test_scraper_get_repositories_with_commits(scraper, mock_client):
     assert repositories[0].authors_commits_num_today[0].commits_num == 2
 
 
+def test_group_commits_by_author_counts_null_authors_as_unknown(scraper):
+    commits = [
+        {"commit": {"author": {"name": None}}},
+        {"commit": {"author": None}},
+        {"commit": None},
+        {"commit": {"author": {"name": "Jane Smith"}}},
+    ]
+
+    grouped = scraper._group_commits_by_author(commits)
+
+    assert [(item.author, item.commits_num) for item in grouped] == [("Unknown", 3), ("Jane Smith", 1)]
+
+
 async def test_scraper_handles_errors(scraper, mock_client):
     mock_client.get = AsyncMock(side_effect=Exception("API Error"))
 
@@ -117,3 +130,33 @@ async def test_scraper_filters_failed_repositories(scraper, mock_client):
 
     assert len(repositories) == 1
     assert repositories[0].name == "repo1"
+
+
+async def test_scraper_skips_malformed_repositories(scraper, mock_client):
+    mock_client.get = AsyncMock(
+        side_effect=[
+            {
+                "items": [
+                    {
+                        "name": "repo1",
+                        "owner": {"login": "user1"},
+                        "stargazers_count": None,
+                        "watchers_count": 50,
+                        "forks_count": 20,
+                    },
+                    {
+                        "name": "repo2",
+                        "owner": {"login": "user2"},
+                        "stargazers_count": 200,
+                        "watchers_count": 100,
+                        "forks_count": 40,
+                    },
+                ]
+            },
+            [],
+        ]
+    )
+
+    repositories = await scraper.get_repositories(limit=2)
+
+    assert [(repo.name, repo.stars, repo.language) for repo in repositories] == [("repo2", 200, None)]
@@ -1,5 +1,6 @@
 """Tests for HTTP client with rate limiting."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -13,6 +14,7 @@ def rate_limiter():
     limiter = AsyncMock()
     limiter.acquire = AsyncMock()
     limiter.release = AsyncMock()
+    limiter.observe = AsyncMock()
     limiter.__aenter__ = AsyncMock(return_value=limiter)
     limiter.__aexit__ = AsyncMock()
     return limiter
@@ -46,6 +48,30 @@ async def test_http_client_get_success(http_client):
 
             assert result == {"test": "data"}
             mock_get.assert_called_once()
+            status, headers, latency = http_client._rate_limiter.observe.await_args.args
+            assert (status, headers) == (200, mock_response.headers)
+            assert latency >= 0
+
+
+async def test_http_client_latency_excludes_rate_limiter_wait(http_client, rate_limiter):
+    async def wait_in_limiter():
+        await asyncio.sleep(0.2)
+
+    rate_limiter.acquire = AsyncMock(side_effect=wait_in_limiter)
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.raise_for_status = MagicMock()
+    mock_response.json = AsyncMock(return_value={})
+
+    async with http_client:
+        with patch.object(http_client._session, "get") as mock_get:
+            mock_get.return_value.__aenter__.return_value = mock_response
+
+            await http_client.get("https://api.github.com/test")
+
+    rate_limiter.acquire.assert_awaited_once()
+    _, _, latency = rate_limiter.observe.await_args.args
+    assert latency < 0.2
 
 
 async def test_http_client_get_not_initialized(rate_limiter):
@@ -69,6 +95,22 @@ async def test_http_client_get_http_error(http_client, rate_limiter):
 
             rate_limiter.acquire.assert_called_once()
             rate_limiter.release.assert_called_once()
+            # The error response was observed once, not reported again as a connection failure
+            rate_limiter.observe.assert_awaited_once()
+
+
+async def test_http_client_reports_connection_failure_to_limiter(http_client, rate_limiter):
+    import aiohttp
+
+    async with http_client:
+        with patch.object(http_client._session, "get") as mock_get:
+            mock_get.return_value.__aenter__.side_effect = aiohttp.ClientConnectionError("Connection reset")
+
+            with pytest.raises(ScraperError, match="Connection reset"):
+                await http_client.get("https://api.github.com/test")
+
+    rate_limiter.observe.assert_awaited_once_with(503, {}, None)
+    rate_limiter.release.assert_awaited_once()
 
 
 async def test_http_client_close_when_not_initialized(http_client):
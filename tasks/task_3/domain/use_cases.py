@@ -4,35 +4,42 @@ from datetime import UTC, datetime
 
 from loguru import logger
 
-from shared.infrastructure.config.clickhouse import ClickHouseConfig
-from shared.infrastructure.database.clickhouse_client import ClickHouseClient
+from shared.infrastructure.database.write_buffer import ClickHouseWriteBuffer
 from tasks.task_2.domain.entities import Repository
 from tasks.task_2.domain.protocols import Scraper
+from tasks.task_3.infrastructure.clickhouse.schemas import (
+    REPOSITORIES_AUTHORS_COMMITS_SCHEMA,
+    REPOSITORIES_POSITIONS_SCHEMA,
+    REPOSITORIES_SCHEMA,
+)
 
 
 class ScrapAndSaveUseCase:
     """Use case for scraping repositories and saving to ClickHouse."""
 
-    def __init__(self, scraper: Scraper, clickhouse_config: ClickHouseConfig) -> None:
+    def __init__(self, scraper: Scraper, write_buffer: ClickHouseWriteBuffer) -> None:
         """
         Initialize use case.
 
         Args:
             scraper: GitHub scraper
-            clickhouse_config: ClickHouse configuration
+            write_buffer: Shared write-behind buffer in front of ClickHouse
         """
         self._scraper = scraper
-        self._clickhouse_config = clickhouse_config
+        self._write_buffer = write_buffer
 
     async def execute(self, limit: int = 100) -> dict[str, int]:
         """
         Execute scraping and saving.
 
+        Rows are handed to the write buffer, which flushes them to ClickHouse
+        in the background and drains on application shutdown.
+
         Args:
             limit: Number of repositories to scrape
 
         Returns:
-            Statistics about saved data
+            Statistics about queued data
         """
         logger.info(f"Starting scrape and save for {limit} repositories")
 
@@ -40,13 +47,12 @@ class ScrapAndSaveUseCase:
         repositories = await self._scraper.get_repositories(limit)
         logger.info(f"Scraped {len(repositories)} repositories")
 
-        # 2. Save to ClickHouse
-        async with ClickHouseClient(self._clickhouse_config) as client:
-            await self._save_repositories(client, repositories)
-            await self._save_positions(client, repositories)
-            await self._save_commits(client, repositories)
+        # 2. Queue rows for ClickHouse
+        await self._save_repositories(repositories)
+        await self._save_positions(repositories)
+        await self._save_commits(repositories)
 
-        logger.info("Successfully saved all data to ClickHouse")
+        logger.info("Queued all data for ClickHouse")
 
         return {
             "total_repos": len(repositories),
@@ -55,13 +61,12 @@ class ScrapAndSaveUseCase:
 
     async def _save_repositories(
         self,
-        client: ClickHouseClient,
         repositories: list[Repository],
     ) -> None:
-        """Save repositories to ClickHouse using batch insertion."""
+        """Buffer repositories for ClickHouse."""
         # ClickHouse DateTime has second precision, remove microseconds
         now = datetime.now(tz=UTC).replace(microsecond=0)
-        data = [
+        rows = (
             {
                 "name": repo.name,
                 "owner": repo.owner,
@@ -72,47 +77,49 @@ class ScrapAndSaveUseCase:
                 "updated": now,
             }
             for repo in repositories
-        ]
+        )
 
-        logger.info(f"Saving {len(data)} repositories using batch insertion")
-        await client.insert_batch("repositories", data)
+        saved = await self._write_buffer.write("repositories", rows, schema=REPOSITORIES_SCHEMA)
+        logger.info(f"Buffered {saved} repositories")
 
     async def _save_positions(
         self,
-        client: ClickHouseClient,
         repositories: list[Repository],
     ) -> None:
-        """Save repository positions to ClickHouse using batch insertion."""
-        data = [
+        """Buffer repository positions for ClickHouse."""
+        today = datetime.now(tz=UTC).date()
+        rows = (
             {
-                "date": datetime.now(tz=UTC).date(),
+                "date": today,
                 "repo": f"{repo.owner}/{repo.name}",
                 "position": repo.position,
             }
             for repo in repositories
-        ]
+        )
 
-        logger.info(f"Saving {len(data)} positions using batch insertion")
-        await client.insert_batch("repositories_positions", data)
+        saved = await self._write_buffer.write("repositories_positions", rows, schema=REPOSITORIES_POSITIONS_SCHEMA)
+        logger.info(f"Buffered {saved} positions")
 
     async def _save_commits(
         self,
-        client: ClickHouseClient,
         repositories: list[Repository],
     ) -> None:
-        """Save author commits to ClickHouse using batch insertion."""
-        data = []
-        for repo in repositories:
-            for author_commits in repo.authors_commits_num_today:
-                data.append(
-                    {
-                        "date": datetime.now(tz=UTC).date(),
-                        "repo": f"{repo.owner}/{repo.name}",
-                        "author": author_commits.author,
-                        "commits_num": author_commits.commits_num,
-                    }
-                )
-
-        if data:
-            logger.info(f"Saving {len(data)} author commits using batch insertion")
-            await client.insert_batch("repositories_authors_commits", data)
+        """Buffer author commits for ClickHouse."""
+        today = datetime.now(tz=UTC).date()
+        rows = (
+            {
+                "date": today,
+                "repo": f"{repo.owner}/{repo.name}",
+                "author": author_commits.author,
+                "commits_num": author_commits.commits_num,
+            }
+            for repo in repositories
+            for author_commits in repo.authors_commits_num_today
+        )
+
+        saved = await self._write_buffer.write(
+            "repositories_authors_commits",
+            rows,
+            schema=REPOSITORIES_AUTHORS_COMMITS_SCHEMA,
+        )
+        logger.info(f"Buffered {saved} author commits")
@@ -0,0 +1,32 @@
+"""Column schemas of Task 3 ClickHouse tables (see tables.sql)."""
+
+from types import MappingProxyType
+
+REPOSITORIES_SCHEMA = MappingProxyType(
+    {
+        "name": "String",
+        "owner": "String",
+        "stars": "Int32",
+        "watchers": "Int32",
+        "forks": "Int32",
+        "language": "String",
+        "updated": "DateTime",
+    },
+)
+
+REPOSITORIES_POSITIONS_SCHEMA = MappingProxyType(
+    {
+        "date": "Date",
+        "repo": "String",
+        "position": "UInt32",
+    },
+)
+
+REPOSITORIES_AUTHORS_COMMITS_SCHEMA = MappingProxyType(
+    {
+        "date": "Date",
+        "repo": "String",
+        "author": "String",
+        "commits_num": "Int32",
+    },
+)
@@ -2,6 +2,8 @@
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from dataclasses import asdict
+from functools import partial
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -9,15 +11,15 @@ from loguru import logger
 
 from shared.infrastructure.config.clickhouse import ClickHouseConfig
 from shared.infrastructure.config.github import GitHubConfig
+from shared.infrastructure.database.clickhouse_client import ClickHouseClient
+from shared.infrastructure.database.write_buffer import ClickHouseWriteBuffer
 from shared.infrastructure.logging.setup import setup_logging
-from shared.infrastructure.rate_limiting.composite_limiter import CompositeRateLimiter
-from shared.infrastructure.rate_limiting.semaphore_limiter import SemaphoreRateLimiter
-from shared.infrastructure.rate_limiting.token_bucket import TokenBucketRateLimiter
 from shared.infrastructure.version import get_version_from_pyproject
 from shared.presentation.fastapi.exception_handlers import register_exception_handlers
 from shared.presentation.fastapi.health import create_health_router
 from tasks.task_2.infrastructure.github_scraper import GithubReposScrapper
 from tasks.task_2.infrastructure.http_client import RateLimitedHTTPClient
+from tasks.task_2.infrastructure.rate_limiter import create_concurrency_limiter, open_rate_limiter
 from tasks.task_3.domain.use_cases import ScrapAndSaveUseCase
 from tasks.task_3.presentation.endpoints import router
 
@@ -40,24 +42,35 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Initialize GitHub scraper
     github_config = GitHubConfig()
-    rate_limiter = CompositeRateLimiter(
-        SemaphoreRateLimiter(max_concurrent=github_config.max_concurrent_requests),
-        TokenBucketRateLimiter(rate=github_config.requests_per_second),
-    )
-
-    async with RateLimitedHTTPClient(
-        github_config.access_token.get_secret_value(),
-        rate_limiter,
-    ) as client:
+    concurrency_limiter = create_concurrency_limiter(github_config)
+
+    # Write buffer exits first, so buffered rows are drained before the ClickHouse client closes
+    clickhouse_config = ClickHouseConfig()
+    async with (
+        open_rate_limiter(github_config, concurrency_limiter) as rate_limiter,
+        RateLimitedHTTPClient(
+            github_config.access_token.get_secret_value(),
+            rate_limiter,
+        ) as client,
+        ClickHouseClient(clickhouse_config) as clickhouse_client,
+        ClickHouseWriteBuffer(clickhouse_client, clickhouse_config) as write_buffer,
+    ):
         scraper = GithubReposScrapper(client, top_limit=github_config.top_repositories_limit)
 
         # Initialize use case
-        clickhouse_config = ClickHouseConfig()
-        use_case = ScrapAndSaveUseCase(scraper, clickhouse_config)
+        use_case = ScrapAndSaveUseCase(scraper, write_buffer)
 
         app.state.scraper = scraper
         app.state.client = client
+        app.state.clickhouse_client = clickhouse_client
+        app.state.write_buffer = write_buffer
         app.state.use_case = use_case
+        app.state.health_checks = {"clickhouse": partial(clickhouse_client.execute, "SELECT 1")}
+        app.state.health_stats = {
+            "clickhouse": lambda: asdict(clickhouse_client.get_stats()),
+            "clickhouse_write_buffer": lambda: asdict(write_buffer.stats),
+            "github_concurrency": lambda: asdict(concurrency_limiter.stats),
+        }
 
         logger.info("Task 3 application initialized")
 
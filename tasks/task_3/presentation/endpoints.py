@@ -2,9 +2,10 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, status
 from loguru import logger
 
+from shared.presentation.fastapi.responses import FastJSONResponse
 from tasks.task_3.domain.use_cases import ScrapAndSaveUseCase
 from tasks.task_3.presentation.dependencies import get_use_case
 from tasks.task_3.presentation.models import ScrapeAndSaveResponse
@@ -12,13 +13,16 @@ from tasks.task_3.presentation.models import ScrapeAndSaveResponse
 router = APIRouter(prefix="/api", tags=["scrape"])
 
 
-@router.post("/scrape-and-save", response_model=ScrapeAndSaveResponse)
+@router.post("/scrape-and-save", response_model=ScrapeAndSaveResponse, status_code=status.HTTP_202_ACCEPTED)
 async def scrape_and_save(
     use_case: Annotated[ScrapAndSaveUseCase, Depends(get_use_case)],
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
-) -> ScrapeAndSaveResponse:
+) -> FastJSONResponse:
     """
-    Scrape GitHub repositories and save to ClickHouse.
+    Scrape GitHub repositories and queue them for ClickHouse.
+
+    Rows are written by the background write buffer after the response is
+    sent; failed flushes show up under ``clickhouse_write_buffer`` in /health.
 
     Args:
         use_case: ScrapAndSaveUseCase instance
@@ -31,9 +35,12 @@ async def scrape_and_save(
 
     result = await use_case.execute(limit=limit)
 
-    return ScrapeAndSaveResponse(
-        status="success",
-        total_repos=result["total_repos"],
-        total_commits=result["total_commits"],
-        message=f"Successfully scraped and saved {result['total_repos']} repositories",
+    return FastJSONResponse(
+        ScrapeAndSaveResponse(
+            status="accepted",
+            total_repos=result["total_repos"],
+            total_commits=result["total_commits"],
+            message=f"Scraped {result['total_repos']} repositories, rows are queued for ClickHouse",
+        ),
+        status_code=status.HTTP_202_ACCEPTED,
     )
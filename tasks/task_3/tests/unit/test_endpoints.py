@@ -31,9 +31,9 @@ async def test_scrape_and_save_endpoint(app, mock_use_case):
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         response = await client.post("/api/scrape-and-save?limit=10")
 
-    assert response.status_code == 200
+    assert response.status_code == 202
     data = response.json()
-    assert data["status"] == "success"
+    assert data["status"] == "accepted"
     assert data["total_repos"] == 10
     assert data["total_commits"] == 50
     mock_use_case.execute.assert_called_once_with(limit=10)
@@ -1,13 +1,12 @@
 """Tests for Task 3 use cases."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
-from shared.infrastructure.config.clickhouse import ClickHouseConfig
-from shared.infrastructure.database.clickhouse_client import ClickHouseClient
 from tasks.task_2.domain.entities import Repository, RepositoryAuthorCommitsNum
 from tasks.task_3.domain.use_cases import ScrapAndSaveUseCase
+from tasks.task_3.infrastructure.clickhouse.schemas import REPOSITORIES_SCHEMA
 
 
 @pytest.fixture
@@ -34,62 +33,45 @@ def mock_scraper():
 
 
 @pytest.fixture
-def clickhouse_config():
-    return ClickHouseConfig(
-        host="localhost",
-        port=9000,
-        database="test",
-        user="default",
-        password="",
-    )
+def written_rows():
+    return {}
 
 
 @pytest.fixture
-def use_case(mock_scraper, clickhouse_config):
-    return ScrapAndSaveUseCase(scraper=mock_scraper, clickhouse_config=clickhouse_config)
-
-
-async def test_scrape_and_save_execute(use_case, mock_scraper):
-    # Create mock for ClickHouse client
-    mock_ch_client = AsyncMock()
-    mock_ch_client.execute = AsyncMock(return_value=None)
+def write_buffer(written_rows):
+    async def write(table, rows, schema=None):
+        written_rows[table] = list(rows)
+        return len(written_rows[table])
 
-    async def mock_aenter(self):
-        self._client = mock_ch_client
-        return self
+    buffer = AsyncMock()
+    buffer.write = AsyncMock(side_effect=write)
+    return buffer
 
-    async def mock_aexit(self, exc_type, exc_val, exc_tb):
-        pass
 
-    with patch.object(ClickHouseClient, "__aenter__", mock_aenter):  # noqa: SIM117
-        with patch.object(ClickHouseClient, "__aexit__", mock_aexit):
-            result = await use_case.execute(limit=10)
-
-            assert result["total_repos"] == 1
-            assert result["total_commits"] == 2
-            mock_scraper.get_repositories.assert_called_once_with(10)
-            # Should save repos, positions, and commits (3 batches)
-            assert mock_ch_client.execute.call_count == 3
+@pytest.fixture
+def use_case(mock_scraper, write_buffer):
+    return ScrapAndSaveUseCase(scraper=mock_scraper, write_buffer=write_buffer)
 
 
-async def test_scrape_and_save_saves_repositories(use_case):
-    mock_ch_client = AsyncMock()
-    mock_ch_client.execute = AsyncMock(return_value=None)
+async def test_scrape_and_save_execute(use_case, mock_scraper, write_buffer):
+    result = await use_case.execute(limit=10)
 
-    async def mock_aenter(self):
-        self._client = mock_ch_client
-        return self
+    assert result["total_repos"] == 1
+    assert result["total_commits"] == 2
+    mock_scraper.get_repositories.assert_called_once_with(10)
+    # Should buffer repos, positions, and commits
+    assert write_buffer.write.call_count == 3
 
-    async def mock_aexit(self, exc_type, exc_val, exc_tb):
-        pass
 
-    with patch.object(ClickHouseClient, "__aenter__", mock_aenter):  # noqa: SIM117
-        with patch.object(ClickHouseClient, "__aexit__", mock_aexit):
-            await use_case.execute(limit=1)
+async def test_scrape_and_save_saves_repositories(use_case, write_buffer, written_rows):
+    await use_case.execute(limit=1)
 
-            calls = mock_ch_client.execute.call_args_list
-            assert len(calls) == 3
+    tables = [call.args[0] for call in write_buffer.write.call_args_list]
+    assert tables == ["repositories", "repositories_positions", "repositories_authors_commits"]
+    assert write_buffer.write.call_args_list[0].kwargs["schema"] == REPOSITORIES_SCHEMA
 
-            # Check that repositories INSERT was called
-            repos_call = str(calls[0])
-            assert "INSERT INTO repositories" in repos_call
+    repository_row = written_rows["repositories"][0]
+    assert repository_row["name"] == "test-repo"
+    assert repository_row["updated"].microsecond == 0
+    assert written_rows["repositories_positions"][0]["repo"] == "testuser/test-repo"
+    assert [row["author"] for row in written_rows["repositories_authors_commits"]] == ["John Doe", "Jane Smith"]
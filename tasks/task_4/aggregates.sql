@@ -0,0 +1,33 @@
+-- Hourly pre-aggregate of phrases_views, maintained on insert by a materialized view.
+-- Each part holds argMax states per (campaign, day, phrase, hour); merging them yields
+-- the latest cumulative views of the hour, so queries read a few rows per phrase and hour
+-- instead of every raw row of the day.
+CREATE TABLE phrases_views_hourly
+(
+    date        Date,
+    campaign_id Int32,
+    phrase      String,
+    hour        UInt8,
+    max_views   AggregateFunction(argMax, Int32, DateTime)
+) engine = AggregatingMergeTree ORDER BY (campaign_id, date, phrase, hour);
+
+CREATE MATERIALIZED VIEW phrases_views_hourly_mv TO phrases_views_hourly AS
+SELECT
+    toDate(dt) as date,
+    campaign_id,
+    phrase,
+    toHour(dt) as hour,
+    argMaxState(views, dt) as max_views
+FROM phrases_views
+GROUP BY date, campaign_id, phrase, hour;
+
+-- Backfill rows inserted before the view existed
+INSERT INTO phrases_views_hourly
+SELECT
+    toDate(dt) as date,
+    campaign_id,
+    phrase,
+    toHour(dt) as hour,
+    argMaxState(views, dt) as max_views
+FROM phrases_views
+GROUP BY date, campaign_id, phrase, hour;
@@ -1,10 +1,45 @@
 """Domain entities for Task 4."""
 
-from shared.domain.entities.base import DomainEntity
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Literal
 
+from shared.domain.entities.base import compact_entity
 
-class PhraseViews(DomainEntity):
+type Granularity = Literal["minute", "hour", "day"]
+
+BUCKETS_PER_DAY: MappingProxyType[Granularity, int] = MappingProxyType({"minute": 24 * 60, "hour": 24, "day": 1})
+
+
+@compact_entity
+class PhraseViews:
     """Phrase views by hour."""
 
     phrase: str
     views_by_hour: list[tuple[int, int]]
+
+
+@compact_entity
+class PhraseViewsSeries:
+    """Phrase views by bucket start time."""
+
+    phrase: str
+    views: list[tuple[datetime, int]]
+
+
+@compact_entity
+class ViewsPeriod:
+    """Inclusive date range split into buckets of one granularity."""
+
+    date_from: date
+    date_to: date
+    granularity: Granularity = "hour"
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of buckets the period spans."""
+        return ((self.date_to - self.date_from).days + 1) * BUCKETS_PER_DAY[self.granularity]
+
+
+# Campaign ID with the phrase views of that campaign
+type CampaignPhraseViews = tuple[int, list[PhraseViews]]
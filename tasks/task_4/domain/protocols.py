@@ -1,8 +1,9 @@
 """Domain protocols for Task 4."""
 
+from collections.abc import AsyncIterator, Sequence
 from typing import Protocol
 
-from tasks.task_4.domain.entities import PhraseViews
+from tasks.task_4.domain.entities import CampaignPhraseViews, PhraseViews, PhraseViewsSeries, ViewsPeriod
 
 
 class QueryRepository(Protocol):
@@ -13,3 +14,22 @@ class QueryRepository(Protocol):
         campaign_id: int,
     ) -> list[PhraseViews]:  # pyright: ignore[reportReturnType]
         """Get phrase views by hour for today."""
+
+    def stream_phrase_views_by_hour(
+        self,
+        campaign_id: int,
+    ) -> AsyncIterator[PhraseViews]:  # pyright: ignore[reportReturnType]
+        """Stream phrase views by hour for today one phrase at a time."""
+
+    def iterate_phrase_views_by_hour(
+        self,
+        campaign_ids: Sequence[int],
+    ) -> AsyncIterator[CampaignPhraseViews]:  # pyright: ignore[reportReturnType]
+        """Stream phrase views by hour for today grouped per campaign."""
+
+    async def get_phrase_views_series(
+        self,
+        campaign_id: int,
+        period: ViewsPeriod,
+    ) -> list[PhraseViewsSeries]:  # pyright: ignore[reportReturnType]
+        """Get phrase views over a date range in buckets of the period granularity."""
@@ -1,10 +1,16 @@
 """Use cases for Task 4."""
 
+from collections.abc import AsyncIterator, Sequence
+
 from loguru import logger
 
-from tasks.task_4.domain.entities import PhraseViews
+from shared.domain.entities.exceptions import ValidationError
+from tasks.task_4.domain.entities import PhraseViews, PhraseViewsSeries, ViewsPeriod
 from tasks.task_4.domain.protocols import QueryRepository
 
+# Upper bound on points per phrase: a week of minutes or over a year of hours
+MAX_SERIES_BUCKETS = 7 * 24 * 60
+
 
 class GetPhraseViewsUseCase:
     """Use case for getting phrase views by hour."""
@@ -34,3 +40,67 @@ class GetPhraseViewsUseCase:
 
         logger.info(f"Found {len(results)} phrases with views")
         return results
+
+    def stream(self, campaign_id: int) -> AsyncIterator[PhraseViews]:
+        """
+        Stream phrase views without collecting them first.
+
+        Args:
+            campaign_id: Campaign ID
+
+        Returns:
+            Async iterator over phrase views by hour
+        """
+        logger.info(f"Streaming phrase views for campaign {campaign_id}")
+        return self._repository.stream_phrase_views_by_hour(campaign_id)
+
+    async def execute_many(self, campaign_ids: Sequence[int]) -> dict[int, list[PhraseViews]]:
+        """
+        Execute getting phrase views for several campaigns with one query.
+
+        Args:
+            campaign_ids: Campaign IDs; duplicates are ignored
+
+        Returns:
+            Phrase views by campaign ID in request order; campaigns without
+            views map to an empty list
+        """
+        results: dict[int, list[PhraseViews]] = {campaign_id: [] for campaign_id in campaign_ids}
+        logger.info(f"Fetching phrase views for {len(results)} campaigns")
+
+        async for campaign_id, phrase_views in self._repository.iterate_phrase_views_by_hour(list(results)):
+            results[campaign_id] = phrase_views
+
+        logger.info(f"Found phrase views for {sum(bool(views) for views in results.values())} campaigns")
+        return results
+
+    async def execute_range(self, campaign_id: int, period: ViewsPeriod) -> list[PhraseViewsSeries]:
+        """
+        Execute getting phrase views over a date range.
+
+        Args:
+            campaign_id: Campaign ID
+            period: Date range and granularity
+
+        Returns:
+            List of phrase views series
+
+        Raises:
+            ValidationError: If the range is reversed or has too many buckets
+        """
+        if period.date_from > period.date_to:
+            msg = f"date_from {period.date_from} is after date_to {period.date_to}"
+            raise ValidationError(msg)
+        if period.bucket_count > MAX_SERIES_BUCKETS:
+            msg = f"Range has {period.bucket_count} {period.granularity} buckets, at most {MAX_SERIES_BUCKETS} allowed"
+            raise ValidationError(msg)
+
+        logger.info(
+            f"Fetching {period.granularity} phrase views for campaign {campaign_id} "
+            f"from {period.date_from} to {period.date_to}",
+        )
+
+        results = await self._repository.get_phrase_views_series(campaign_id, period)
+
+        logger.info(f"Found {len(results)} phrases with views")
+        return results
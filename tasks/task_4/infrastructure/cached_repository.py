@@ -0,0 +1,88 @@
+"""Caching decorator for the Task 4 query repository."""
+
+from collections.abc import AsyncIterator, Sequence
+from functools import partial
+
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from tasks.task_4.domain.entities import CampaignPhraseViews, PhraseViews, PhraseViewsSeries, ViewsPeriod
+from tasks.task_4.domain.protocols import QueryRepository
+
+
+class CachedQueryRepository:
+    """Query repository serving repeated requests from a TTL cache."""
+
+    def __init__(self, repository: QueryRepository, cache: TTLCache[tuple[str, int], list[PhraseViews]]) -> None:
+        """
+        Initialize cached repository.
+
+        Args:
+            repository: Repository that queries ClickHouse
+            cache: Result cache keyed by query name and campaign ID
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def get_phrase_views_by_hour(self, campaign_id: int) -> list[PhraseViews]:
+        """
+        Get phrase views by hour for today, from cache when fresh.
+
+        Concurrent requests for the same campaign share one query.
+
+        Args:
+            campaign_id: Campaign ID
+
+        Returns:
+            List of phrase views
+        """
+        return await self._cache.get_or_load(
+            ("phrase_views_by_hour", campaign_id),
+            partial(self._repository.get_phrase_views_by_hour, campaign_id),
+        )
+
+    def stream_phrase_views_by_hour(self, campaign_id: int) -> AsyncIterator[PhraseViews]:
+        """
+        Stream phrase views by hour, bypassing the cache.
+
+        Streaming exists to avoid holding the whole result in memory, which
+        caching it would defeat.
+
+        Args:
+            campaign_id: Campaign ID
+
+        Returns:
+            Async iterator over phrase views
+        """
+        return self._repository.stream_phrase_views_by_hour(campaign_id)
+
+    def iterate_phrase_views_by_hour(
+        self,
+        campaign_ids: Sequence[int],
+    ) -> AsyncIterator[CampaignPhraseViews]:
+        """
+        Stream phrase views for several campaigns, bypassing the cache.
+
+        A batch is already a single query, so it is not split into cached
+        per-campaign lookups.
+
+        Args:
+            campaign_ids: Campaign IDs
+
+        Returns:
+            Async iterator over campaign ID and phrase views pairs
+        """
+        return self._repository.iterate_phrase_views_by_hour(campaign_ids)
+
+    async def get_phrase_views_series(self, campaign_id: int, period: ViewsPeriod) -> list[PhraseViewsSeries]:
+        """
+        Get phrase views over a date range, bypassing the cache.
+
+        Ranges are chosen per request, so they rarely repeat within the TTL.
+
+        Args:
+            campaign_id: Campaign ID
+            period: Date range and granularity
+
+        Returns:
+            List of phrase views series
+        """
+        return await self._repository.get_phrase_views_series(campaign_id, period)
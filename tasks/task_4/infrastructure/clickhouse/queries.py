@@ -1,49 +1,289 @@
 """ClickHouse queries for Task 4."""
 
+from types import MappingProxyType
 
-def get_phrase_views_by_hour_query(campaign_id: int) -> str:
+from shared.infrastructure.database.clickhouse_query import QueryRegistry, QueryTemplate
+from tasks.task_4.domain.entities import Granularity
+
+QUERIES = QueryRegistry()
+
+SINGLE_CAMPAIGN = "campaign_id = {campaign_id:Int32}"
+MANY_CAMPAIGNS = "campaign_id IN {campaign_ids:Array(Int32)}"
+RAW_DATE_RANGE = "toDate(dt) BETWEEN {date_from:Date} AND {date_to:Date}"
+AGGREGATED_DATE_RANGE = "date BETWEEN {date_from:Date} AND {date_to:Date}"
+
+# Bucket start time per granularity
+RAW_BUCKETS: MappingProxyType[Granularity, str] = MappingProxyType(
+    {
+        "minute": "toStartOfMinute(dt)",
+        "hour": "toStartOfHour(dt)",
+        "day": "toStartOfDay(dt)",
+    }
+)
+# The hourly pre-aggregate has no minute resolution
+AGGREGATED_BUCKETS: MappingProxyType[Granularity, str] = MappingProxyType(
+    {
+        "hour": "toDateTime(date) + toIntervalHour(hour)",
+        "day": "toDateTime(date)",
+    }
+)
+
+
+def raw_hourly_views(key: str, campaign_filter: str) -> str:
     """
-    Build query for phrase views by hour.
+    Build the hourly_views body over raw phrases_views rows.
 
     Args:
-        campaign_id: Campaign ID (validated as integer)
+        key: Grouping columns besides hour
+        campaign_filter: Campaign condition with a query parameter
 
     Returns:
-        SQL query with campaign_id interpolated
+        SELECT of the latest cumulative views per key and hour
+    """
+    return f"""
+    SELECT
+        {key},
+        toHour(dt) as hour,
+        argMax(views, dt) as max_views
+    FROM phrases_views
+    WHERE {campaign_filter}
+      AND toDate(dt) = today()
+    GROUP BY {key}, hour
+"""  # noqa: S608 - only constant fragments are interpolated
+
 
-    Note:
-        aiochclient only supports parameter binding for INSERT queries.
-        For SELECT queries, we use safe string formatting with integer validation.
+def aggregated_hourly_views(key: str, campaign_filter: str) -> str:
     """
-    if not isinstance(campaign_id, int):
-        msg = f"campaign_id must be an integer, got {type(campaign_id)}"
-        raise TypeError(msg)
+    Build the hourly_views body over the phrases_views_hourly pre-aggregate (see aggregates.sql).
 
+    Args:
+        key: Grouping columns besides hour
+        campaign_filter: Campaign condition with a query parameter
+
+    Returns:
+        SELECT of the latest cumulative views per key and hour
+    """
+    return f"""
+    SELECT
+        {key},
+        hour,
+        argMaxMerge(max_views) as max_views
+    FROM phrases_views_hourly
+    WHERE {campaign_filter}
+      AND date = today()
+    GROUP BY {key}, hour
+"""  # noqa: S608 - only constant fragments are interpolated
+
+
+def raw_bucket_views(bucket: str) -> str:
+    """
+    Build the bucket_views body over raw phrases_views rows of a date range.
+
+    Args:
+        bucket: Bucket start expression over dt
+
+    Returns:
+        SELECT of the latest cumulative views per phrase and bucket
+    """
     return f"""
-WITH hourly_views AS (
     SELECT
         phrase,
-        toHour(dt) as hour,
+        {bucket} as bucket,
         argMax(views, dt) as max_views
     FROM phrases_views
-    WHERE campaign_id = {campaign_id}
+    WHERE {SINGLE_CAMPAIGN}
+      AND {RAW_DATE_RANGE}
+    GROUP BY phrase, bucket
+"""  # noqa: S608 - only constant fragments are interpolated
+
+
+def aggregated_bucket_views(bucket: str) -> str:
+    """
+    Build the bucket_views body over the phrases_views_hourly pre-aggregate of a date range.
+
+    Args:
+        bucket: Bucket start expression over date and hour
+
+    Returns:
+        SELECT of the latest cumulative views per phrase and bucket
+    """
+    return f"""
+    SELECT
+        phrase,
+        {bucket} as bucket,
+        argMaxMerge(max_views) as max_views
+    FROM phrases_views_hourly
+    WHERE {SINGLE_CAMPAIGN}
+      AND {AGGREGATED_DATE_RANGE}
+    GROUP BY phrase, bucket
+"""  # noqa: S608 - only constant fragments are interpolated
+
+
+def raw_samples(campaign_filter: str) -> str:
+    """
+    Build the samples body over today's raw phrases_views rows.
+
+    Args:
+        campaign_filter: Campaign condition with a query parameter
+
+    Returns:
+        SELECT of every cumulative views sample with its hour
+    """
+    return f"""
+    SELECT
+        campaign_id,
+        phrase,
+        toHour(dt) as hour,
+        views
+    FROM phrases_views
+    WHERE {campaign_filter}
       AND toDate(dt) = today()
-    GROUP BY phrase, hour
-),
+"""  # noqa: S608 - only constant fragments are interpolated
+
+
+def columnar_views(samples: str, views: str) -> str:
+    """
+    Build a query returning samples as one row of column arrays.
+
+    Deltas are then computed in Python (see deltas.py) instead of by window
+    functions on the server.
+
+    Args:
+        samples: Body with campaign_id, phrase and hour columns
+        views: Cumulative views column of the samples
+
+    Returns:
+        Query text with query parameter placeholders kept intact
+    """
+    return f"""
+SELECT
+    groupArray(campaign_id) as campaign_ids,
+    groupArray(phrase) as phrases,
+    groupArray(hour) as hours,
+    groupArray({views}) as views
+FROM ({samples})
+"""  # noqa: S608 - only constant fragments are interpolated
+
+
+def phrase_views_by_hour(hourly_views: str, key: str) -> str:
+    """
+    Build the phrase views query turning hourly cumulative views into deltas.
+
+    Args:
+        hourly_views: Body of the hourly_views CTE
+        key: Grouping columns, ending with phrase
+
+    Returns:
+        Query text with query parameter placeholders kept intact
+    """
+    return f"""
+WITH hourly_views AS ({hourly_views}),
 views_deltas AS (
     SELECT
-        phrase,
+        {key},
         hour,
         max_views - lagInFrame(max_views, 1, 0) OVER (
-            PARTITION BY phrase ORDER BY hour
+            PARTITION BY {key} ORDER BY hour
         ) as delta
     FROM hourly_views
 )
 SELECT
-    phrase,
+    {key},
     arrayReverse(groupArray((hour, delta))) as views_by_hour
 FROM views_deltas
 WHERE delta > 0
+GROUP BY {key}
+ORDER BY {key}
+"""  # noqa: S608 - only constant fragments are interpolated
+
+
+# Parameters are bound by the server, so the text is the same for every campaign
+PHRASE_VIEWS_BY_HOUR = QUERIES.register(
+    "phrase_views_by_hour",
+    phrase_views_by_hour(raw_hourly_views("phrase", SINGLE_CAMPAIGN), "phrase"),
+)
+PHRASE_VIEWS_BY_HOUR_AGGREGATED = QUERIES.register(
+    "phrase_views_by_hour_aggregated",
+    phrase_views_by_hour(aggregated_hourly_views("phrase", SINGLE_CAMPAIGN), "phrase"),
+)
+
+# One scan for several campaigns; rows come ordered by campaign_id
+PHRASE_VIEWS_BY_HOUR_BATCH = QUERIES.register(
+    "phrase_views_by_hour_batch",
+    phrase_views_by_hour(raw_hourly_views("campaign_id, phrase", MANY_CAMPAIGNS), "campaign_id, phrase"),
+)
+PHRASE_VIEWS_BY_HOUR_BATCH_AGGREGATED = QUERIES.register(
+    "phrase_views_by_hour_batch_aggregated",
+    phrase_views_by_hour(aggregated_hourly_views("campaign_id, phrase", MANY_CAMPAIGNS), "campaign_id, phrase"),
+)
+
+# Column arrays for the numpy delta path; the aggregated variants ship hourly maxima only
+PHRASE_VIEWS_SAMPLES = QUERIES.register(
+    "phrase_views_samples",
+    columnar_views(raw_samples(SINGLE_CAMPAIGN), "views"),
+)
+PHRASE_VIEWS_SAMPLES_AGGREGATED = QUERIES.register(
+    "phrase_views_samples_aggregated",
+    columnar_views(aggregated_hourly_views("campaign_id, phrase", SINGLE_CAMPAIGN), "max_views"),
+)
+PHRASE_VIEWS_SAMPLES_BATCH = QUERIES.register(
+    "phrase_views_samples_batch",
+    columnar_views(raw_samples(MANY_CAMPAIGNS), "views"),
+)
+PHRASE_VIEWS_SAMPLES_BATCH_AGGREGATED = QUERIES.register(
+    "phrase_views_samples_batch_aggregated",
+    columnar_views(aggregated_hourly_views("campaign_id, phrase", MANY_CAMPAIGNS), "max_views"),
+)
+
+
+def phrase_views_series(bucket_views: str) -> str:
+    """
+    Build the phrase views query turning cumulative views per bucket into deltas.
+
+    As in the hourly query, the first bucket of the range is compared with zero.
+
+    Args:
+        bucket_views: Body of the bucket_views CTE
+
+    Returns:
+        Query text with query parameter placeholders kept intact
+    """
+    return f"""
+WITH bucket_views AS ({bucket_views}),
+views_deltas AS (
+    SELECT
+        phrase,
+        bucket,
+        max_views - lagInFrame(max_views, 1, 0) OVER (
+            PARTITION BY phrase ORDER BY bucket
+        ) as delta
+    FROM bucket_views
+)
+SELECT
+    phrase,
+    arraySort(groupArray((bucket, delta))) as views
+FROM views_deltas
+WHERE delta > 0
 GROUP BY phrase
 ORDER BY phrase
-"""  # noqa: S608 - campaign_id is validated as integer, safe from SQL injection
+"""  # noqa: S608 - only constant fragments are interpolated
+
+
+# One template per granularity, so every query text stays constant
+PHRASE_VIEWS_SERIES: MappingProxyType[Granularity, QueryTemplate] = MappingProxyType(
+    {
+        granularity: QUERIES.register(
+            f"phrase_views_series_{granularity}", phrase_views_series(raw_bucket_views(bucket))
+        )
+        for granularity, bucket in RAW_BUCKETS.items()
+    }
+)
+PHRASE_VIEWS_SERIES_AGGREGATED: MappingProxyType[Granularity, QueryTemplate] = MappingProxyType(
+    {
+        granularity: QUERIES.register(
+            f"phrase_views_series_{granularity}_aggregated",
+            phrase_views_series(aggregated_bucket_views(bucket)),
+        )
+        for granularity, bucket in AGGREGATED_BUCKETS.items()
+    }
+)
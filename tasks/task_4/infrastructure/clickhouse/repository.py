@@ -1,23 +1,64 @@
 """ClickHouse repository implementation for Task 4."""
 
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Literal
+
 from loguru import logger
 
 from shared.infrastructure.database.clickhouse_client import ClickHouseClient
-from tasks.task_4.domain.entities import PhraseViews
-from tasks.task_4.infrastructure.clickhouse.queries import get_phrase_views_by_hour_query
+from shared.infrastructure.database.clickhouse_cluster import ClickHouseClusterClient
+from shared.infrastructure.database.clickhouse_query import QueryTemplate
+from tasks.task_4.domain.entities import CampaignPhraseViews, PhraseViews, PhraseViewsSeries, ViewsPeriod
+from tasks.task_4.infrastructure.clickhouse import queries
+from tasks.task_4.infrastructure.deltas import compute_phrase_views, load_numpy
 
 
 class QueryRepositoryImpl:
     """Query repository implementation."""
 
-    def __init__(self, client: ClickHouseClient) -> None:
+    def __init__(
+        self,
+        client: ClickHouseClient | ClickHouseClusterClient,
+        source: Literal["raw", "aggregated"] = "raw",
+        deltas: Literal["clickhouse", "numpy"] = "clickhouse",
+    ) -> None:
         """
         Initialize repository.
 
         Args:
             client: ClickHouse client
+            source: "raw" scans phrases_views, "aggregated" reads the
+                phrases_views_hourly pre-aggregate from aggregates.sql; minute
+                series always scan phrases_views
+            deltas: "clickhouse" computes hourly deltas with window functions,
+                "numpy" fetches column arrays and computes them in Python;
+                streaming and series always use ClickHouse
+
+        Raises:
+            ConfigurationError: If deltas is "numpy" and numpy is not installed
         """
         self._client = client
+        aggregated = source == "aggregated"
+        self._phrase_views_query = (
+            queries.PHRASE_VIEWS_BY_HOUR_AGGREGATED if aggregated else queries.PHRASE_VIEWS_BY_HOUR
+        )
+        self._batch_query = (
+            queries.PHRASE_VIEWS_BY_HOUR_BATCH_AGGREGATED if aggregated else queries.PHRASE_VIEWS_BY_HOUR_BATCH
+        )
+        self._series_queries = (
+            {**queries.PHRASE_VIEWS_SERIES, **queries.PHRASE_VIEWS_SERIES_AGGREGATED}
+            if aggregated
+            else queries.PHRASE_VIEWS_SERIES
+        )
+        self._samples_query = queries.PHRASE_VIEWS_SAMPLES_AGGREGATED if aggregated else queries.PHRASE_VIEWS_SAMPLES
+        self._batch_samples_query = (
+            queries.PHRASE_VIEWS_SAMPLES_BATCH_AGGREGATED if aggregated else queries.PHRASE_VIEWS_SAMPLES_BATCH
+        )
+        self._numpy = deltas == "numpy"
+        if self._numpy:
+            # Fail at startup rather than on the first request
+            load_numpy()
 
     async def get_phrase_views_by_hour(self, campaign_id: int) -> list[PhraseViews]:
         """
@@ -29,9 +70,15 @@ class QueryRepositoryImpl:
         Returns:
             List of phrase views
         """
+        if self._numpy:
+            groups = await self._compute_phrase_views(self._samples_query, campaign_id=campaign_id)
+            return groups[0][1] if groups else []
+
         logger.debug(f"Executing query for campaign {campaign_id}")
-        query = get_phrase_views_by_hour_query(campaign_id)
-        results = await self._client.fetch(query)
+        results = await self._client.fetch(
+            self._phrase_views_query.sql,
+            params=self._phrase_views_query.bind(campaign_id=campaign_id),
+        )
 
         return [
             PhraseViews(
@@ -40,3 +87,106 @@ class QueryRepositoryImpl:
             )
             for row in results
         ]
+
+    async def stream_phrase_views_by_hour(self, campaign_id: int) -> AsyncIterator[PhraseViews]:
+        """
+        Stream phrase views by hour for today as rows arrive from ClickHouse.
+
+        Args:
+            campaign_id: Campaign ID
+
+        Yields:
+            Phrase views, one per phrase
+        """
+        logger.debug(f"Streaming query for campaign {campaign_id}")
+        rows = self._client.iterate(
+            self._phrase_views_query.sql,
+            params=self._phrase_views_query.bind(campaign_id=campaign_id),
+        )
+        async for row in rows:
+            yield PhraseViews(phrase=row["phrase"], views_by_hour=row["views_by_hour"])
+
+    async def iterate_phrase_views_by_hour(
+        self,
+        campaign_ids: Sequence[int],
+    ) -> AsyncIterator[CampaignPhraseViews]:
+        """
+        Stream phrase views by hour for today for several campaigns with one query.
+
+        Args:
+            campaign_ids: Campaign IDs
+
+        Yields:
+            Campaign ID and its phrase views, as soon as the campaign's rows
+            are complete; campaigns without views are skipped
+        """
+        if self._numpy:
+            for group in await self._compute_phrase_views(self._batch_samples_query, campaign_ids=list(campaign_ids)):
+                yield group
+            return
+
+        logger.debug(f"Executing batch query for {len(campaign_ids)} campaigns")
+        rows = self._client.iterate(
+            self._batch_query.sql,
+            params=self._batch_query.bind(campaign_ids=list(campaign_ids)),
+        )
+
+        current_id = None
+        phrase_views: list[PhraseViews] = []
+        async for row in rows:
+            if row["campaign_id"] != current_id:
+                if current_id is not None:
+                    yield current_id, phrase_views
+                current_id, phrase_views = row["campaign_id"], []
+            phrase_views.append(PhraseViews(phrase=row["phrase"], views_by_hour=row["views_by_hour"]))
+        if current_id is not None:
+            yield current_id, phrase_views
+
+    async def get_phrase_views_series(self, campaign_id: int, period: ViewsPeriod) -> list[PhraseViewsSeries]:
+        """
+        Get phrase views over a date range in buckets of the period granularity.
+
+        Args:
+            campaign_id: Campaign ID
+            period: Date range and granularity
+
+        Returns:
+            List of phrase views series
+        """
+        query = self._series_queries[period.granularity]
+        logger.debug(f"Executing {query.name} for campaign {campaign_id}")
+        results = await self._client.fetch(
+            query.sql,
+            params=query.bind(campaign_id=campaign_id, date_from=period.date_from, date_to=period.date_to),
+        )
+
+        return [PhraseViewsSeries(phrase=row["phrase"], views=row["views"]) for row in results]
+
+    async def _compute_phrase_views(
+        self,
+        query: QueryTemplate,
+        **params: Any,  # noqa: ANN401
+    ) -> list[CampaignPhraseViews]:
+        """
+        Fetch view samples as column arrays and compute deltas with numpy.
+
+        Args:
+            query: Samples query template
+            **params: Query parameters
+
+        Returns:
+            Phrase views per campaign
+        """
+        logger.debug(f"Executing {query.name} with numpy deltas")
+        results = await self._client.fetch(query.sql, params=query.bind(**params))
+        if not results:
+            return []
+        columns = results[0]
+        # CPU-bound for large campaigns, so it runs off the event loop
+        return await asyncio.to_thread(
+            compute_phrase_views,
+            columns["campaign_ids"],
+            columns["phrases"],
+            columns["hours"],
+            columns["views"],
+        )
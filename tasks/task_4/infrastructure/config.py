@@ -0,0 +1,26 @@
+"""Task 4 configuration."""
+
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from shared.infrastructure.config.base import BaseConfig
+
+
+class PhraseViewsConfig(BaseConfig):
+    """Phrase views query configuration."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="PHRASE_VIEWS_",
+    )
+
+    source: Literal["raw", "aggregated"] = Field(
+        default="raw",
+        description="Query raw phrases_views or the phrases_views_hourly pre-aggregate (see aggregates.sql)",
+    )
+    deltas: Literal["clickhouse", "numpy"] = Field(
+        default="clickhouse",
+        description="Compute hourly deltas with ClickHouse window functions or with numpy in the service",
+    )
@@ -0,0 +1,116 @@
+"""Vectorized hourly views deltas for Task 4."""
+
+import importlib
+import itertools
+from collections.abc import Sequence
+from functools import cache
+from types import ModuleType
+from typing import Any
+
+from shared.domain.entities.exceptions import ConfigurationError
+from tasks.task_4.domain.entities import CampaignPhraseViews, PhraseViews
+
+HOURS_PER_DAY = 24
+
+
+@cache
+def load_numpy() -> ModuleType:
+    """
+    Import numpy, which the numpy delta path needs.
+
+    Returns:
+        numpy module
+
+    Raises:
+        ConfigurationError: If numpy is not installed
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as exc:
+        msg = "PHRASE_VIEWS_DELTAS=numpy requires the 'numpy' package (install ecomet-task-4[numpy])"
+        raise ConfigurationError(msg) from exc
+
+
+def _first_of_runs(np: ModuleType, values: Any) -> Any:  # noqa: ANN401
+    """Mask of the elements that start a run of equal sorted values."""
+    return np.concatenate(([True], values[1:] != values[:-1]))
+
+
+def _hourly_deltas(np: ModuleType, keys: Any, views: Any) -> tuple[Any, Any]:  # noqa: ANN401
+    """Positive hourly deltas per (group, hour) key, as sorted keys and deltas."""
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(_first_of_runs(np, sorted_keys))
+    hour_keys = sorted_keys[starts]
+    hourly_max = np.maximum.reduceat(views[order], starts)
+
+    first_hours = _first_of_runs(np, hour_keys // HOURS_PER_DAY)
+    deltas = hourly_max - np.where(first_hours, 0, np.roll(hourly_max, 1))
+    growing = deltas > 0
+    return hour_keys[growing], deltas[growing]
+
+
+def _views_by_hour(keys: Any, deltas: Any) -> list[tuple[int, int]]:  # noqa: ANN401
+    """Tuples of one group, latest hour first like the SQL query."""
+    return list(zip(reversed((keys % HOURS_PER_DAY).tolist()), reversed(deltas.tolist()), strict=True))
+
+
+def _group_results(
+    np: ModuleType,
+    keys: Any,  # noqa: ANN401
+    deltas: Any,  # noqa: ANN401
+    campaign_values: Any,  # noqa: ANN401
+    phrase_values: Any,  # noqa: ANN401
+) -> list[CampaignPhraseViews]:
+    """Split sorted deltas into phrase views per campaign."""
+    results: dict[int, list[PhraseViews]] = {}
+    groups = keys // HOURS_PER_DAY
+    bounds = [*np.flatnonzero(_first_of_runs(np, groups)).tolist(), len(groups)]
+    for start, end in itertools.pairwise(bounds):
+        campaign_code, phrase_code = divmod(int(groups[start]), len(phrase_values))
+        results.setdefault(int(campaign_values[campaign_code]), []).append(
+            PhraseViews(
+                phrase=str(phrase_values[phrase_code]),
+                views_by_hour=_views_by_hour(keys[start:end], deltas[start:end]),
+            ),
+        )
+    return list(results.items())
+
+
+def compute_phrase_views(
+    campaign_ids: Sequence[int],
+    phrases: Sequence[str],
+    hours: Sequence[int],
+    views: Sequence[int],
+) -> list[CampaignPhraseViews]:
+    """
+    Turn cumulative view samples into hourly deltas with grouped array operations.
+
+    Mirrors the SQL query: the views of an hour are its maximum cumulative
+    value, the delta is the difference with the previous hour of the same
+    campaign and phrase (the first hour is compared with zero), and hours
+    without growth are dropped.
+
+    Args:
+        campaign_ids: Campaign ID column
+        phrases: Phrase column
+        hours: Hour of day column
+        views: Cumulative views column; raw samples or hourly maxima
+
+    Returns:
+        Phrase views per campaign, ordered by campaign ID and phrase
+    """
+    if not phrases:
+        return []
+    np = load_numpy()
+    campaign_values, campaign_codes = np.unique(np.asarray(campaign_ids, dtype=np.int64), return_inverse=True)
+    phrase_values, phrase_codes = np.unique(np.asarray(phrases, dtype=np.str_), return_inverse=True)
+    groups = campaign_codes * len(phrase_values) + phrase_codes
+    keys, deltas = _hourly_deltas(
+        np,
+        groups * HOURS_PER_DAY + np.asarray(hours, dtype=np.int64),
+        np.asarray(views, dtype=np.int64),
+    )
+    if not keys.size:
+        return []
+    return _group_results(np, keys, deltas, campaign_values, phrase_values)
@@ -0,0 +1,37 @@
+-- Recommended layout of phrases_views for range queries.
+-- Daily partitions let ClickHouse skip whole parts outside the requested dates, and
+-- the campaign-first sort key keeps one campaign's rows together inside a part, so a
+-- multi-day query for one campaign reads a narrow slice of each matching partition.
+-- The sort key holds the same columns as table.sql, so ReplacingMergeTree still
+-- collapses the same duplicates.
+CREATE TABLE phrases_views_partitioned
+(
+    dt          DateTime,
+    campaign_id Int32 comment 'Идентификатор рекламной кампании',
+    phrase      String comment 'Поисковой запрос',
+    views       Int32 comment 'Кумулятивное (суммарное) количество просмотров по поисковому запросу за всё время'
+) engine = ReplacingMergeTree
+PARTITION BY toYYYYMMDD(dt)
+ORDER BY (campaign_id, phrase, dt);
+
+-- Migrate existing rows, then swap the tables atomically (Atomic database engine).
+-- Writers keep inserting into phrases_views during the copy, so copy up to a watermark
+-- taken beforehand and backfill newer rows from the old table once the swap is done:
+--   clickhouse-client --multiquery \
+--     --param_watermark="$(clickhouse-client --query 'SELECT max(dt) FROM phrases_views')" \
+--     < partitioned.sql
+-- Rows that arrive late with a dt at or before the watermark are not backfilled, so pause
+-- writers that replay past dates until the script finishes.
+INSERT INTO phrases_views_partitioned
+SELECT dt, campaign_id, phrase, views
+FROM phrases_views
+WHERE dt <= {watermark:DateTime};
+
+EXCHANGE TABLES phrases_views AND phrases_views_partitioned;
+
+-- phrases_views_partitioned is the old table now: backfill the rows written to it
+-- between the copy and the swap.
+INSERT INTO phrases_views
+SELECT dt, campaign_id, phrase, views
+FROM phrases_views_partitioned
+WHERE dt > {watermark:DateTime};
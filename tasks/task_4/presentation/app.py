@@ -2,19 +2,26 @@
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from dataclasses import asdict
+from functools import partial
 from pathlib import Path
 
 from fastapi import FastAPI
 from loguru import logger
 
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from shared.infrastructure.config.cache import CacheConfig
 from shared.infrastructure.config.clickhouse import ClickHouseConfig
 from shared.infrastructure.database.clickhouse_client import ClickHouseClient
+from shared.infrastructure.database.clickhouse_cluster import ClickHouseClusterClient
 from shared.infrastructure.logging.setup import setup_logging
 from shared.infrastructure.version import get_version_from_pyproject
 from shared.presentation.fastapi.exception_handlers import register_exception_handlers
 from shared.presentation.fastapi.health import create_health_router
 from tasks.task_4.domain.use_cases import GetPhraseViewsUseCase
+from tasks.task_4.infrastructure.cached_repository import CachedQueryRepository
 from tasks.task_4.infrastructure.clickhouse.repository import QueryRepositoryImpl
+from tasks.task_4.infrastructure.config import PhraseViewsConfig
 from tasks.task_4.presentation.endpoints import router
 
 TASK_ROOT = Path(__file__).parent.parent
@@ -34,24 +41,37 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     logger.info("Starting Task 4 application")
 
-    # Initialize ClickHouse client and repository
+    # Initialize ClickHouse client and repository; reads are balanced over replicas when configured.
+    # Everything that can fail on configuration is built before the client opens its session.
     config = ClickHouseConfig()
-    client = ClickHouseClient(config)
-    await client.__aenter__()
-
-    repository = QueryRepositoryImpl(client)
+    client = ClickHouseClusterClient(config) if config.replicas else ClickHouseClient(config)
+
+    phrase_views_config = PhraseViewsConfig()
+    repository = QueryRepositoryImpl(client, source=phrase_views_config.source, deltas=phrase_views_config.deltas)
+    health_stats = {"clickhouse": lambda: asdict(client.get_stats())}
+
+    # Phrase views only change when new data is ingested, so repeated requests are served from cache
+    cache_config = CacheConfig()
+    if cache_config.enabled:
+        cache = TTLCache(ttl=cache_config.ttl, max_size=cache_config.max_size, aligned=cache_config.aligned)
+        repository = CachedQueryRepository(repository, cache)
+        health_stats["query_cache"] = lambda: {**asdict(cache.stats), "size": len(cache)}
     use_case = GetPhraseViewsUseCase(repository)
 
     app.state.client = client
     app.state.repository = repository
     app.state.use_case = use_case
+    app.state.health_checks = {"clickhouse": partial(client.execute, "SELECT 1")}
+    app.state.health_stats = health_stats
 
+    await client.__aenter__()
     logger.info("Task 4 application initialized")
 
-    yield
-
-    # Cleanup
-    await client.__aexit__(None, None, None)
+    try:
+        yield
+    finally:
+        # Cleanup: flushes coalesced inserts before closing the session
+        await client.__aexit__(None, None, None)
     logger.info("Task 4 application shutdown complete")
 
 
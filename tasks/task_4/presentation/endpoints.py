@@ -1,22 +1,84 @@
 """API endpoints for Task 4."""
 
+from collections.abc import AsyncIterator
+from datetime import date
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from loguru import logger
+from pydantic import PositiveInt
 
+from shared.presentation.fastapi.responses import FastJSONResponse, dumps_json
+from tasks.task_4.domain.entities import Granularity, PhraseViews, ViewsPeriod
 from tasks.task_4.domain.use_cases import GetPhraseViewsUseCase
 from tasks.task_4.presentation.dependencies import get_use_case
-from tasks.task_4.presentation.models import PhraseViewsListResponse, PhraseViewsResponse
+from tasks.task_4.presentation.models import (
+    PhraseViewsBatchResponse,
+    PhraseViewsListResponse,
+    PhraseViewsResponse,
+    PhraseViewsSeriesListResponse,
+    PhraseViewsSeriesResponse,
+)
 
 router = APIRouter(prefix="/api", tags=["phrase-views"])
 
+MAX_BATCH_CAMPAIGNS = 100
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_LINE_END = b"\n"
+
+
+def to_list_response(campaign_id: int, phrase_views: list[PhraseViews]) -> PhraseViewsListResponse:
+    """
+    Build the response for one campaign.
+
+    Args:
+        campaign_id: Campaign ID
+        phrase_views: Phrase views of the campaign
+
+    Returns:
+        Phrase views list response
+    """
+    return PhraseViewsListResponse(
+        campaign_id=campaign_id,
+        total_phrases=len(phrase_views),
+        results=[
+            PhraseViewsResponse(
+                phrase=pv.phrase,
+                views_by_hour=pv.views_by_hour,
+            )
+            for pv in phrase_views
+        ],
+    )
+
+
+async def to_ndjson(first: PhraseViews | None, rest: AsyncIterator[PhraseViews]) -> AsyncIterator[bytes]:
+    """
+    Encode phrase views as newline-delimited JSON, one object per phrase.
+
+    Args:
+        first: Already received first phrase views, None when there are none
+        rest: Remaining phrase views
+
+    Yields:
+        Encoded lines
+    """
+    if first is None:
+        return
+    yield _encode_line(first)
+    async for phrase_views in rest:
+        yield _encode_line(phrase_views)
+
+
+def _encode_line(phrase_views: PhraseViews) -> bytes:
+    return dumps_json({"phrase": phrase_views.phrase, "views_by_hour": phrase_views.views_by_hour}) + NDJSON_LINE_END
+
 
 @router.get("/phrase-views", response_model=PhraseViewsListResponse)
 async def get_phrase_views(
     use_case: Annotated[GetPhraseViewsUseCase, Depends(get_use_case)],
     campaign_id: Annotated[int, Query(ge=1)],
-) -> PhraseViewsListResponse:
+) -> FastJSONResponse:
     """
     Get phrase views by hour for today.
 
@@ -31,14 +93,100 @@ async def get_phrase_views(
 
     phrase_views = await use_case.execute(campaign_id)
 
-    return PhraseViewsListResponse(
-        campaign_id=campaign_id,
-        total_phrases=len(phrase_views),
-        results=[
-            PhraseViewsResponse(
-                phrase=pv.phrase,
-                views_by_hour=pv.views_by_hour,
-            )
-            for pv in phrase_views
-        ],
+    return FastJSONResponse(to_list_response(campaign_id, phrase_views))
+
+
+@router.get(
+    "/phrase-views/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def stream_phrase_views(
+    use_case: Annotated[GetPhraseViewsUseCase, Depends(get_use_case)],
+    campaign_id: Annotated[int, Query(ge=1)],
+) -> StreamingResponse:
+    """
+    Stream phrase views by hour for today as newline-delimited JSON.
+
+    Each line is ``{"phrase": ..., "views_by_hour": [[hour, delta], ...]}`` and
+    is sent as soon as its row arrives from ClickHouse, without building the
+    whole result in memory.
+
+    Args:
+        use_case: GetPhraseViewsUseCase instance
+        campaign_id: Campaign ID
+
+    Returns:
+        Streaming NDJSON response
+    """
+    logger.info(f"Streaming phrase views for campaign {campaign_id}")
+
+    phrase_views = use_case.stream(campaign_id)
+    # Awaited before the response starts, so query errors still get their error status
+    first = await anext(phrase_views, None)
+
+    return StreamingResponse(to_ndjson(first, phrase_views), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get("/phrase-views/batch", response_model=PhraseViewsBatchResponse)
+async def get_phrase_views_batch(
+    use_case: Annotated[GetPhraseViewsUseCase, Depends(get_use_case)],
+    campaign_id: Annotated[list[PositiveInt], Query(min_length=1, max_length=MAX_BATCH_CAMPAIGNS)],
+) -> FastJSONResponse:
+    """
+    Get phrase views by hour for today for several campaigns with one query.
+
+    Args:
+        use_case: GetPhraseViewsUseCase instance
+        campaign_id: Campaign IDs, repeated query parameter
+
+    Returns:
+        Phrase views by hour per campaign, in request order
+    """
+    logger.info(f"Getting phrase views for {len(campaign_id)} campaigns")
+
+    phrase_views = await use_case.execute_many(campaign_id)
+
+    return FastJSONResponse(
+        PhraseViewsBatchResponse(
+            results=[to_list_response(campaign, views) for campaign, views in phrase_views.items()],
+        ),
+    )
+
+
+@router.get("/phrase-views/range", response_model=PhraseViewsSeriesListResponse)
+async def get_phrase_views_range(
+    use_case: Annotated[GetPhraseViewsUseCase, Depends(get_use_case)],
+    campaign_id: Annotated[int, Query(ge=1)],
+    date_from: date,
+    date_to: date | None = None,
+    granularity: Granularity = "hour",
+) -> FastJSONResponse:
+    """
+    Get phrase views over a date range by minute, hour or day.
+
+    Args:
+        use_case: GetPhraseViewsUseCase instance
+        campaign_id: Campaign ID
+        date_from: First day of the range
+        date_to: Last day of the range, inclusive; defaults to date_from
+        granularity: Bucket size
+
+    Returns:
+        Phrase views by bucket start time
+    """
+    period = ViewsPeriod(date_from=date_from, date_to=date_to or date_from, granularity=granularity)
+    logger.info(f"Getting {granularity} phrase views for campaign {campaign_id}")
+
+    phrase_views = await use_case.execute_range(campaign_id, period)
+
+    return FastJSONResponse(
+        PhraseViewsSeriesListResponse(
+            campaign_id=campaign_id,
+            date_from=period.date_from,
+            date_to=period.date_to,
+            granularity=period.granularity,
+            total_phrases=len(phrase_views),
+            results=[PhraseViewsSeriesResponse(phrase=pv.phrase, views=pv.views) for pv in phrase_views],
+        ),
     )
@@ -1,7 +1,11 @@
 """Presentation models for Task 4."""
 
+from datetime import date, datetime
+
 from pydantic import BaseModel, Field
 
+from tasks.task_4.domain.entities import Granularity
+
 
 class PhraseViewsResponse(BaseModel):
     """Phrase views response."""
@@ -18,3 +22,29 @@ class PhraseViewsListResponse(BaseModel):
     campaign_id: int
     total_phrases: int
     results: list[PhraseViewsResponse]
+
+
+class PhraseViewsBatchResponse(BaseModel):
+    """Phrase views of several campaigns."""
+
+    results: list[PhraseViewsListResponse]
+
+
+class PhraseViewsSeriesResponse(BaseModel):
+    """Phrase views series response."""
+
+    phrase: str
+    views: list[tuple[datetime, int]] = Field(
+        description="List of (bucket_start, views_delta) tuples",
+    )
+
+
+class PhraseViewsSeriesListResponse(BaseModel):
+    """Phrase views series of a campaign over a date range."""
+
+    campaign_id: int
+    date_from: date
+    date_to: date
+    granularity: Granularity
+    total_phrases: int
+    results: list[PhraseViewsSeriesResponse]
@@ -0,0 +1,47 @@
+"""Tests for Task 4 cached repository."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from tasks.task_4.domain.entities import PhraseViews
+from tasks.task_4.infrastructure.cached_repository import CachedQueryRepository
+
+
+@pytest.fixture
+def mock_repository():
+    repository = AsyncMock()
+    repository.get_phrase_views_by_hour = AsyncMock(
+        return_value=[PhraseViews(phrase="платье", views_by_hour=[(12, 1)])],
+    )
+    return repository
+
+
+async def test_repeated_requests_hit_cache(mock_repository):
+    repository = CachedQueryRepository(mock_repository, TTLCache(ttl=600, max_size=10))
+
+    results = await asyncio.gather(*(repository.get_phrase_views_by_hour(1111111) for _ in range(3)))
+    results.append(await repository.get_phrase_views_by_hour(1111111))
+
+    assert all(result[0].phrase == "платье" for result in results)
+    mock_repository.get_phrase_views_by_hour.assert_awaited_once_with(1111111)
+
+
+async def test_campaigns_are_cached_separately(mock_repository):
+    repository = CachedQueryRepository(mock_repository, TTLCache(ttl=600, max_size=10))
+
+    await repository.get_phrase_views_by_hour(1)
+    await repository.get_phrase_views_by_hour(2)
+
+    assert mock_repository.get_phrase_views_by_hour.await_count == 2
+
+
+async def test_batch_bypasses_cache(mock_repository):
+    groups = object()
+    mock_repository.iterate_phrase_views_by_hour = MagicMock(return_value=groups)
+    repository = CachedQueryRepository(mock_repository, TTLCache(ttl=600, max_size=10))
+
+    assert repository.iterate_phrase_views_by_hour([1, 2]) is groups
+    mock_repository.iterate_phrase_views_by_hour.assert_called_once_with([1, 2])
@@ -0,0 +1,56 @@
+"""Tests for Task 4 numpy deltas."""
+
+from unittest.mock import patch
+
+import pytest
+
+from shared.domain.entities.exceptions import ConfigurationError
+from tasks.task_4.infrastructure.deltas import compute_phrase_views, load_numpy
+
+
+@pytest.fixture
+def numpy():
+    return pytest.importorskip("numpy")
+
+
+def test_matches_sql_deltas_on_sample_table(numpy):
+    # Cumulative views of table.sql: 11:50 to 16:00 every ten minutes
+    views = [0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3, 5, 5, 6, 8, 9, 10, 11, 11, 11, 12, 13, 13, 15, 15]
+    hours = [11] + [12] * 6 + [13] * 6 + [14] * 6 + [15] * 6 + [16]
+
+    result = compute_phrase_views([1111111] * len(views), ["платье"] * len(views), hours, views)
+
+    assert [(campaign_id, [(pv.phrase, pv.views_by_hour) for pv in views]) for campaign_id, views in result] == [
+        (1111111, [("платье", [(15, 4), (14, 6), (13, 4), (12, 1)])]),
+    ]
+
+
+def test_groups_by_campaign_and_phrase_in_order(numpy):
+    result = compute_phrase_views(
+        campaign_ids=[2, 1, 2, 1, 2],
+        phrases=["шапка", "платье", "платье", "платье", "шапка"],
+        hours=[10, 10, 11, 12, 11],
+        views=[5, 3, 2, 4, 5],
+    )
+
+    assert [(campaign_id, [(pv.phrase, pv.views_by_hour) for pv in views]) for campaign_id, views in result] == [
+        (1, [("платье", [(12, 1), (10, 3)])]),
+        (2, [("платье", [(11, 2)]), ("шапка", [(10, 5)])]),
+    ]
+
+
+def test_drops_phrases_without_growth(numpy):
+    assert compute_phrase_views([1, 1], ["платье", "платье"], [10, 11], [0, 0]) == []
+    assert compute_phrase_views([], [], [], []) == []
+
+
+def test_missing_numpy_is_configuration_error():
+    load_numpy.cache_clear()
+    try:
+        with (
+            patch("tasks.task_4.infrastructure.deltas.importlib.import_module", side_effect=ImportError),
+            pytest.raises(ConfigurationError, match="requires the 'numpy' package"),
+        ):
+            load_numpy()
+    finally:
+        load_numpy.cache_clear()
@@ -1,11 +1,13 @@
 """Tests for Task 4 endpoints."""
 
-from unittest.mock import AsyncMock
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from tasks.task_4.domain.entities import PhraseViews
+from shared.domain.entities.exceptions import DatabaseError, ValidationError
+from tasks.task_4.domain.entities import PhraseViews, PhraseViewsSeries, ViewsPeriod
 from tasks.task_4.presentation.app import create_app
 
 
@@ -50,6 +52,127 @@ async def test_get_phrase_views_invalid_campaign_id(app):
     assert response.status_code == 422
 
 
+async def _stream(*phrase_views):  # noqa: ANN002
+    for item in phrase_views:
+        yield item
+
+
+async def test_stream_phrase_views_endpoint(app, mock_use_case):
+    mock_use_case.stream = MagicMock(
+        return_value=_stream(
+            PhraseViews(phrase="платье", views_by_hour=[(12, 1), (13, 3)]),
+            PhraseViews(phrase="туфли", views_by_hour=[(14, 2)]),
+        )
+    )
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/phrase-views/stream?campaign_id=1111111")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text == (
+        '{"phrase":"платье","views_by_hour":[[12,1],[13,3]]}\n{"phrase":"туфли","views_by_hour":[[14,2]]}\n'
+    )
+    mock_use_case.stream.assert_called_once_with(1111111)
+
+
+async def test_stream_phrase_views_empty(app, mock_use_case):
+    mock_use_case.stream = MagicMock(return_value=_stream())
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/phrase-views/stream?campaign_id=1")
+
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+async def test_stream_phrase_views_query_error_keeps_status(app, mock_use_case):
+    async def failing():
+        msg = "Failed to fetch query results"
+        raise DatabaseError(msg)
+        yield
+
+    mock_use_case.stream = MagicMock(return_value=failing())
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/phrase-views/stream?campaign_id=1")
+
+    assert response.status_code == 503
+
+
+async def test_get_phrase_views_batch_endpoint(app, mock_use_case):
+    mock_use_case.execute_many = AsyncMock(
+        return_value={
+            2: [PhraseViews(phrase="туфли", views_by_hour=[(12, 2)])],
+            1: [],
+        }
+    )
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/phrase-views/batch?campaign_id=2&campaign_id=1")
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(result["campaign_id"], result["total_phrases"]) for result in results] == [(2, 1), (1, 0)]
+    assert results[0]["results"][0]["views_by_hour"] == [[12, 2]]
+    mock_use_case.execute_many.assert_called_once_with([2, 1])
+
+
+@pytest.mark.parametrize("query", ["", "?campaign_id=0", "?" + "&".join(["campaign_id=1"] * 101)])
+async def test_get_phrase_views_batch_validates_campaign_ids(app, query):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(f"/api/phrase-views/batch{query}")
+
+    assert response.status_code == 422
+
+
+async def test_get_phrase_views_range_endpoint(app, mock_use_case):
+    mock_use_case.execute_range = AsyncMock(
+        return_value=[PhraseViewsSeries(phrase="платье", views=[(datetime(2025, 1, 1, 12), 1)])]  # noqa: DTZ001
+    )
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(
+            "/api/phrase-views/range?campaign_id=1&date_from=2025-01-01&date_to=2025-01-02&granularity=minute"
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["granularity"], data["total_phrases"]) == ("minute", 1)
+    assert data["results"][0]["views"] == [["2025-01-01T12:00:00", 1]]
+    mock_use_case.execute_range.assert_called_once_with(
+        1, ViewsPeriod(date_from=date(2025, 1, 1), date_to=date(2025, 1, 2), granularity="minute")
+    )
+
+
+async def test_get_phrase_views_range_defaults_to_one_day_by_hour(app, mock_use_case):
+    mock_use_case.execute_range = AsyncMock(return_value=[])
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/phrase-views/range?campaign_id=1&date_from=2025-01-01")
+
+    assert response.status_code == 200
+    assert response.json()["date_to"] == "2025-01-01"
+    assert mock_use_case.execute_range.call_args.args[1].granularity == "hour"
+
+
+@pytest.mark.parametrize("query", ["campaign_id=1", "campaign_id=1&date_from=2025-01-01&granularity=week"])
+async def test_get_phrase_views_range_validates_query(app, query):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(f"/api/phrase-views/range?{query}")
+
+    assert response.status_code == 422
+
+
+async def test_get_phrase_views_range_invalid_period(app, mock_use_case):
+    mock_use_case.execute_range = AsyncMock(side_effect=ValidationError("date_from is after date_to"))
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/phrase-views/range?campaign_id=1&date_from=2025-01-02&date_to=2025-01-01")
+
+    assert response.status_code == 422
+
+
 async def test_health_endpoint(app):
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         response = await client.get("/health")
@@ -0,0 +1,28 @@
+"""Tests for application lifespan."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+
+from shared.domain.entities.exceptions import ConfigurationError
+from shared.infrastructure.config.clickhouse import ClickHouseConfig
+from tasks.task_4.presentation.app import lifespan
+
+
+@pytest.mark.anyio
+async def test_lifespan_configuration_error_does_not_open_client() -> None:
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock()
+
+    with (
+        patch("tasks.task_4.presentation.app.ClickHouseConfig", return_value=ClickHouseConfig()),
+        patch("tasks.task_4.presentation.app.ClickHouseClient", return_value=client),
+        patch("tasks.task_4.presentation.app.PhraseViewsConfig", side_effect=ConfigurationError("numpy is missing")),
+        pytest.raises(ConfigurationError),
+    ):
+        async with lifespan(FastAPI()):
+            pass
+
+    client.__aenter__.assert_not_awaited()
@@ -1,10 +1,20 @@
 """Tests for Task 4 repository."""
 
-from unittest.mock import AsyncMock
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from tasks.task_4.domain.entities import PhraseViews
+from tasks.task_4.domain.entities import PhraseViews, ViewsPeriod
+from tasks.task_4.infrastructure.clickhouse.queries import (
+    PHRASE_VIEWS_BY_HOUR,
+    PHRASE_VIEWS_BY_HOUR_AGGREGATED,
+    PHRASE_VIEWS_BY_HOUR_BATCH,
+    PHRASE_VIEWS_SAMPLES,
+    PHRASE_VIEWS_SAMPLES_BATCH,
+    PHRASE_VIEWS_SERIES,
+    PHRASE_VIEWS_SERIES_AGGREGATED,
+)
 from tasks.task_4.infrastructure.clickhouse.repository import QueryRepositoryImpl
 
 
@@ -41,10 +51,9 @@ async def test_get_phrase_views_by_hour(repository, mock_client):
     assert result[0].views_by_hour == [(12, 1), (13, 3), (14, 5)]
     assert result[1].phrase == "туфли"
 
-    # Verify query contains campaign_id
-    mock_client.fetch.assert_called_once()
-    call_args = mock_client.fetch.call_args
-    assert "campaign_id = 1111111" in call_args[0][0]
+    # Verify campaign_id is bound as a server-side parameter of the constant query
+    mock_client.fetch.assert_called_once_with(PHRASE_VIEWS_BY_HOUR.sql, params={"campaign_id": 1111111})
+    assert "{campaign_id:Int32}" in PHRASE_VIEWS_BY_HOUR.sql
 
 
 async def test_get_phrase_views_empty_result(repository, mock_client):
@@ -53,3 +62,133 @@ async def test_get_phrase_views_empty_result(repository, mock_client):
     result = await repository.get_phrase_views_by_hour(campaign_id=9999)
 
     assert len(result) == 0
+
+
+async def test_aggregated_source_queries_pre_aggregate(mock_client):
+    mock_client.fetch = AsyncMock(return_value=[])
+    repository = QueryRepositoryImpl(client=mock_client, source="aggregated")
+
+    await repository.get_phrase_views_by_hour(campaign_id=1111111)
+
+    mock_client.fetch.assert_called_once_with(PHRASE_VIEWS_BY_HOUR_AGGREGATED.sql, params={"campaign_id": 1111111})
+    assert "FROM phrases_views_hourly" in PHRASE_VIEWS_BY_HOUR_AGGREGATED.sql
+    assert "argMaxMerge(max_views)" in PHRASE_VIEWS_BY_HOUR_AGGREGATED.sql
+
+
+async def _rows(*rows):  # noqa: ANN002
+    for row in rows:
+        yield row
+
+
+async def test_stream_phrase_views_by_hour(repository, mock_client):
+    mock_client.iterate = MagicMock(
+        return_value=_rows(
+            {"phrase": "платье", "views_by_hour": [(12, 1)]},
+            {"phrase": "туфли", "views_by_hour": [(13, 2)]},
+        )
+    )
+
+    result = [pv.phrase async for pv in repository.stream_phrase_views_by_hour(1111111)]
+
+    assert result == ["платье", "туфли"]
+    mock_client.iterate.assert_called_once_with(PHRASE_VIEWS_BY_HOUR.sql, params={"campaign_id": 1111111})
+
+
+async def test_iterate_phrase_views_groups_rows_per_campaign(repository, mock_client):
+    mock_client.iterate = MagicMock(
+        return_value=_rows(
+            {"campaign_id": 1, "phrase": "платье", "views_by_hour": [(12, 1)]},
+            {"campaign_id": 1, "phrase": "туфли", "views_by_hour": [(13, 2)]},
+            {"campaign_id": 3, "phrase": "шапка", "views_by_hour": [(14, 3)]},
+        )
+    )
+
+    groups = [group async for group in repository.iterate_phrase_views_by_hour([1, 2, 3])]
+
+    assert [(campaign_id, [pv.phrase for pv in views]) for campaign_id, views in groups] == [
+        (1, ["платье", "туфли"]),
+        (3, ["шапка"]),
+    ]
+    mock_client.iterate.assert_called_once_with(PHRASE_VIEWS_BY_HOUR_BATCH.sql, params={"campaign_ids": [1, 2, 3]})
+    assert "campaign_id IN {campaign_ids:Array(Int32)}" in PHRASE_VIEWS_BY_HOUR_BATCH.sql
+
+
+async def test_iterate_phrase_views_empty_result(repository, mock_client):
+    mock_client.iterate = MagicMock(return_value=_rows())
+
+    assert [group async for group in repository.iterate_phrase_views_by_hour([1])] == []
+
+
+async def test_get_phrase_views_series(repository, mock_client):
+    bucket = datetime(2025, 1, 1, 12)  # noqa: DTZ001
+    mock_client.fetch = AsyncMock(return_value=[{"phrase": "платье", "views": [(bucket, 5)]}])
+    period = ViewsPeriod(date_from=date(2025, 1, 1), date_to=date(2025, 1, 3), granularity="day")
+
+    result = await repository.get_phrase_views_series(campaign_id=1111111, period=period)
+
+    assert result[0].views == [(bucket, 5)]
+    mock_client.fetch.assert_called_once_with(
+        PHRASE_VIEWS_SERIES["day"].sql,
+        params={"campaign_id": 1111111, "date_from": date(2025, 1, 1), "date_to": date(2025, 1, 3)},
+    )
+    assert "toStartOfDay(dt) as bucket" in PHRASE_VIEWS_SERIES["day"].sql
+    assert "toDate(dt) BETWEEN {date_from:Date} AND {date_to:Date}" in PHRASE_VIEWS_SERIES["day"].sql
+
+
+@pytest.mark.parametrize(
+    ("granularity", "expected"),
+    [("hour", PHRASE_VIEWS_SERIES_AGGREGATED["hour"]), ("minute", PHRASE_VIEWS_SERIES["minute"])],
+)
+async def test_aggregated_source_series_falls_back_to_raw_for_minutes(mock_client, granularity, expected):
+    mock_client.fetch = AsyncMock(return_value=[])
+    repository = QueryRepositoryImpl(client=mock_client, source="aggregated")
+    period = ViewsPeriod(date_from=date(2025, 1, 1), date_to=date(2025, 1, 1), granularity=granularity)
+
+    await repository.get_phrase_views_series(campaign_id=1, period=period)
+
+    assert mock_client.fetch.call_args.args == (expected.sql,)
+
+
+@pytest.fixture
+def numpy_repository(mock_client):
+    pytest.importorskip("numpy")
+    return QueryRepositoryImpl(client=mock_client, deltas="numpy")
+
+
+async def test_numpy_deltas_from_column_arrays(numpy_repository, mock_client):
+    mock_client.fetch = AsyncMock(
+        return_value=[
+            {
+                "campaign_ids": [7, 7, 7],
+                "phrases": ["платье", "платье", "туфли"],
+                "hours": [12, 13, 13],
+                "views": [1, 4, 2],
+            },
+        ]
+    )
+
+    result = await numpy_repository.get_phrase_views_by_hour(campaign_id=7)
+
+    assert [(pv.phrase, pv.views_by_hour) for pv in result] == [("платье", [(13, 3), (12, 1)]), ("туфли", [(13, 2)])]
+    mock_client.fetch.assert_called_once_with(PHRASE_VIEWS_SAMPLES.sql, params={"campaign_id": 7})
+    assert "groupArray(views) as views" in PHRASE_VIEWS_SAMPLES.sql
+
+
+async def test_numpy_deltas_batch(numpy_repository, mock_client):
+    mock_client.fetch = AsyncMock(
+        return_value=[{"campaign_ids": [3, 1], "phrases": ["шапка", "платье"], "hours": [9, 9], "views": [2, 1]}]
+    )
+
+    groups = [group async for group in numpy_repository.iterate_phrase_views_by_hour([1, 2, 3])]
+
+    assert [(campaign_id, [pv.phrase for pv in views]) for campaign_id, views in groups] == [
+        (1, ["платье"]),
+        (3, ["шапка"]),
+    ]
+    mock_client.fetch.assert_called_once_with(PHRASE_VIEWS_SAMPLES_BATCH.sql, params={"campaign_ids": [1, 2, 3]})
+
+
+async def test_numpy_deltas_empty_campaign(numpy_repository, mock_client):
+    mock_client.fetch = AsyncMock(return_value=[{"campaign_ids": [], "phrases": [], "hours": [], "views": []}])
+
+    assert await numpy_repository.get_phrase_views_by_hour(campaign_id=7) == []
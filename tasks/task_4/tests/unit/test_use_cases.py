@@ -1,10 +1,12 @@
 """Tests for Task 4 use cases."""
 
+from datetime import date
 from unittest.mock import AsyncMock
 
 import pytest
 
-from tasks.task_4.domain.entities import PhraseViews
+from shared.domain.entities.exceptions import ValidationError
+from tasks.task_4.domain.entities import PhraseViews, ViewsPeriod
 from tasks.task_4.domain.use_cases import GetPhraseViewsUseCase
 
 
@@ -46,3 +48,42 @@ async def test_execute_empty_result(use_case, mock_repository):
     result = await use_case.execute(campaign_id=9999)
 
     assert len(result) == 0
+
+
+async def test_execute_many_keeps_request_order_and_fills_missing(use_case, mock_repository):
+    async def iterate(campaign_ids):
+        assert campaign_ids == [3, 1, 2]
+        yield 1, [PhraseViews(phrase="платье", views_by_hour=[(12, 1)])]
+
+    mock_repository.iterate_phrase_views_by_hour = iterate
+
+    result = await use_case.execute_many([3, 1, 2, 1])
+
+    assert list(result) == [3, 1, 2]
+    assert result[3] == []
+    assert result[1][0].phrase == "платье"
+
+
+async def test_execute_range(use_case, mock_repository):
+    mock_repository.get_phrase_views_series = AsyncMock(return_value=[])
+    period = ViewsPeriod(date_from=date(2025, 1, 1), date_to=date(2025, 1, 7), granularity="minute")
+
+    assert await use_case.execute_range(1111111, period) == []
+
+    mock_repository.get_phrase_views_series.assert_called_once_with(1111111, period)
+
+
+@pytest.mark.parametrize(
+    ("date_to", "granularity", "error"),
+    [
+        (date(2024, 12, 31), "day", "is after"),
+        (date(2025, 1, 8), "minute", "at most 10080"),
+    ],
+)
+async def test_execute_range_rejects_invalid_period(use_case, mock_repository, date_to, granularity, error):
+    period = ViewsPeriod(date_from=date(2025, 1, 1), date_to=date_to, granularity=granularity)
+
+    with pytest.raises(ValidationError, match=error):
+        await use_case.execute_range(1111111, period)
+
+    mock_repository.get_phrase_views_series.assert_not_called()